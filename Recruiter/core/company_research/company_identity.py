@@ -0,0 +1,196 @@
+"""
+Company Identity for RecruitReach.
+
+This module resolves the different ways a company is written ("Google",
+"Google LLC", "google inc.") to one canonical company ID, using name
+normalization and a persistent index of known aliases and email domains.
+"""
+
+import os
+import re
+import threading
+import unicodedata
+from typing import Dict, Optional
+
+from Recruiter.utils.file_utils.file_store import read_json, write_json
+
+# Legal-form words removed from the end of company names
+LEGAL_SUFFIXES = frozenset({
+    "inc", "incorporated", "llc", "llp", "lp", "ltd", "limited", "corp",
+    "corporation", "co", "company", "plc", "pvt", "pte", "pty", "private",
+    "gmbh", "ag", "kg", "se", "sa", "sas", "sarl", "srl", "spa", "bv", "nv",
+    "oy", "ab", "asa", "kk"
+})
+
+# Email domains of mail providers, which say nothing about the employer
+FREE_MAIL_DOMAINS = frozenset({
+    "gmail", "googlemail", "yahoo", "ymail", "outlook", "hotmail", "live",
+    "msn", "icloud", "me", "mac", "aol", "proton", "protonmail", "gmx",
+    "mail", "yandex", "zoho", "qq", "163", "fastmail", "hey"
+})
+
+# Second-level labels of country domains such as co.uk or com.au
+_COUNTRY_SECOND_LEVELS = frozenset({"co", "com", "org", "net", "ac", "gov", "edu", "ne", "or"})
+
+_NON_WORD = re.compile(r"[\W_]+")
+_ABBREVIATION_DOTS = re.compile(r"(?<=\b[a-z])\.(?=[a-z]\b)")
+
+
+def normalize_company_name(company_name: str) -> str:
+    """
+    Normalize a company name so that variants of it compare equal.
+    
+    Accents and case are folded, '&' becomes 'and', punctuation is removed,
+    and a leading 'the' and trailing legal forms such as 'Inc.', 'LLC' or
+    'GmbH' are dropped unless nothing else would remain.
+    
+    Args:
+        company_name: Company name as entered or extracted.
+    
+    Returns:
+        Normalized name, for example 'google' for 'Google LLC'.
+    """
+    text = unicodedata.normalize("NFKD", company_name)
+    text = "".join(char for char in text if not unicodedata.combining(char)).casefold()
+    text = text.replace("&", " and ")
+    # Join dotted abbreviations such as L.L.C. or S.A. before removing punctuation
+    text = _ABBREVIATION_DOTS.sub("", text)
+    words = _NON_WORD.sub(" ", text).split()
+    
+    if len(words) > 1 and words[0] == "the":
+        words = words[1:]
+    while len(words) > 1 and (words[-1] in LEGAL_SUFFIXES or words[-1] == "and"):
+        words = words[:-1]
+    return " ".join(words)
+
+
+def email_domain(email: Optional[str]) -> Optional[str]:
+    """
+    Get the registrable domain of an email address.
+    
+    Args:
+        email: Email address, such as the recruiter's.
+    
+    Returns:
+        Domain without subdomains (e.g. 'google.com' for 'jane@careers.google.com'),
+        or None if there is no domain or it belongs to a mail provider.
+    """
+    if not email or "@" not in email:
+        return None
+    
+    labels = [label for label in email.rsplit("@", 1)[1].strip().lower().split(".") if label]
+    if len(labels) < 2:
+        return None
+    if len(labels) >= 3 and labels[-2] in _COUNTRY_SECOND_LEVELS and len(labels[-1]) == 2:
+        labels = labels[-3:]
+    else:
+        labels = labels[-2:]
+    
+    if labels[0] in FREE_MAIL_DOMAINS:
+        return None
+    return ".".join(labels)
+
+
+def domain_matches_name(domain: str, normalized_name: str) -> bool:
+    """
+    Check whether a domain plausibly belongs to a company name.
+    
+    Args:
+        domain: Registrable domain, such as 'google.com'.
+        normalized_name: Name normalized with normalize_company_name.
+    
+    Returns:
+        True if the domain name equals the name without spaces or one of
+        them starts with the other, as for 'meta.com' and 'meta platforms'.
+    """
+    label = domain.split(".")[0].replace("-", "")
+    compact = normalized_name.replace(" ", "")
+    if not label or not compact:
+        return False
+    if label == compact:
+        return True
+    return min(len(label), len(compact)) >= 3 and (compact.startswith(label) or label.startswith(compact))
+
+
+class CompanyAliasIndex:
+    """
+    Persistent index from company aliases and email domains to company IDs.
+    
+    The ID of a company is the normalized name it was first seen under.
+    Later names that normalize the same way resolve to that ID. An email
+    domain is linked to a company only when it matches the company name,
+    so recruiters at agencies do not merge their clients into one company.
+    """
+    
+    def __init__(self, index_path: str):
+        """
+        Initialize the alias index.
+        
+        Args:
+            index_path: Path of the JSON file holding the index.
+        """
+        self.index_path = index_path
+        self._lock = threading.Lock()
+        self._aliases: Optional[Dict[str, str]] = None
+        self._domains: Dict[str, str] = {}
+    
+    def resolve(self, company_name: str, recruiter_email: Optional[str] = None) -> Optional[str]:
+        """
+        Resolve a company to its canonical ID, recording new aliases.
+        
+        Args:
+            company_name: Name of the company.
+            recruiter_email: Email address of the recruiter, if known.
+        
+        Returns:
+            Canonical company ID, or None if neither the name nor the email
+            domain identifies a company.
+        """
+        name = normalize_company_name(company_name or "")
+        domain = email_domain(recruiter_email)
+        if not name and not domain:
+            return None
+        
+        with self._lock:
+            self._load()
+            company_id = self._aliases.get(name) if name else None
+            domain_id = self._domains.get(domain) if domain else None
+            
+            # The domain decides only when the name is new or its own ID and agrees with the domain
+            name_is_unlinked = company_id is None or company_id == name
+            if domain_id and name_is_unlinked and (not name or domain_matches_name(domain, name)):
+                company_id = domain_id
+            if company_id is None:
+                company_id = name or domain
+            
+            changed = False
+            if name and self._aliases.get(name) != company_id:
+                self._aliases[name] = company_id
+                changed = True
+            if domain and domain not in self._domains and domain_matches_name(domain, name or company_id):
+                self._domains[domain] = company_id
+                changed = True
+            if changed:
+                self._save()
+            return company_id
+    
+    def _load(self) -> None:
+        """Read the index file on first use. Caller holds the lock."""
+        if self._aliases is not None:
+            return
+        data = read_json(self.index_path)
+        try:
+            self._aliases = dict(data.get("aliases", {}))
+            self._domains = dict(data.get("domains", {}))
+        except (ValueError, TypeError, AttributeError):
+            self._aliases = {}
+            self._domains = {}
+    
+    def _save(self) -> None:
+        """Write the index file atomically. Caller holds the lock."""
+        directory = os.path.dirname(self.index_path) or "."
+        try:
+            os.makedirs(directory, exist_ok=True)
+            write_json(self.index_path, {"aliases": self._aliases, "domains": self._domains})
+        except OSError as e:
+            print(f"Error saving company aliases: {str(e)}")
@@ -6,19 +6,44 @@ information from job descriptions.
 """
 
 import os
-from typing import Optional, Dict, Any, Literal
+import re
+import asyncio
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+    TimeoutError as FuturesTimeoutError,
+    as_completed,
+    wait
+)
+from typing import Optional, Dict, Any, Awaitable, Callable, Literal
 
+from Recruiter.core.company_research.research_store import (
+    CompanyResearchStore,
+    get_company_research_store
+)
 from Recruiter.services.llm.llm_service import LLMService
+from Recruiter.services.llm.model_router import TASK_EXTRACTION, TASK_RESEARCH
+from Recruiter.services.llm.response_cache import get_response_cache
 from Recruiter.models.schemas import JobDetails
 from Recruiter.prompts.company_research_prompts import (
     COMPANY_RESEARCH_PROMPT,
-    JOB_DETAILS_EXTRACTION_PROMPT
+    JOB_DETAILS_EXTRACTION_LAYOUT
 )
+from Recruiter.utils.config.config_manager import ConfigManager
 from Recruiter.utils.web_search.search_utils import (
     get_company_info_bs4,
-    get_company_info_agent
+    get_company_info_agent,
+    aget_company_info_agent,
+    submit_company_info_agent
 )
 
+# Research sources in order of preference, with their headings in merged results
+RESEARCH_SOURCES = {
+    "agent": "Web search",
+    "bs4": "Web pages",
+    "llm": "General knowledge"
+}
+
 
 class CompanyResearcher:
     """
@@ -31,7 +56,8 @@ class CompanyResearcher:
     def __init__(
         self, 
         api_key: Optional[str] = None,
-        search_method: Literal["llm", "bs4", "agent"] = "agent"
+        search_method: Literal["llm", "bs4", "agent", "race", "ensemble"] = "agent",
+        research_store: Optional[CompanyResearchStore] = None
     ):
         """
         Initialize the company researcher.
@@ -42,47 +68,434 @@ class CompanyResearcher:
                 - "llm": Use LLM directly
                 - "bs4": Use BeautifulSoup and googlesearch
                 - "agent": Use Agent with WebSearchTool
+                - "race": Run all three concurrently and use the first good result
+                - "ensemble": Run all three concurrently and merge their results
+            research_store: Store for research results. Defaults to the shared
+                store configured in config.toml.
         """
-        self.llm_service = LLMService(api_key=api_key)
+        self.llm_service = LLMService.for_task(
+            TASK_EXTRACTION,
+            api_key=api_key,
+            cache=get_response_cache()
+        )
+        self.research_llm_service = LLMService.for_task(TASK_RESEARCH, api_key=api_key)
         self.api_key = api_key
         self.search_method = search_method
+        self.research_store = research_store or get_company_research_store()
+        
+        # Limits for the race and ensemble modes from the optional [company_research] section
+        settings = ConfigManager().get_section('company_research')
+        self.race_deadline_seconds = settings.get('race_deadline_seconds', 30)
+        self.ensemble_budget_seconds = settings.get('ensemble_budget_seconds', 45)
+        self.min_result_chars = settings.get('min_result_chars', 200)
     
-    def research_company(self, company_name: str) -> str:
+    def research_company(self, company_name: str, recruiter_email: Optional[str] = None) -> str:
         """
         Research a company and get information about it.
         
+        Results are kept in the company research store under the company's
+        canonical ID, so repeat companies are served without searching again
+        even when their name is written differently.
+        
+        Args:
+            company_name: Name of the company to research.
+            recruiter_email: Email address of the recruiter, used to identify
+                the company by its domain.
+            
+        Returns:
+            Information about the company.
+        """
+        try:
+            if self.research_store is None:
+                return self._research(company_name)
+            company_id = self.research_store.resolve_company(company_name, recruiter_email)
+            if company_id is None:
+                # Unidentified companies would all share one entry
+                return self._research(company_name)
+            return self.research_store.get_or_research(
+                company_id,
+                lambda: self._research(company_name)
+            )
+        except Exception as e:
+            print(f"Error researching company: {str(e)}")
+            return f"Unable to retrieve information about {company_name}. Please try again later."
+    
+    async def aresearch_company(self, company_name: str, recruiter_email: Optional[str] = None) -> str:
+        """
+        Research a company and get information about it asynchronously.
+        
         Args:
             company_name: Name of the company to research.
+            recruiter_email: Email address of the recruiter, used to identify
+                the company by its domain.
             
         Returns:
             Information about the company.
         """
         try:
-            # Use the selected search method
-            if self.search_method == "llm":
-                # Use LLM directly with prompt
-                prompt = COMPANY_RESEARCH_PROMPT.format(company_name=company_name)
-                company_info = self.llm_service.generate_text(prompt)
-            elif self.search_method == "bs4":
-                # Use BeautifulSoup and googlesearch
-                company_info = get_company_info_bs4(company_name)
-            elif self.search_method == "agent":
-                # Use Agent with WebSearchTool
-                company_info = get_company_info_agent(company_name, self.api_key)
-            else:
-                raise ValueError(f"Invalid search method: {self.search_method}")
-            
-            # If web search failed, fall back to LLM
-            if not company_info:
-                print(f"Web search failed for {company_name}, falling back to LLM")
-                prompt = COMPANY_RESEARCH_PROMPT.format(company_name=company_name)
-                company_info = self.llm_service.generate_text(prompt)
-                
-            return company_info
+            if self.research_store is None:
+                return await self._aresearch(company_name)
+            company_id = await asyncio.to_thread(self.research_store.resolve_company, company_name, recruiter_email)
+            if company_id is None:
+                # Unidentified companies would all share one entry
+                return await self._aresearch(company_name)
+            return await self.research_store.aget_or_research(
+                company_id,
+                lambda: self._aresearch(company_name)
+            )
         except Exception as e:
             print(f"Error researching company: {str(e)}")
             return f"Unable to retrieve information about {company_name}. Please try again later."
     
+    def invalidate_company(self, company_name: str, recruiter_email: Optional[str] = None) -> bool:
+        """
+        Forget the stored research for a company so it is researched again.
+        
+        Args:
+            company_name: Name of the company.
+            recruiter_email: Email address of the recruiter, used to identify
+                the company by its domain.
+            
+        Returns:
+            True if stored research was removed.
+        """
+        if self.research_store is None:
+            return False
+        company_id = self.research_store.resolve_company(company_name, recruiter_email)
+        if company_id is None:
+            return False
+        return self.research_store.invalidate(company_id)
+    
+    def _research(self, company_name: str) -> str:
+        """
+        Research a company with the selected search method.
+        
+        Args:
+            company_name: Name of the company to research.
+            
+        Returns:
+            Information about the company.
+            
+        Raises:
+            ValueError: If the search method is invalid.
+            RuntimeError: If no source returned a result in race or ensemble mode.
+        """
+        # Use the selected search method
+        if self.search_method == "race":
+            return self._race(company_name)
+        elif self.search_method == "ensemble":
+            return self._ensemble(company_name)
+        elif self.search_method == "llm":
+            # Use LLM directly with prompt
+            prompt = COMPANY_RESEARCH_PROMPT.format(company_name=company_name)
+            company_info = self.research_llm_service.generate_text(prompt)
+        elif self.search_method == "bs4":
+            # Use BeautifulSoup and googlesearch
+            company_info = get_company_info_bs4(company_name)
+        elif self.search_method == "agent":
+            # Use Agent with WebSearchTool
+            company_info = get_company_info_agent(company_name, self.api_key)
+        else:
+            raise ValueError(f"Invalid search method: {self.search_method}")
+        
+        # If web search failed, fall back to LLM
+        if not company_info:
+            print(f"Web search failed for {company_name}, falling back to LLM")
+            prompt = COMPANY_RESEARCH_PROMPT.format(company_name=company_name)
+            company_info = self.research_llm_service.generate_text(prompt)
+            
+        return company_info
+    
+    async def _aresearch(self, company_name: str) -> str:
+        """
+        Research a company with the selected search method asynchronously.
+        
+        Args:
+            company_name: Name of the company to research.
+            
+        Returns:
+            Information about the company.
+            
+        Raises:
+            ValueError: If the search method is invalid.
+            RuntimeError: If no source returned a result in race or ensemble mode.
+        """
+        # Use the selected search method
+        if self.search_method == "race":
+            return await self._arace(company_name)
+        elif self.search_method == "ensemble":
+            return await self._aensemble(company_name)
+        elif self.search_method == "llm":
+            # Use LLM directly with prompt
+            prompt = COMPANY_RESEARCH_PROMPT.format(company_name=company_name)
+            company_info = await self.research_llm_service.agenerate_text(prompt)
+        elif self.search_method == "bs4":
+            # Blocking scrape runs in a worker thread
+            company_info = await asyncio.to_thread(get_company_info_bs4, company_name)
+        elif self.search_method == "agent":
+            company_info = await aget_company_info_agent(company_name, self.api_key)
+        else:
+            raise ValueError(f"Invalid search method: {self.search_method}")
+        
+        # If web search failed, fall back to LLM
+        if not company_info:
+            print(f"Web search failed for {company_name}, falling back to LLM")
+            prompt = COMPANY_RESEARCH_PROMPT.format(company_name=company_name)
+            company_info = await self.research_llm_service.agenerate_text(prompt)
+            
+        return company_info
+    
+    def _submit_sources(self, company_name: str, executor: ThreadPoolExecutor) -> Dict[Future, str]:
+        """
+        Start all research sources for a company.
+        
+        The agent runs on the research agent's event loop, so cancelling its
+        future cancels the run. The page scrape and the LLM call run in
+        executor threads.
+        
+        Args:
+            company_name: Name of the company to research.
+            executor: Executor for the blocking sources.
+            
+        Returns:
+            Source names keyed by the future of each source.
+        """
+        prompt = COMPANY_RESEARCH_PROMPT.format(company_name=company_name)
+        return {
+            submit_company_info_agent(company_name, self.api_key): "agent",
+            executor.submit(get_company_info_bs4, company_name): "bs4",
+            executor.submit(self.research_llm_service.generate_text, prompt): "llm"
+        }
+    
+    def _asources(self, company_name: str) -> Dict[str, Callable[[], Awaitable[Optional[str]]]]:
+        """
+        Get the research sources for a company as coroutine functions.
+        
+        Args:
+            company_name: Name of the company to research.
+            
+        Returns:
+            Coroutine functions running each source, keyed by source name.
+        """
+        prompt = COMPANY_RESEARCH_PROMPT.format(company_name=company_name)
+        return {
+            "agent": lambda: aget_company_info_agent(company_name, self.api_key),
+            # Blocking scrape runs in a worker thread
+            "bs4": lambda: asyncio.to_thread(get_company_info_bs4, company_name),
+            "llm": lambda: self.research_llm_service.agenerate_text(prompt)
+        }
+    
+    def _race(self, company_name: str) -> str:
+        """
+        Run all sources concurrently and return the first good result.
+        
+        Sources still running when a good result arrives or the deadline
+        passes are cancelled. The agent run is cancelled on its event loop,
+        but a blocking HTTP request of the page scrape or the LLM call that
+        is already in progress cannot be interrupted; its thread finishes in
+        the background and the result is dropped.
+        
+        Args:
+            company_name: Name of the company to research.
+            
+        Returns:
+            The first result passing the quality check, or the longest result
+            if none passes before the deadline.
+            
+        Raises:
+            RuntimeError: If no source returned a result.
+        """
+        executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="research")
+        futures = self._submit_sources(company_name, executor)
+        fallback = None
+        try:
+            for future in as_completed(futures, timeout=self.race_deadline_seconds):
+                info = self._future_result(futures[future], future)
+                if self._is_good_result(company_name, info):
+                    return info
+                if info and len(info) > len(fallback or ""):
+                    fallback = info
+        except FuturesTimeoutError:
+            print(f"Research race for {company_name} reached its deadline")
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        if fallback:
+            return fallback
+        raise RuntimeError(f"No research source returned a result for {company_name}")
+    
+    async def _arace(self, company_name: str) -> str:
+        """
+        Run all sources concurrently and return the first good result asynchronously.
+        
+        Losing tasks are cancelled, which also cancels the agent run. The
+        page scrape runs in a worker thread whose HTTP request in progress
+        cannot be interrupted.
+        
+        Args:
+            company_name: Name of the company to research.
+            
+        Returns:
+            The first result passing the quality check, or the longest result
+            if none passes before the deadline.
+            
+        Raises:
+            RuntimeError: If no source returned a result.
+        """
+        tasks = {
+            asyncio.ensure_future(source()): name
+            for name, source in self._asources(company_name).items()
+        }
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.race_deadline_seconds
+        pending = set(tasks)
+        fallback = None
+        try:
+            while pending:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    print(f"Research race for {company_name} reached its deadline")
+                    break
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    info = self._future_result(tasks[task], task)
+                    if self._is_good_result(company_name, info):
+                        return info
+                    if info and len(info) > len(fallback or ""):
+                        fallback = info
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        if fallback:
+            return fallback
+        raise RuntimeError(f"No research source returned a result for {company_name}")
+    
+    def _ensemble(self, company_name: str) -> str:
+        """
+        Run all sources concurrently and merge the results within the time budget.
+        
+        Sources still running when the budget runs out are cancelled as in
+        the race mode.
+        
+        Args:
+            company_name: Name of the company to research.
+            
+        Returns:
+            Merged results of the sources that finished in time.
+            
+        Raises:
+            RuntimeError: If no source returned a result.
+        """
+        executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="research")
+        futures = self._submit_sources(company_name, executor)
+        try:
+            done, _ = wait(futures, timeout=self.ensemble_budget_seconds)
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        results = {futures[future]: self._future_result(futures[future], future) for future in done}
+        return self._merge_results(company_name, results)
+    
+    async def _aensemble(self, company_name: str) -> str:
+        """
+        Run all sources concurrently and merge the results within the time budget asynchronously.
+        
+        Args:
+            company_name: Name of the company to research.
+            
+        Returns:
+            Merged results of the sources that finished in time.
+            
+        Raises:
+            RuntimeError: If no source returned a result.
+        """
+        tasks = {
+            asyncio.ensure_future(source()): name
+            for name, source in self._asources(company_name).items()
+        }
+        done, pending = await asyncio.wait(tasks, timeout=self.ensemble_budget_seconds)
+        for task in pending:
+            task.cancel()
+        
+        results = {tasks[task]: self._future_result(tasks[task], task) for task in done}
+        return self._merge_results(company_name, results)
+    
+    def _merge_results(self, company_name: str, results: Dict[str, Optional[str]]) -> str:
+        """
+        Merge source results under headings, dropping repeated paragraphs.
+        
+        Args:
+            company_name: Name of the company.
+            results: Result of each finished source.
+            
+        Returns:
+            Merged results in source order. Only results passing the quality
+            check are used, unless none passes.
+            
+        Raises:
+            RuntimeError: If no source returned a result.
+        """
+        usable = {name: info for name, info in results.items() if info}
+        good = {name: info for name, info in usable.items() if self._is_good_result(company_name, info)}
+        usable = good or usable
+        if not usable:
+            raise RuntimeError(f"No research source returned a result for {company_name}")
+        
+        seen = set()
+        sections = []
+        for name, heading in RESEARCH_SOURCES.items():
+            if name not in usable:
+                continue
+            paragraphs = []
+            for paragraph in re.split(r"\n\s*\n", usable[name]):
+                key = " ".join(paragraph.split()).casefold()
+                if key and key not in seen:
+                    seen.add(key)
+                    paragraphs.append(paragraph.strip())
+            if paragraphs:
+                sections.append(f"## {heading}\n\n" + "\n\n".join(paragraphs))
+        return "\n\n".join(sections)
+    
+    def _is_good_result(self, company_name: str, info: Optional[str]) -> bool:
+        """
+        Check whether a research result is usable on its own.
+        
+        Args:
+            company_name: Name of the company.
+            info: Research result.
+            
+        Returns:
+            True if the result is long enough and mentions the company.
+        """
+        if not info or len(info.strip()) < self.min_result_chars:
+            return False
+        # The longest word of the name is the least likely to be generic
+        words = re.findall(r"\w+", company_name.casefold())
+        return not words or max(words, key=len) in info.casefold()
+    
+    @staticmethod
+    def _future_result(source: str, future: Future) -> Optional[str]:
+        """
+        Get the result of a finished source, logging its error if it failed.
+        
+        Args:
+            source: Name of the source.
+            future: Finished future or task of the source.
+            
+        Returns:
+            The source result, or None if it failed.
+        """
+        try:
+            return future.result()
+        except Exception as e:
+            print(f"Error researching company with {source}: {str(e)}")
+            return None
+    
     def extract_details_from_job_description(self, job_description: str) -> JobDetails:
         """
         Extract details from a job description.
@@ -93,17 +506,46 @@ class CompanyResearcher:
         Returns:
             JobDetails object containing extracted information.
         """
-        # Use the prompt for extracting details
-        prompt = JOB_DETAILS_EXTRACTION_PROMPT
+        # Use the layout for extracting details
+        layout = JOB_DETAILS_EXTRACTION_LAYOUT
         
         try:
             # Generate extracted details
             result = self.llm_service.generate_with_template(
-                template=prompt,
+                template=layout.system_template,
+                human_template=layout.human_template(),
+                input_variables={"job_description": job_description},
+                output_schema=JobDetails
+            )
+            return result
+        except Exception as e:
+            print(f"Error extracting details from job description: {str(e)}")
+            # All fields are required, so fall back to blank values
+            return JobDetails(company_name="", recruiter_email="", job_position="")
+    
+    async def aextract_details_from_job_description(self, job_description: str) -> JobDetails:
+        """
+        Extract details from a job description asynchronously.
+        
+        Args:
+            job_description: Job description text.
+            
+        Returns:
+            JobDetails object containing extracted information.
+        """
+        # Use the layout for extracting details
+        layout = JOB_DETAILS_EXTRACTION_LAYOUT
+        
+        try:
+            # Generate extracted details
+            result = await self.llm_service.agenerate_with_template(
+                template=layout.system_template,
+                human_template=layout.human_template(),
                 input_variables={"job_description": job_description},
                 output_schema=JobDetails
             )
             return result
         except Exception as e:
             print(f"Error extracting details from job description: {str(e)}")
-            return JobDetails()
+            # All fields are required, so fall back to blank values
+            return JobDetails(company_name="", recruiter_email="", job_position="")
@@ -0,0 +1,307 @@
+"""
+Company Research Store for RecruitReach.
+
+This module provides a persistent store of company research results keyed
+by canonical company ID, so variants of a company name share one entry.
+Fresh entries are served directly, stale entries are served immediately
+while they are refreshed in the background.
+"""
+
+import os
+import time
+import asyncio
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from Recruiter.core.company_research.company_identity import CompanyAliasIndex, normalize_company_name
+from Recruiter.utils.config.config_manager import ConfigManager
+from Recruiter.utils.file_utils.file_store import entry_paths, evict_entries, read_json, remove_file, write_json
+from Recruiter.utils.file_utils.path_manager import PathManager
+
+
+class CompanyResearchStore:
+    """
+    On-disk store of company research results.
+    
+    Entries younger than the TTL are fresh. Entries older than the TTL but
+    younger than max_stale_seconds are returned as they are and refreshed
+    once in the background; older entries are researched again before
+    returning.
+    """
+    
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        ttl_seconds: float = 7 * 24 * 60 * 60,
+        max_stale_seconds: float = 30 * 24 * 60 * 60,
+        max_entries: int = 500,
+        alias_index: Optional[CompanyAliasIndex] = None
+    ):
+        """
+        Initialize the research store.
+        
+        Args:
+            cache_dir: Directory for store files. Defaults to 'data/cache/company_research'.
+            ttl_seconds: Age in seconds after which an entry is refreshed.
+            max_stale_seconds: Age in seconds after which an entry is no longer served.
+            max_entries: Maximum number of entries kept on disk.
+            alias_index: Index resolving company names to canonical IDs.
+                Defaults to an index in the 'aliases' subdirectory of cache_dir.
+        """
+        self.cache_dir = cache_dir or PathManager().get_cache_dir('company_research')
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.max_stale_seconds = max(max_stale_seconds, ttl_seconds)
+        self.max_entries = max_entries
+        self.alias_index = alias_index or CompanyAliasIndex(os.path.join(self.cache_dir, 'aliases', 'index.json'))
+        self._lock = threading.Lock()
+        self._refreshing: Set[str] = set()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._tasks: Set[asyncio.Task] = set()
+    
+    @staticmethod
+    def normalize_name(company_name: str) -> str:
+        """
+        Normalize a company name for use as a store key.
+        
+        Args:
+            company_name: Company name as entered or extracted.
+        
+        Returns:
+            Name normalized with normalize_company_name.
+        """
+        return normalize_company_name(company_name)
+    
+    def resolve_company(self, company_name: str, recruiter_email: Optional[str] = None) -> Optional[str]:
+        """
+        Resolve a company to the canonical ID its research is stored under.
+        
+        Args:
+            company_name: Name of the company.
+            recruiter_email: Email address of the recruiter, whose domain
+                identifies the company when it matches the name.
+        
+        Returns:
+            Canonical company ID, or None if the company cannot be identified.
+        """
+        return self.alias_index.resolve(company_name, recruiter_email)
+    
+    def get(self, company_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up the stored research for a company.
+        
+        Args:
+            company_name: Name of the company.
+        
+        Returns:
+            Entry with 'company_name', 'info', 'created_at' and 'stale' keys,
+            or None if there is no entry that may still be served.
+        """
+        entry = read_json(self._entry_path(company_name))
+        if not isinstance(entry, dict):
+            return None
+        
+        age = time.time() - entry.get("created_at", 0)
+        if age > self.max_stale_seconds:
+            return None
+        entry["stale"] = age > self.ttl_seconds
+        return entry
+    
+    def set(self, company_name: str, info: str) -> None:
+        """
+        Store research for a company.
+        
+        Args:
+            company_name: Name of the company.
+            info: Research result.
+        """
+        entry = {
+            "company_name": company_name,
+            "key": self.normalize_name(company_name),
+            "info": info,
+            "created_at": time.time()
+        }
+        
+        with self._lock:
+            write_json(self._entry_path(company_name), entry)
+            # Entries too old to serve go first, then the oldest beyond max_entries
+            evict_entries(self._entry_paths(), self.max_entries, self.max_stale_seconds)
+    
+    def invalidate(self, company_name: str) -> bool:
+        """
+        Remove the stored research for a company.
+        
+        Args:
+            company_name: Name of the company.
+        
+        Returns:
+            True if an entry was removed.
+        """
+        path = self._entry_path(company_name)
+        with self._lock:
+            exists = os.path.exists(path)
+            remove_file(path)
+        return exists
+    
+    def clear(self) -> None:
+        """Remove every stored entry."""
+        with self._lock:
+            for path in self._entry_paths():
+                remove_file(path)
+    
+    def get_or_research(self, company_name: str, research: Callable[[], Optional[str]]) -> Optional[str]:
+        """
+        Get research for a company, running it only when needed.
+        
+        Args:
+            company_name: Name of the company.
+            research: Function that researches the company and returns the
+                result, or None if research failed.
+        
+        Returns:
+            The stored or new research result, or None if research failed.
+            Research for an empty company name is never stored.
+        """
+        if not self.normalize_name(company_name):
+            return research()
+        
+        entry = self.get(company_name)
+        if entry is not None:
+            if entry["stale"] and self._start_refresh(company_name):
+                self._get_executor().submit(self._refresh, company_name, research)
+            return entry["info"]
+        
+        info = research()
+        if info:
+            self._store(company_name, info)
+        return info
+    
+    async def aget_or_research(
+        self,
+        company_name: str,
+        research: Callable[[], Awaitable[Optional[str]]]
+    ) -> Optional[str]:
+        """
+        Get research for a company asynchronously, running it only when needed.
+        
+        Stale entries are refreshed in a task on the running event loop.
+        
+        Args:
+            company_name: Name of the company.
+            research: Coroutine function that researches the company and
+                returns the result, or None if research failed.
+        
+        Returns:
+            The stored or new research result, or None if research failed.
+            Research for an empty company name is never stored.
+        """
+        if not self.normalize_name(company_name):
+            return await research()
+        
+        entry = await asyncio.to_thread(self.get, company_name)
+        if entry is not None:
+            if entry["stale"] and self._start_refresh(company_name):
+                task = asyncio.create_task(self._arefresh(company_name, research))
+                # Keep a reference so the task is not garbage collected
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+            return entry["info"]
+        
+        info = await research()
+        if info:
+            await asyncio.to_thread(self._store, company_name, info)
+        return info
+    
+    def _refresh(self, company_name: str, research: Callable[[], Optional[str]]) -> None:
+        """Research a stale company again in a background thread."""
+        try:
+            info = research()
+            if info:
+                self._store(company_name, info)
+        except Exception as e:
+            print(f"Error refreshing company research: {str(e)}")
+        finally:
+            self._finish_refresh(company_name)
+    
+    async def _arefresh(
+        self,
+        company_name: str,
+        research: Callable[[], Awaitable[Optional[str]]]
+    ) -> None:
+        """Research a stale company again in a background task."""
+        try:
+            info = await research()
+            if info:
+                await asyncio.to_thread(self._store, company_name, info)
+        except Exception as e:
+            print(f"Error refreshing company research: {str(e)}")
+        finally:
+            self._finish_refresh(company_name)
+    
+    def _store(self, company_name: str, info: str) -> None:
+        """Store research, logging instead of raising on write errors."""
+        try:
+            self.set(company_name, info)
+        except OSError as e:
+            print(f"Error storing company research: {str(e)}")
+    
+    def _start_refresh(self, company_name: str) -> bool:
+        """Claim the refresh of a company; False if one is already running."""
+        key = self.normalize_name(company_name)
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+    
+    def _finish_refresh(self, company_name: str) -> None:
+        """Release the refresh of a company."""
+        with self._lock:
+            self._refreshing.discard(self.normalize_name(company_name))
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the executor for background refreshes, creating it on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="research-refresh")
+            return self._executor
+    
+    def _entry_path(self, company_name: str) -> str:
+        """Get the file path for a company."""
+        key = hashlib.sha256(self.normalize_name(company_name).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def _entry_paths(self) -> List[str]:
+        """List the file paths of all entries."""
+        return entry_paths(self.cache_dir, '.json')
+
+
+_default_store: Optional[CompanyResearchStore] = None
+_default_store_lock = threading.Lock()
+
+
+def get_company_research_store() -> Optional[CompanyResearchStore]:
+    """
+    Get the shared company research store configured in config.toml.
+    
+    The store is configured by the optional [company_research] section with
+    the keys 'enabled', 'ttl_seconds', 'max_stale_seconds' and 'max_entries'.
+    
+    Returns:
+        The shared CompanyResearchStore instance, or None if it is disabled.
+    """
+    global _default_store
+    
+    with _default_store_lock:
+        if _default_store is None:
+            settings = ConfigManager().get_section('company_research')
+            if not settings.get('enabled', True):
+                return None
+            _default_store = CompanyResearchStore(
+                ttl_seconds=settings.get('ttl_seconds', 7 * 24 * 60 * 60),
+                max_stale_seconds=settings.get('max_stale_seconds', 30 * 24 * 60 * 60),
+                max_entries=settings.get('max_entries', 500)
+            )
+        return _default_store
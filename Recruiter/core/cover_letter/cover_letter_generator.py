@@ -5,13 +5,17 @@ This module provides functionality for generating personalized cover letters
 for job applications.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional, Tuple, Union
 
+from Recruiter.core.resume.resume_formatter import format_resume_input
 from Recruiter.services.llm.llm_service import LLMService
-from Recruiter.models.schemas import CoverLetterContent
+from Recruiter.services.llm.model_router import TASK_COVER_LETTER, TASK_REGENERATION
+from Recruiter.services.llm.response_cache import get_response_cache
+from Recruiter.utils.text.prompt_compactor import compact_text, get_token_budgets
+from Recruiter.models.schemas import CoverLetterContent, CoverLetterRevision, ParsedResume
 from Recruiter.prompts.cover_letter_prompts import (
-    COVER_LETTER_GENERATION_PROMPT,
-    COVER_LETTER_FEEDBACK_PROMPT
+    COVER_LETTER_GENERATION_LAYOUT,
+    COVER_LETTER_REVISION_LAYOUT
 )
 
 
@@ -30,13 +34,24 @@ class CoverLetterGenerator:
         Args:
             api_key: OpenAI API key. If not provided, will try to get from config.
         """
-        self.llm_service = LLMService(api_key=api_key)
+        self.llm_service = LLMService.for_task(
+            TASK_COVER_LETTER,
+            api_key=api_key,
+            cache=get_response_cache(),
+            component="cover_letter"
+        )
+        self.regeneration_llm_service = LLMService.for_task(
+            TASK_REGENERATION,
+            api_key=api_key,
+            cache=get_response_cache(),
+            component="cover_letter_regeneration"
+        )
     
     def generate_cover_letter(
         self,
         job_description: str,
         company_info: str,
-        resume: str,
+        resume: Union[str, ParsedResume],
         job_position: str,
         company_name: str,
         feedback: Optional[str] = None
@@ -47,7 +62,7 @@ class CoverLetterGenerator:
         Args:
             job_description: Job description text.
             company_info: Information about the company.
-            resume: Resume text.
+            resume: Resume text or structured resume.
             job_position: Position being applied for.
             company_name: Name of the company.
             feedback: Optional feedback for regeneration.
@@ -55,27 +70,55 @@ class CoverLetterGenerator:
         Returns:
             CoverLetterContent object containing the generated cover letter.
         """
-        # Get the base prompt for cover letter generation
-        base_prompt = COVER_LETTER_GENERATION_PROMPT
+        template, human_template, input_variables = self._build_request(
+            job_description, company_info, resume, job_position, company_name, feedback
+        )
         
-        # Add feedback to prompt if provided
-        if feedback:
-            feedback_section = COVER_LETTER_FEEDBACK_PROMPT.format(feedback=feedback)
-            base_prompt += feedback_section
+        try:
+            # Generate cover letter content
+            result = self._get_llm_service(feedback).generate_with_template(
+                template=template,
+                human_template=human_template,
+                input_variables=input_variables,
+                output_schema=CoverLetterContent
+            )
+            return result
+        except Exception as e:
+            print(f"Error generating cover letter: {str(e)}")
+            raise
+    
+    async def agenerate_cover_letter(
+        self,
+        job_description: str,
+        company_info: str,
+        resume: Union[str, ParsedResume],
+        job_position: str,
+        company_name: str,
+        feedback: Optional[str] = None
+    ) -> CoverLetterContent:
+        """
+        Generate a personalized cover letter for a job application asynchronously.
         
-        # Create input variables for the template
-        input_variables = {
-            "resume_data": resume,
-            "job_description": job_description,
-            "company_info": company_info,
-            "position": job_position,
-            "company_name": company_name
-        }
+        Args:
+            job_description: Job description text.
+            company_info: Information about the company.
+            resume: Resume text or structured resume.
+            job_position: Position being applied for.
+            company_name: Name of the company.
+            feedback: Optional feedback for regeneration.
+            
+        Returns:
+            CoverLetterContent object containing the generated cover letter.
+        """
+        template, human_template, input_variables = self._build_request(
+            job_description, company_info, resume, job_position, company_name, feedback
+        )
         
         try:
             # Generate cover letter content
-            result = self.llm_service.generate_with_template(
-                template=base_prompt,
+            result = await self._get_llm_service(feedback).agenerate_with_template(
+                template=template,
+                human_template=human_template,
                 input_variables=input_variables,
                 output_schema=CoverLetterContent
             )
@@ -83,3 +126,184 @@ class CoverLetterGenerator:
         except Exception as e:
             print(f"Error generating cover letter: {str(e)}")
             raise
+    
+    def stream_cover_letter(
+        self,
+        job_description: str,
+        company_info: str,
+        resume: Union[str, ParsedResume],
+        job_position: str,
+        company_name: str,
+        feedback: Optional[str] = None
+    ) -> Iterator[Dict[str, str]]:
+        """
+        Stream a personalized cover letter as it is generated.
+        
+        Snapshots fill in the plain text content first, then the HTML content.
+        
+        Args:
+            job_description: Job description text.
+            company_info: Information about the company.
+            resume: Resume text or structured resume.
+            job_position: Position being applied for.
+            company_name: Name of the company.
+            feedback: Optional feedback for regeneration.
+        
+        Yields:
+            Partial dictionaries with content_text and content_html keys.
+        """
+        template, human_template, input_variables = self._build_request(
+            job_description, company_info, resume, job_position, company_name, feedback
+        )
+        
+        try:
+            yield from self._get_llm_service(feedback).stream_with_template(
+                template=template,
+                human_template=human_template,
+                input_variables=input_variables,
+                output_schema=CoverLetterContent
+            )
+        except Exception as e:
+            print(f"Error generating cover letter: {str(e)}")
+            raise
+    
+    def revise_cover_letter(self, previous: CoverLetterContent, feedback: str) -> CoverLetterContent:
+        """
+        Revise a generated cover letter with feedback.
+        
+        Only the previous output and the feedback are sent, not the job
+        description, resume and company information, so the request stays
+        small. The model returns only the fields it changes.
+        
+        Args:
+            previous: The cover letter to revise.
+            feedback: Changes requested by the user.
+            
+        Returns:
+            CoverLetterContent object containing the revised cover letter.
+        """
+        try:
+            revision = self.regeneration_llm_service.generate_with_template(
+                template=COVER_LETTER_REVISION_LAYOUT.system_template,
+                input_variables=self._build_revision_input(previous, feedback),
+                output_schema=CoverLetterRevision,
+                human_template=COVER_LETTER_REVISION_LAYOUT.human_template()
+            )
+            return self._apply_revision(previous, revision)
+        except Exception as e:
+            print(f"Error revising cover letter: {str(e)}")
+            raise
+    
+    async def arevise_cover_letter(self, previous: CoverLetterContent, feedback: str) -> CoverLetterContent:
+        """
+        Revise a generated cover letter with feedback asynchronously.
+        
+        Args:
+            previous: The cover letter to revise.
+            feedback: Changes requested by the user.
+            
+        Returns:
+            CoverLetterContent object containing the revised cover letter.
+        """
+        try:
+            revision = await self.regeneration_llm_service.agenerate_with_template(
+                template=COVER_LETTER_REVISION_LAYOUT.system_template,
+                input_variables=self._build_revision_input(previous, feedback),
+                output_schema=CoverLetterRevision,
+                human_template=COVER_LETTER_REVISION_LAYOUT.human_template()
+            )
+            return self._apply_revision(previous, revision)
+        except Exception as e:
+            print(f"Error revising cover letter: {str(e)}")
+            raise
+    
+    def _get_llm_service(self, feedback: Optional[str]) -> LLMService:
+        """
+        Get the service for a request, routing regeneration with feedback separately.
+        
+        Args:
+            feedback: Optional feedback for regeneration.
+            
+        Returns:
+            The LLMService to use.
+        """
+        return self.regeneration_llm_service if feedback else self.llm_service
+    
+    def _build_revision_input(self, previous: CoverLetterContent, feedback: str) -> Dict[str, Any]:
+        """
+        Build the input variables for a revision request.
+        
+        Args:
+            previous: The cover letter to revise.
+            feedback: Changes requested by the user.
+            
+        Returns:
+            Input variables for the revision request template.
+        """
+        return {
+            "draft": previous.model_dump_json(indent=2),
+            "feedback": feedback
+        }
+    
+    def _apply_revision(self, previous: CoverLetterContent, revision: CoverLetterRevision) -> CoverLetterContent:
+        """
+        Merge the changed fields of a revision into the previous cover letter.
+        
+        Args:
+            previous: The cover letter that was revised.
+            revision: Fields returned by the revision request.
+            
+        Returns:
+            CoverLetterContent object containing the revised cover letter.
+        """
+        changes = {
+            field: value for field, value in revision.model_dump().items()
+            if value
+        }
+        return previous.model_copy(update=changes)
+    
+    def _build_request(
+        self,
+        job_description: str,
+        company_info: str,
+        resume: Union[str, ParsedResume],
+        job_position: str,
+        company_name: str,
+        feedback: Optional[str] = None
+    ) -> Tuple[str, str, Dict[str, Any]]:
+        """
+        Build the prompt templates and input variables for a cover letter.
+        
+        Args:
+            job_description: Job description text.
+            company_info: Information about the company.
+            resume: Resume text or structured resume.
+            job_position: Position being applied for.
+            company_name: Name of the company.
+            feedback: Optional feedback for regeneration.
+            
+        Returns:
+            Tuple of the system template, the human template and their
+            input variables.
+        """
+        # Create input variables for the template
+        budgets = get_token_budgets()
+        resume_text, resume_highlights = format_resume_input(resume, job_description, budgets["resume"])
+        input_variables = {
+            "resume_data": resume_text,
+            "resume_highlights": resume_highlights,
+            "job_description": compact_text(job_description, budgets["job_description"]),
+            "company_info": compact_text(company_info, budgets["company_info"]),
+            "position": job_position,
+            "company_name": company_name,
+            "feedback": feedback or ""
+        }
+        
+        # Static instructions and the resume first, per-job inputs last;
+        # feedback is only sent when given
+        COVER_LETTER_GENERATION_LAYOUT.check_cacheable(input_variables)
+        return (
+            COVER_LETTER_GENERATION_LAYOUT.system_template,
+            COVER_LETTER_GENERATION_LAYOUT.human_template(input_variables),
+            input_variables
+        )
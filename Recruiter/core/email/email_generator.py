@@ -5,13 +5,17 @@ This module provides functionality for generating personalized emails
 for job applications.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
 
+from Recruiter.core.resume.resume_formatter import format_resume_input
 from Recruiter.services.llm.llm_service import LLMService
-from Recruiter.models.schemas import EmailContent
+from Recruiter.services.llm.model_router import TASK_EMAIL, TASK_REGENERATION
+from Recruiter.services.llm.response_cache import get_response_cache
+from Recruiter.utils.text.prompt_compactor import compact_text, get_token_budgets
+from Recruiter.models.schemas import EmailContent, EmailRevision, ParsedResume
 from Recruiter.prompts.email_prompts import (
-    EMAIL_GENERATION_PROMPT,
-    EMAIL_FEEDBACK_PROMPT
+    EMAIL_GENERATION_LAYOUT,
+    EMAIL_REVISION_LAYOUT
 )
 
 
@@ -30,13 +34,24 @@ class EmailGenerator:
         Args:
             api_key: OpenAI API key. If not provided, will try to get from config.
         """
-        self.llm_service = LLMService(api_key=api_key)
+        self.llm_service = LLMService.for_task(
+            TASK_EMAIL,
+            api_key=api_key,
+            cache=get_response_cache(),
+            component="email"
+        )
+        self.regeneration_llm_service = LLMService.for_task(
+            TASK_REGENERATION,
+            api_key=api_key,
+            cache=get_response_cache(),
+            component="email_regeneration"
+        )
     
     def generate_email(
         self,
         job_description: str,
         company_info: str,
-        resume: str,
+        resume: Union[str, ParsedResume],
         recruiter_email: str,
         job_position: str,
         job_source: str,
@@ -49,7 +64,7 @@ class EmailGenerator:
         Args:
             job_description: Job description text.
             company_info: Information about the company.
-            resume: Resume text.
+            resume: Resume text or structured resume.
             recruiter_email: Email address of the recruiter.
             job_position: Position being applied for.
             job_source: Source of the job posting.
@@ -59,29 +74,61 @@ class EmailGenerator:
         Returns:
             EmailContent object containing the generated email.
         """
-        # Get the base prompt for email generation
-        base_prompt = EMAIL_GENERATION_PROMPT
+        template, human_template, input_variables = self._build_request(
+            job_description, company_info, resume, recruiter_email,
+            job_position, job_source, company_name, feedback
+        )
         
-        # Add feedback to prompt if provided
-        if feedback:
-            feedback_section = EMAIL_FEEDBACK_PROMPT.format(feedback=feedback)
-            base_prompt += feedback_section
+        try:
+            # Generate email content
+            result = self._get_llm_service(feedback).generate_with_template(
+                template=template,
+                human_template=human_template,
+                input_variables=input_variables,
+                output_schema=EmailContent
+            )
+            return result
+        except Exception as e:
+            print(f"Error generating email: {str(e)}")
+            raise
+    
+    async def agenerate_email(
+        self,
+        job_description: str,
+        company_info: str,
+        resume: Union[str, ParsedResume],
+        recruiter_email: str,
+        job_position: str,
+        job_source: str,
+        company_name: str,
+        feedback: Optional[str] = None
+    ) -> EmailContent:
+        """
+        Generate a personalized email for a job application asynchronously.
         
-        # Create input variables for the template
-        input_variables = {
-            "company_name": company_name,
-            "recruiter_email": recruiter_email,
-            "job_position": job_position,
-            "job_source": job_source,
-            "resume_details": resume,
-            "job_description": job_description,
-            "company_overview": company_info
-        }
+        Args:
+            job_description: Job description text.
+            company_info: Information about the company.
+            resume: Resume text or structured resume.
+            recruiter_email: Email address of the recruiter.
+            job_position: Position being applied for.
+            job_source: Source of the job posting.
+            company_name: Name of the company.
+            feedback: Optional feedback for regeneration.
+            
+        Returns:
+            EmailContent object containing the generated email.
+        """
+        template, human_template, input_variables = self._build_request(
+            job_description, company_info, resume, recruiter_email,
+            job_position, job_source, company_name, feedback
+        )
         
         try:
             # Generate email content
-            result = self.llm_service.generate_with_template(
-                template=base_prompt,
+            result = await self._get_llm_service(feedback).agenerate_with_template(
+                template=template,
+                human_template=human_template,
                 input_variables=input_variables,
                 output_schema=EmailContent
             )
@@ -89,3 +136,246 @@ class EmailGenerator:
         except Exception as e:
             print(f"Error generating email: {str(e)}")
             raise
+    
+    def stream_email(
+        self,
+        job_description: str,
+        company_info: str,
+        resume: Union[str, ParsedResume],
+        recruiter_email: str,
+        job_position: str,
+        job_source: str,
+        company_name: str,
+        feedback: Optional[str] = None
+    ) -> Iterator[Dict[str, str]]:
+        """
+        Stream a personalized email as it is generated.
+        
+        Snapshots fill in the subject first, then the plain text body and
+        finally the HTML body.
+        
+        Args:
+            job_description: Job description text.
+            company_info: Information about the company.
+            resume: Resume text or structured resume.
+            recruiter_email: Email address of the recruiter.
+            job_position: Position being applied for.
+            job_source: Source of the job posting.
+            company_name: Name of the company.
+            feedback: Optional feedback for regeneration.
+        
+        Yields:
+            Partial dictionaries with subject, body_text and body_html keys.
+        """
+        template, human_template, input_variables = self._build_request(
+            job_description, company_info, resume, recruiter_email,
+            job_position, job_source, company_name, feedback
+        )
+        
+        try:
+            yield from self._get_llm_service(feedback).stream_with_template(
+                template=template,
+                human_template=human_template,
+                input_variables=input_variables,
+                output_schema=EmailContent
+            )
+        except Exception as e:
+            print(f"Error generating email: {str(e)}")
+            raise
+    
+    def revise_email(self, previous: EmailContent, feedback: str) -> EmailContent:
+        """
+        Revise a generated email with feedback.
+        
+        Only the previous output and the feedback are sent, not the job
+        description, resume and company information, so the request stays
+        small. The model returns only the fields it changes.
+        
+        Args:
+            previous: The email to revise.
+            feedback: Changes requested by the user.
+            
+        Returns:
+            EmailContent object containing the revised email.
+        """
+        try:
+            revision = self.regeneration_llm_service.generate_with_template(
+                template=EMAIL_REVISION_LAYOUT.system_template,
+                input_variables=self._build_revision_input(previous, feedback),
+                output_schema=EmailRevision,
+                human_template=EMAIL_REVISION_LAYOUT.human_template()
+            )
+            return self._apply_revision(previous, revision)
+        except Exception as e:
+            print(f"Error revising email: {str(e)}")
+            raise
+    
+    async def arevise_email(self, previous: EmailContent, feedback: str) -> EmailContent:
+        """
+        Revise a generated email with feedback asynchronously.
+        
+        Args:
+            previous: The email to revise.
+            feedback: Changes requested by the user.
+            
+        Returns:
+            EmailContent object containing the revised email.
+        """
+        try:
+            revision = await self.regeneration_llm_service.agenerate_with_template(
+                template=EMAIL_REVISION_LAYOUT.system_template,
+                input_variables=self._build_revision_input(previous, feedback),
+                output_schema=EmailRevision,
+                human_template=EMAIL_REVISION_LAYOUT.human_template()
+            )
+            return self._apply_revision(previous, revision)
+        except Exception as e:
+            print(f"Error revising email: {str(e)}")
+            raise
+    
+    def generate_emails_batch(
+        self,
+        jobs: List[Dict[str, Any]],
+        max_concurrency: int = 5
+    ) -> List[Union[EmailContent, Exception]]:
+        """
+        Generate personalized emails for many job applications.
+        
+        Args:
+            jobs: Job records, each a dictionary of generate_email arguments
+                (job_description, company_info, resume, recruiter_email,
+                job_position, job_source, company_name and optional feedback).
+            max_concurrency: Maximum number of requests in flight at once.
+            
+        Returns:
+            Results in input order. A failed job holds its exception instead
+            of an EmailContent object, so one failure does not abort the batch.
+        """
+        results: List[Union[EmailContent, Exception]] = [None] * len(jobs)
+        
+        # Group jobs by template so each group runs as one batch
+        groups: Dict[Tuple[str, str], List[Tuple[int, Dict[str, Any]]]] = {}
+        services: Dict[Tuple[str, str], LLMService] = {}
+        for index, job in enumerate(jobs):
+            try:
+                template, human_template, input_variables = self._build_request(**job)
+            except Exception as e:
+                results[index] = e
+                continue
+            key = (template, human_template)
+            groups.setdefault(key, []).append((index, input_variables))
+            services[key] = self._get_llm_service(job.get("feedback"))
+        
+        for (template, human_template), items in groups.items():
+            outputs = services[(template, human_template)].batch_with_template(
+                template=template,
+                human_template=human_template,
+                inputs=[input_variables for _, input_variables in items],
+                output_schema=EmailContent,
+                max_concurrency=max_concurrency
+            )
+            for (index, _), output in zip(items, outputs):
+                if isinstance(output, Exception):
+                    print(f"Error generating email for job {index}: {str(output)}")
+                results[index] = output
+        
+        return results
+    
+    def _get_llm_service(self, feedback: Optional[str]) -> LLMService:
+        """
+        Get the service for a request, routing regeneration with feedback separately.
+        
+        Args:
+            feedback: Optional feedback for regeneration.
+            
+        Returns:
+            The LLMService to use.
+        """
+        return self.regeneration_llm_service if feedback else self.llm_service
+    
+    def _build_revision_input(self, previous: EmailContent, feedback: str) -> Dict[str, Any]:
+        """
+        Build the input variables for a revision request.
+        
+        Args:
+            previous: The email to revise.
+            feedback: Changes requested by the user.
+            
+        Returns:
+            Input variables for the revision request template.
+        """
+        return {
+            "draft": previous.model_dump_json(indent=2),
+            "feedback": feedback
+        }
+    
+    def _apply_revision(self, previous: EmailContent, revision: EmailRevision) -> EmailContent:
+        """
+        Merge the changed fields of a revision into the previous email.
+        
+        Args:
+            previous: The email that was revised.
+            revision: Fields returned by the revision request.
+            
+        Returns:
+            EmailContent object containing the revised email.
+        """
+        changes = {
+            field: value for field, value in revision.model_dump().items()
+            if value
+        }
+        return previous.model_copy(update=changes)
+    
+    def _build_request(
+        self,
+        job_description: str,
+        company_info: str,
+        resume: Union[str, ParsedResume],
+        recruiter_email: str,
+        job_position: str,
+        job_source: str,
+        company_name: str,
+        feedback: Optional[str] = None
+    ) -> Tuple[str, str, Dict[str, Any]]:
+        """
+        Build the prompt templates and input variables for an email.
+        
+        Args:
+            job_description: Job description text.
+            company_info: Information about the company.
+            resume: Resume text or structured resume.
+            recruiter_email: Email address of the recruiter.
+            job_position: Position being applied for.
+            job_source: Source of the job posting.
+            company_name: Name of the company.
+            feedback: Optional feedback for regeneration.
+            
+        Returns:
+            Tuple of the system template, the human template and their
+            input variables.
+        """
+        # Trim the long inputs to their token budgets
+        budgets = get_token_budgets()
+        resume_text, resume_highlights = format_resume_input(resume, job_description, budgets["resume"])
+        
+        # Create input variables for the template
+        input_variables = {
+            "company_name": company_name,
+            "recruiter_email": recruiter_email,
+            "job_position": job_position,
+            "job_source": job_source,
+            "resume_details": resume_text,
+            "resume_highlights": resume_highlights,
+            "job_description": compact_text(job_description, budgets["job_description"]),
+            "company_overview": compact_text(company_info, budgets["company_info"]),
+            "feedback": feedback or ""
+        }
+        
+        # Static instructions and the resume first, per-job inputs last;
+        # feedback is only sent when given
+        EMAIL_GENERATION_LAYOUT.check_cacheable(input_variables)
+        return (
+            EMAIL_GENERATION_LAYOUT.system_template,
+            EMAIL_GENERATION_LAYOUT.human_template(input_variables),
+            input_variables
+        )
@@ -0,0 +1,163 @@
+"""
+DOCX text extraction for RecruitReach.
+
+This module extracts the text of a DOCX file by streaming its XML parts
+instead of building the python-docx object model. Paragraphs are returned
+in document order together with table cells, text boxes, headers and footers.
+"""
+
+import io
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from typing import BinaryIO, Iterator, List, Union
+
+
+# DOCX input: a file path, the file content, or a binary file object
+DocxSource = Union[str, bytes, bytearray, memoryview, BinaryIO]
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+
+_BODY_PART = "word/document.xml"
+_HEADER_PART = re.compile(r"word/header(\d*)\.xml$")
+_FOOTER_PART = re.compile(r"word/footer(\d*)\.xml$")
+
+# Separators for the paragraphs of a table cell and the cells of a row
+CELL_PARAGRAPH_SEPARATOR = "; "
+ROW_CELL_SEPARATOR = " | "
+
+
+def iter_docx_lines(source: DocxSource) -> Iterator[str]:
+    """
+    Extract the text of a DOCX file one line at a time.
+    
+    Headers come first, then the body and then footers. Each paragraph is a
+    line, and each table row is one line with its cells separated by ' | '.
+    Text repeated across header or footer variants is only returned once.
+    
+    Args:
+        source: Path, content or binary file object of the DOCX file.
+    
+    Yields:
+        Text of each paragraph or table row, in document order.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source)
+    
+    with zipfile.ZipFile(source) as archive:
+        names = archive.namelist()
+        headers = _sorted_parts(names, _HEADER_PART)
+        footers = _sorted_parts(names, _FOOTER_PART)
+        
+        seen = set()
+        for part in headers:
+            yield from _unique_lines(_iter_part_lines(archive, part), seen)
+        yield from _iter_part_lines(archive, _BODY_PART)
+        for part in footers:
+            yield from _unique_lines(_iter_part_lines(archive, part), seen)
+
+
+def extract_docx_text(source: DocxSource) -> str:
+    """
+    Extract the text of a DOCX file.
+    
+    Args:
+        source: Path, content or binary file object of the DOCX file.
+    
+    Returns:
+        Text of all paragraphs and table rows separated by newlines.
+    """
+    return "\n".join(iter_docx_lines(source))
+
+
+def _iter_part_lines(archive: zipfile.ZipFile, part: str) -> Iterator[str]:
+    """
+    Stream the lines of one XML part of a DOCX file.
+    
+    Paragraphs, cells and rows are tracked on stacks, so nested tables and
+    text boxes inside paragraphs keep their order. Text boxes are also
+    stored as a legacy fallback copy, which is skipped.
+    
+    Args:
+        archive: Open DOCX archive.
+        part: Name of the XML part.
+    
+    Yields:
+        Text of each top-level paragraph or table row.
+    """
+    paragraphs: List[List[str]] = []
+    cells: List[List[str]] = []
+    rows: List[List[str]] = []
+    fallback_depth = 0
+    
+    with archive.open(part) as xml_file:
+        for event, element in ET.iterparse(xml_file, events=("start", "end")):
+            tag = element.tag
+            
+            if tag == _MC_FALLBACK:
+                fallback_depth += 1 if event == "start" else -1
+                continue
+            if fallback_depth:
+                if event == "end":
+                    element.clear()
+                continue
+            
+            if event == "start":
+                if tag == f"{_W}p":
+                    paragraphs.append([])
+                elif tag == f"{_W}tc":
+                    cells.append([])
+                elif tag == f"{_W}tr":
+                    rows.append([])
+                continue
+            
+            if tag == f"{_W}t" and paragraphs:
+                paragraphs[-1].append(element.text or "")
+            elif tag == f"{_W}tab" and paragraphs:
+                paragraphs[-1].append("\t")
+            elif tag in (f"{_W}br", f"{_W}cr") and paragraphs:
+                paragraphs[-1].append("\n")
+            elif tag == f"{_W}noBreakHyphen" and paragraphs:
+                paragraphs[-1].append("-")
+            elif tag == f"{_W}p":
+                text = "".join(paragraphs.pop())
+                if cells:
+                    cells[-1].append(text)
+                else:
+                    yield text
+                element.clear()
+            elif tag == f"{_W}tc":
+                text = CELL_PARAGRAPH_SEPARATOR.join(
+                    paragraph.strip() for paragraph in cells.pop() if paragraph.strip()
+                )
+                if rows:
+                    rows[-1].append(text)
+                element.clear()
+            elif tag == f"{_W}tr":
+                text = ROW_CELL_SEPARATOR.join(cell for cell in rows.pop() if cell)
+                if cells:
+                    cells[-1].append(text)
+                else:
+                    yield text
+                element.clear()
+
+
+def _sorted_parts(names: List[str], pattern: re.Pattern) -> List[str]:
+    """Get the part names matching a pattern, ordered by their number."""
+    parts = []
+    for name in names:
+        match = pattern.match(name)
+        if match:
+            parts.append((int(match.group(1) or 0), name))
+    return [name for _, name in sorted(parts)]
+
+
+def _unique_lines(lines: Iterator[str], seen: set) -> Iterator[str]:
+    """Skip non-empty lines that were already returned."""
+    for line in lines:
+        if line.strip():
+            if line in seen:
+                continue
+            seen.add(line)
+        yield line
@@ -0,0 +1,221 @@
+"""
+Resume Parse Cache for RecruitReach.
+
+This module provides a cache of extracted resume text keyed by the SHA-256
+hash of the file content, so unchanged resumes are not parsed again.
+"""
+
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from Recruiter.utils.config.config_manager import ConfigManager
+from Recruiter.utils.file_utils.file_store import entry_paths, evict_entries, read_json, remove_file, write_atomic, write_json
+from Recruiter.utils.file_utils.mapped_file import map_file
+from Recruiter.utils.file_utils.path_manager import PathManager
+
+
+class ResumeParseCache:
+    """
+    Two-level cache of parsed resume text.
+    
+    Parsed text is kept in an in-memory LRU in front of text files on disk,
+    both keyed by the content hash and the parser that produced the text.
+    For files on disk the content hash is remembered per path together with
+    the file's modification time and size, so an unchanged file is not even
+    read again. Each text on disk can carry a JSON metadata file next to it.
+    """
+    
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_memory_entries: int = 32,
+        max_disk_entries: int = 200
+    ):
+        """
+        Initialize the parse cache.
+        
+        Args:
+            cache_dir: Directory for cache files. Defaults to 'data/cache/resume'.
+            max_memory_entries: Maximum number of texts kept in memory.
+            max_disk_entries: Maximum number of texts kept on disk.
+        """
+        self.cache_dir = cache_dir or PathManager().get_cache_dir('resume')
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._paths: Dict[str, Tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def hash_content(file_content: Union[bytes, memoryview]) -> str:
+        """
+        Hash the content of a resume file.
+        
+        Args:
+            file_content: Content of the file as bytes or a view of it.
+        
+        Returns:
+            Hex SHA-256 digest of the content.
+        """
+        return hashlib.sha256(file_content).hexdigest()
+    
+    @staticmethod
+    def make_key(content_hash: str, parser: str) -> str:
+        """
+        Build a cache key for parsed text.
+        
+        Args:
+            content_hash: SHA-256 digest of the file content.
+            parser: Name and version of the parser producing the text.
+        
+        Returns:
+            Key identifying the parsed text.
+        """
+        return hashlib.sha256(f"{parser}:{content_hash}".encode('utf-8')).hexdigest()
+    
+    def hash_file(self, file_path: str) -> str:
+        """
+        Get the content hash of a file, reusing it while the file is unchanged.
+        
+        Args:
+            file_path: Path to the file.
+        
+        Returns:
+            Hex SHA-256 digest of the file content.
+        """
+        path = os.path.abspath(file_path)
+        stat = os.stat(path)
+        
+        with self._lock:
+            known = self._paths.get(path)
+        if known is not None and known[:2] == (stat.st_mtime_ns, stat.st_size):
+            return known[2]
+        
+        with map_file(path) as content:
+            content_hash = self.hash_content(content)
+        with self._lock:
+            self._paths[path] = (stat.st_mtime_ns, stat.st_size, content_hash)
+        return content_hash
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up parsed text.
+        
+        Args:
+            key: Cache key returned by make_key.
+        
+        Returns:
+            The parsed text, or None on a miss.
+        """
+        with self._lock:
+            text = self._memory.get(key)
+            if text is not None:
+                self._memory.move_to_end(key)
+                return text
+        
+        try:
+            with open(self._entry_path(key), 'r', encoding='utf-8') as f:
+                text = f.read()
+        except OSError:
+            return None
+        
+        self._remember(key, text)
+        return text
+    
+    def get_metadata(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up the metadata stored with parsed text.
+        
+        Args:
+            key: Cache key returned by make_key.
+        
+        Returns:
+            The metadata, or None if the entry has none.
+        """
+        metadata = read_json(self._metadata_path(key))
+        return metadata if isinstance(metadata, dict) else None
+    
+    def set(self, key: str, text: str, metadata: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Store parsed text.
+        
+        Args:
+            key: Cache key returned by make_key.
+            text: Parsed resume text.
+            metadata: Optional JSON-serializable details about the text, such
+                as its source file and parse time.
+        """
+        self._remember(key, text)
+        
+        with self._lock:
+            if metadata is not None:
+                write_json(self._metadata_path(key), metadata, indent=2)
+            write_atomic(self._entry_path(key), text)
+            for path in evict_entries(self._entry_paths(), self.max_disk_entries):
+                remove_file(self._metadata_path_for(path))
+    
+    def clear(self) -> None:
+        """Remove every cached text and remembered file hash."""
+        with self._lock:
+            self._memory.clear()
+            self._paths.clear()
+            for path in self._entry_paths():
+                remove_file(path)
+                remove_file(self._metadata_path_for(path))
+    
+    def _remember(self, key: str, text: str) -> None:
+        """Add parsed text to the in-memory LRU."""
+        with self._lock:
+            self._memory[key] = text
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+    
+    def _entry_path(self, key: str) -> str:
+        """Get the file path for a cache key."""
+        return os.path.join(self.cache_dir, f"{key}.txt")
+    
+    def _metadata_path(self, key: str) -> str:
+        """Get the metadata file path for a cache key."""
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    @staticmethod
+    def _metadata_path_for(entry_path: str) -> str:
+        """Get the metadata file path for a text file path."""
+        return os.path.splitext(entry_path)[0] + '.json'
+    
+    def _entry_paths(self) -> List[str]:
+        """List the file paths of all cache entries."""
+        return entry_paths(self.cache_dir, '.txt')
+
+
+_default_cache: Optional[ResumeParseCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_resume_parse_cache() -> Optional[ResumeParseCache]:
+    """
+    Get the shared resume parse cache configured in config.toml.
+    
+    The cache is configured by the optional [resume_cache] section with the
+    keys 'enabled', 'max_memory_entries' and 'max_disk_entries'.
+    
+    Returns:
+        The shared ResumeParseCache instance, or None if caching is disabled.
+    """
+    global _default_cache
+    
+    with _default_cache_lock:
+        if _default_cache is None:
+            settings = ConfigManager().get_section('resume_cache')
+            if not settings.get('enabled', True):
+                return None
+            _default_cache = ResumeParseCache(
+                max_memory_entries=settings.get('max_memory_entries', 32),
+                max_disk_entries=settings.get('max_disk_entries', 200)
+            )
+        return _default_cache
@@ -0,0 +1,299 @@
+"""
+PDF text extraction for RecruitReach.
+
+This module provides a single PDF text extractor for files and in-memory
+content. It uses PyMuPDF when it is installed and falls back to pypdf.
+Large PDFs can be split across a process pool.
+"""
+
+import io
+import os
+import shutil
+import tempfile
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Iterator, List, Optional, Union
+
+from pypdf import PdfReader
+
+try:
+    import pymupdf
+except ImportError:
+    pymupdf = None
+
+
+# PDF input: a file path, the file content, or a binary file object
+PdfSource = Union[str, bytes, bytearray, memoryview, BinaryIO]
+
+_BUFFER_TYPES = (bytes, bytearray, memoryview)
+
+BACKEND_PYMUPDF = "pymupdf"
+BACKEND_PYPDF = "pypdf"
+
+# PDFs with fewer pages than this are extracted on the calling thread
+DEFAULT_PARALLEL_THRESHOLD = 16
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_workers = 0
+_process_pool_lock = threading.Lock()
+
+
+def get_pdf_backend(backend: Optional[str] = None) -> str:
+    """
+    Resolve the extraction backend.
+    
+    Args:
+        backend: Requested backend ('pymupdf' or 'pypdf'), or None for the
+            fastest installed one.
+    
+    Returns:
+        Name of the backend to use.
+    
+    Raises:
+        ValueError: If the requested backend is unknown or not installed.
+    """
+    if backend is None:
+        return BACKEND_PYMUPDF if pymupdf is not None else BACKEND_PYPDF
+    if backend == BACKEND_PYMUPDF and pymupdf is None:
+        raise ValueError("PDF backend 'pymupdf' is not installed")
+    if backend not in (BACKEND_PYMUPDF, BACKEND_PYPDF):
+        raise ValueError(f"Unsupported PDF backend: {backend}")
+    return backend
+
+
+def iter_pdf_pages(
+    source: PdfSource,
+    backend: Optional[str] = None,
+    start: int = 0,
+    stop: Optional[int] = None
+) -> Iterator[str]:
+    """
+    Extract the text of a PDF one page at a time.
+    
+    Args:
+        source: Path, content or binary file object of the PDF.
+        backend: Extraction backend, or None for the fastest installed one.
+        start: Index of the first page to extract.
+        stop: Index after the last page to extract, or None for the last page.
+    
+    Yields:
+        Text of each page, in page order.
+    """
+    backend = get_pdf_backend(backend)
+    with _open_document(source, backend) as document:
+        yield from _iter_document_pages(document, backend, start, stop)
+
+
+def count_pdf_pages(source: PdfSource, backend: Optional[str] = None) -> int:
+    """
+    Count the pages of a PDF.
+    
+    Args:
+        source: Path or content of the PDF.
+        backend: Extraction backend, or None for the fastest installed one.
+    
+    Returns:
+        Number of pages.
+    """
+    backend = get_pdf_backend(backend)
+    with _open_document(source, backend) as document:
+        return _page_count(document, backend)
+
+
+def extract_pdf_text(
+    source: PdfSource,
+    backend: Optional[str] = None,
+    parallel_threshold: Optional[int] = DEFAULT_PARALLEL_THRESHOLD,
+    max_workers: Optional[int] = None
+) -> str:
+    """
+    Extract the text of a PDF.
+    
+    Pages are streamed from the backend and joined once at the end. PDFs
+    with at least parallel_threshold pages are split into page ranges that
+    are extracted in a process pool and reassembled in order. Workers open
+    the PDF by path; in-memory content is written to one temporary file
+    instead of being copied to every worker.
+    
+    Args:
+        source: Path, content or binary file object of the PDF.
+        backend: Extraction backend, or None for the fastest installed one.
+        parallel_threshold: Minimum page count for parallel extraction, or
+            None to always extract serially.
+        max_workers: Number of worker processes. Defaults to the CPU count.
+    
+    Returns:
+        Text of all pages separated by newlines.
+    """
+    backend = get_pdf_backend(backend)
+    workers = max_workers or os.cpu_count() or 1
+    
+    # A seekable file object is rewound for the workers after counting its pages
+    position = None
+    if not isinstance(source, (str, *_BUFFER_TYPES)):
+        if source.seekable():
+            position = source.tell()
+        else:
+            source = source.read()
+    
+    # The document is opened once and extracted in place if it stays serial
+    with _open_document(source, backend) as document:
+        page_count = _page_count(document, backend)
+        if parallel_threshold is None or workers < 2 or page_count < parallel_threshold:
+            return "\n".join(_iter_document_pages(document, backend))
+    
+    if position is not None:
+        source.seek(position)
+    
+    # One contiguous range per worker keeps the number of document opens low
+    chunk_size = -(-page_count // workers)
+    ranges = [(start, min(start + chunk_size, page_count)) for start in range(0, page_count, chunk_size)]
+    with _worker_path(source) as path:
+        chunks = _get_process_pool(workers).map(
+            _extract_page_range,
+            [path] * len(ranges),
+            [backend] * len(ranges),
+            [start for start, _ in ranges],
+            [stop for _, stop in ranges]
+        )
+        return "\n".join(page for chunk in chunks for page in chunk)
+
+
+def _extract_page_range(path: str, backend: str, start: int, stop: int) -> List[str]:
+    """
+    Extract a range of pages in a worker process.
+    
+    Args:
+        path: Path of the PDF.
+        backend: Extraction backend.
+        start: Index of the first page to extract.
+        stop: Index after the last page to extract.
+    
+    Returns:
+        Text of each page in the range.
+    """
+    return list(iter_pdf_pages(path, backend, start, stop))
+
+
+def _get_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Get the shared process pool, creating it on first use.
+    
+    Args:
+        max_workers: Number of worker processes.
+    
+    Returns:
+        Process pool with the requested number of workers.
+    """
+    global _process_pool, _process_pool_workers
+    
+    with _process_pool_lock:
+        if _process_pool is None or _process_pool_workers != max_workers:
+            if _process_pool is not None:
+                _process_pool.shutdown(wait=False)
+            # The app is multi-threaded, so workers are not forked from it directly
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            _process_pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context(method)
+            )
+            _process_pool_workers = max_workers
+        return _process_pool
+
+
+@contextmanager
+def _worker_path(source: PdfSource) -> Iterator[str]:
+    """
+    Get a path worker processes can open the PDF from.
+    
+    Args:
+        source: Path, content or seekable binary file object of the PDF.
+    
+    Yields:
+        The path itself, or a temporary copy of the content that is
+        removed afterwards.
+    """
+    if isinstance(source, str):
+        yield source
+        return
+    
+    fd, path = tempfile.mkstemp(suffix='.pdf')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            if isinstance(source, _BUFFER_TYPES):
+                f.write(source)
+            else:
+                shutil.copyfileobj(source, f)
+        yield path
+    finally:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _open_document(source: PdfSource, backend: str) -> Any:
+    """
+    Open a PDF with a backend.
+    
+    Args:
+        source: Path, content or binary file object of the PDF.
+        backend: Extraction backend.
+    
+    Returns:
+        Open document, usable as a context manager.
+    """
+    if backend == BACKEND_PYMUPDF:
+        return _open_pymupdf(source)
+    return _open_pypdf(source)
+
+
+def _page_count(document: Any, backend: str) -> int:
+    """Get the number of pages of an open document."""
+    if backend == BACKEND_PYMUPDF:
+        return document.page_count
+    return len(document.pages)
+
+
+def _iter_document_pages(
+    document: Any,
+    backend: str,
+    start: int = 0,
+    stop: Optional[int] = None
+) -> Iterator[str]:
+    """
+    Extract the text of an open document one page at a time.
+    
+    Args:
+        document: Open document.
+        backend: Extraction backend.
+        start: Index of the first page to extract.
+        stop: Index after the last page to extract, or None for the last page.
+    
+    Yields:
+        Text of each page, in page order.
+    """
+    stop = _page_count(document, backend) if stop is None else stop
+    if backend == BACKEND_PYMUPDF:
+        for index in range(start, stop):
+            yield document[index].get_text()
+    else:
+        for index in range(start, stop):
+            yield document.pages[index].extract_text() or ""
+
+
+def _open_pymupdf(source: PdfSource):
+    """Open a PDF with PyMuPDF, reading buffers in place."""
+    if isinstance(source, str):
+        return pymupdf.open(source)
+    data = source if isinstance(source, _BUFFER_TYPES) else source.read()
+    return pymupdf.open(stream=data, filetype="pdf")
+
+
+def _open_pypdf(source: PdfSource) -> PdfReader:
+    """Open a PDF with pypdf, which needs a seekable stream over buffers."""
+    if isinstance(source, _BUFFER_TYPES):
+        source = io.BytesIO(source)
+    return PdfReader(source)
@@ -0,0 +1,167 @@
+"""
+Resume Extractor for RecruitReach.
+
+This module extracts a structured ParsedResume from resume text once per
+resume and persists it, so later generations reuse it without sending the
+full resume to the model again.
+"""
+
+import threading
+from typing import Optional
+
+from pydantic import ValidationError
+
+from Recruiter.core.resume.parse_cache import ResumeParseCache
+from Recruiter.models.schemas import ParsedResume
+from Recruiter.prompts.resume_prompts import RESUME_EXTRACTION_LAYOUT
+from Recruiter.services.llm.llm_service import LLMService
+from Recruiter.services.llm.model_router import TASK_RESUME_EXTRACTION
+from Recruiter.utils.config.config_manager import ConfigManager
+from Recruiter.utils.file_utils.path_manager import PathManager
+
+# Bump when the schema or prompt changes so older extractions are not reused
+EXTRACTOR_VERSION = 1
+
+
+class ResumeExtractor:
+    """
+    Extractor of structured resume data.
+    
+    Extractions are stored as JSON in a ResumeParseCache keyed by the
+    resume's content hash, the model and the extractor version.
+    """
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache: Optional[ResumeParseCache] = None
+    ):
+        """
+        Initialize the resume extractor.
+        
+        Args:
+            api_key: OpenAI API key. If not provided, will try to get from config.
+            cache: Store for extracted resumes. Defaults to the shared store
+                in 'data/cache/resume_structured'.
+        """
+        self.llm_service = LLMService.for_task(
+            TASK_RESUME_EXTRACTION,
+            api_key=api_key,
+            component="resume_extraction"
+        )
+        self.cache = cache or get_structured_resume_cache()
+    
+    def extract(self, resume_text: str, content_hash: Optional[str] = None) -> ParsedResume:
+        """
+        Get the structured content of a resume, extracting it on first use.
+        
+        Args:
+            resume_text: Text of the resume.
+            content_hash: Content hash of the resume file. Defaults to the
+                hash of the text.
+            
+        Returns:
+            ParsedResume object for the resume.
+        """
+        key = self._cache_key(resume_text, content_hash)
+        parsed = self._load(key)
+        if parsed is None:
+            parsed = self.llm_service.generate_with_template(
+                template=RESUME_EXTRACTION_LAYOUT.system_template,
+                human_template=RESUME_EXTRACTION_LAYOUT.human_template(),
+                input_variables={"resume": resume_text},
+                output_schema=ParsedResume
+            )
+            self._store(key, parsed)
+        return parsed
+    
+    async def aextract(self, resume_text: str, content_hash: Optional[str] = None) -> ParsedResume:
+        """
+        Get the structured content of a resume asynchronously.
+        
+        Args:
+            resume_text: Text of the resume.
+            content_hash: Content hash of the resume file. Defaults to the
+                hash of the text.
+            
+        Returns:
+            ParsedResume object for the resume.
+        """
+        key = self._cache_key(resume_text, content_hash)
+        parsed = self._load(key)
+        if parsed is None:
+            parsed = await self.llm_service.agenerate_with_template(
+                template=RESUME_EXTRACTION_LAYOUT.system_template,
+                human_template=RESUME_EXTRACTION_LAYOUT.human_template(),
+                input_variables={"resume": resume_text},
+                output_schema=ParsedResume
+            )
+            self._store(key, parsed)
+        return parsed
+    
+    def _cache_key(self, resume_text: str, content_hash: Optional[str]) -> str:
+        """
+        Build the store key for a resume.
+        
+        Args:
+            resume_text: Text of the resume.
+            content_hash: Content hash of the resume file, if known.
+            
+        Returns:
+            Key identifying the extraction.
+        """
+        content_hash = content_hash or ResumeParseCache.hash_content(resume_text.encode('utf-8'))
+        return ResumeParseCache.make_key(
+            content_hash,
+            f"structured:{self.llm_service.model_name}:v{EXTRACTOR_VERSION}"
+        )
+    
+    def _load(self, key: str) -> Optional[ParsedResume]:
+        """Load a stored extraction, ignoring entries that no longer validate."""
+        if self.cache is None:
+            return None
+        data = self.cache.get(key)
+        if data is None:
+            return None
+        try:
+            return ParsedResume.model_validate_json(data)
+        except ValidationError as e:
+            print(f"Error reading stored resume extraction: {str(e)}")
+            return None
+    
+    def _store(self, key: str, parsed: ParsedResume) -> None:
+        """Persist an extraction."""
+        if self.cache is None:
+            return
+        try:
+            self.cache.set(key, parsed.model_dump_json())
+        except OSError as e:
+            print(f"Error storing resume extraction: {str(e)}")
+
+
+_structured_cache: Optional[ResumeParseCache] = None
+_structured_cache_lock = threading.Lock()
+
+
+def get_structured_resume_cache() -> Optional[ResumeParseCache]:
+    """
+    Get the shared store of extracted resumes.
+    
+    The store follows the 'enabled' and 'max_disk_entries' keys of the
+    optional [resume_cache] section.
+    
+    Returns:
+        The shared ResumeParseCache instance, or None if caching is disabled.
+    """
+    global _structured_cache
+    
+    with _structured_cache_lock:
+        if _structured_cache is None:
+            settings = ConfigManager().get_section('resume_cache')
+            if not settings.get('enabled', True):
+                return None
+            _structured_cache = ResumeParseCache(
+                cache_dir=PathManager().get_cache_dir('resume_structured'),
+                max_disk_entries=settings.get('max_disk_entries', 200)
+            )
+        return _structured_cache
@@ -0,0 +1,204 @@
+"""
+Resume Formatter for RecruitReach.
+
+This module renders a ParsedResume as compact prompt sections: a resume
+block that is the same for every job, so it can sit in the cached prompt
+prefix, and a short list of the entries most relevant to one job.
+"""
+
+import re
+from typing import Any, Callable, Iterable, List, Optional, Set, Tuple, Union
+
+from Recruiter.models.schemas import ParsedResume
+from Recruiter.utils.text.prompt_compactor import compact_text
+
+
+# Limits on the entries kept in the resume block
+MAX_SKILLS = 25
+MAX_HIGHLIGHTS = 3
+MAX_PROJECTS = 3
+
+# Limits on the entries listed as relevant to a job
+MAX_RELEVANT_SKILLS = 10
+MAX_RELEVANT_HIGHLIGHTS = 5
+MAX_RELEVANT_PROJECTS = 2
+
+_WORD_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+
+_STOPWORDS = frozenset({
+    "a", "about", "an", "and", "are", "as", "at", "be", "by", "can", "for",
+    "from", "have", "in", "is", "it", "of", "on", "or", "our", "that", "the",
+    "their", "this", "to", "we", "will", "with", "you", "your", "who", "work",
+    "team", "role", "years", "experience", "strong", "ability", "skills"
+})
+
+
+def extract_keywords(text: str) -> Set[str]:
+    """
+    Extract the distinct keywords of a text.
+    
+    Args:
+        text: Text to extract keywords from, such as a job description.
+    
+    Returns:
+        Lower-case words without common stopwords.
+    """
+    return {
+        word for word in _WORD_PATTERN.findall(text.lower())
+        if word not in _STOPWORDS
+    }
+
+
+def format_resume(parsed: ParsedResume, max_tokens: Optional[int] = None) -> str:
+    """
+    Render a structured resume as a compact prompt section.
+    
+    Entries keep their resume order and do not depend on the job, so the
+    section is identical for every job and forms part of the shared prompt
+    prefix. Use format_relevant_highlights for the job-specific ranking.
+    
+    Args:
+        parsed: Structured resume.
+        max_tokens: Token budget for the section, or None for no limit.
+    
+    Returns:
+        Resume section text.
+    """
+    sections = []
+    
+    contact = parsed.contact
+    contact_line = " | ".join(
+        value for value in [contact.name, contact.email, contact.phone, contact.location, *contact.links]
+        if value
+    )
+    if contact_line:
+        sections.append(f"CONTACT:\n{contact_line}")
+    
+    if parsed.summary:
+        sections.append(f"SUMMARY:\n{parsed.summary}")
+    
+    if parsed.skills:
+        sections.append(f"SKILLS:\n{', '.join(parsed.skills[:MAX_SKILLS])}")
+    
+    experience_lines = []
+    for entry in parsed.experience:
+        period = " - ".join(date for date in [entry.start_date, entry.end_date] if date)
+        experience_lines.append(f"{entry.title}, {entry.company}" + (f" ({period})" if period else ""))
+        for highlight in entry.highlights[:MAX_HIGHLIGHTS]:
+            experience_lines.append(f"- {highlight}")
+        if entry.technologies:
+            experience_lines.append(f"  Technologies: {', '.join(entry.technologies)}")
+    if experience_lines:
+        sections.append("EXPERIENCE:\n" + "\n".join(experience_lines))
+    
+    if parsed.education:
+        education_lines = []
+        for entry in parsed.education:
+            details = ", ".join(value for value in [entry.year, entry.details] if value)
+            education_lines.append(f"{entry.degree}, {entry.institution}" + (f" ({details})" if details else ""))
+        sections.append("EDUCATION:\n" + "\n".join(education_lines))
+    
+    if parsed.projects:
+        sections.append("PROJECTS:\n" + "\n".join(
+            f"- {project.name}: {project.description}" for project in parsed.projects[:MAX_PROJECTS]
+        ))
+    
+    text = "\n\n".join(sections)
+    if max_tokens is not None:
+        text = compact_text(text, max_tokens)
+    return text
+
+
+def format_relevant_highlights(parsed: ParsedResume, job_description: str) -> str:
+    """
+    List the resume entries that match a job description.
+    
+    Only skills, experience highlights and projects sharing keywords with
+    the job description are listed, most matches first.
+    
+    Args:
+        parsed: Structured resume.
+        job_description: Job description to rank the resume entries against.
+    
+    Returns:
+        Relevant entries text, or an empty string if nothing matches.
+    """
+    keywords = extract_keywords(job_description)
+    if not keywords:
+        return ""
+    sections = []
+    
+    skills = _relevant(parsed.skills, keywords, key=lambda skill: skill)[:MAX_RELEVANT_SKILLS]
+    if skills:
+        sections.append(f"MATCHING SKILLS:\n{', '.join(skills)}")
+    
+    highlights = _relevant(
+        [(highlight, entry) for entry in parsed.experience for highlight in entry.highlights],
+        keywords,
+        key=lambda item: " ".join([item[0], *item[1].technologies])
+    )[:MAX_RELEVANT_HIGHLIGHTS]
+    if highlights:
+        sections.append("MATCHING EXPERIENCE:\n" + "\n".join(
+            f"- {highlight} ({entry.title}, {entry.company})" for highlight, entry in highlights
+        ))
+    
+    projects = _relevant(
+        parsed.projects,
+        keywords,
+        key=lambda project: " ".join([project.name, project.description, *project.technologies])
+    )[:MAX_RELEVANT_PROJECTS]
+    if projects:
+        sections.append("MATCHING PROJECTS:\n" + "\n".join(
+            f"- {project.name}: {project.description}" for project in projects
+        ))
+    
+    return "\n\n".join(sections)
+
+
+def format_resume_input(
+    resume: Union[str, ParsedResume],
+    job_description: str,
+    max_tokens: int
+) -> Tuple[str, str]:
+    """
+    Prepare a resume for a generation prompt.
+    
+    Structured resumes are rendered with format_resume and
+    format_relevant_highlights; plain text resumes are compacted to the
+    token budget and have no separate highlights.
+    
+    Args:
+        resume: Resume text or structured resume.
+        job_description: Job description the resume is tailored to.
+        max_tokens: Token budget for the resume.
+    
+    Returns:
+        Tuple of the job-independent resume section and the entries
+        relevant to the job.
+    """
+    if isinstance(resume, ParsedResume):
+        return format_resume(resume, max_tokens), format_relevant_highlights(resume, job_description)
+    return compact_text(resume, max_tokens), ""
+
+
+def _score(text: str, keywords: Set[str]) -> int:
+    """Count the keywords that occur in a text."""
+    return len(extract_keywords(text) & keywords)
+
+
+def _relevant(items: Iterable[Any], keywords: Set[str], key: Callable[[Any], str]) -> List[Any]:
+    """
+    Keep the items matching any keyword, most matches first.
+    
+    Args:
+        items: Items to rank.
+        keywords: Keywords of the job description.
+        key: Function returning the text of an item.
+    
+    Returns:
+        Matching items, keeping the resume order among equals.
+    """
+    scored = [(_score(key(item), keywords), item) for item in items]
+    matching = [entry for entry in scored if entry[0] > 0]
+    matching.sort(key=lambda entry: -entry[0])
+    return [item for _, item in matching]
@@ -5,13 +5,22 @@ This module provides functionality for loading and parsing resume files.
 """
 
 import os
-import io
-from typing import Optional, Union, Dict, Any
-
-from langchain_community.document_loaders import PyPDFLoader
-from docx import Document
+import time
+from typing import Optional, Union, Dict, Any, Callable
 
+from Recruiter.core.resume.docx_extractor import extract_docx_text
+from Recruiter.core.resume.parse_cache import ResumeParseCache, get_resume_parse_cache
+from Recruiter.core.resume.pdf_extractor import (
+    DEFAULT_PARALLEL_THRESHOLD,
+    extract_pdf_text,
+    get_pdf_backend
+)
+from Recruiter.utils.config.config_manager import ConfigManager
 from Recruiter.utils.file_utils.path_manager import PathManager
+from Recruiter.utils.text.prompt_compactor import normalize_whitespace
+
+# Bump when parsing changes so cached text from older parsers is not reused
+PARSER_VERSION = 4
 
 
 class ResumeParser:
@@ -22,9 +31,28 @@ class ResumeParser:
     various formats such as PDF and DOCX.
     """
     
-    def __init__(self):
-        """Initialize the resume parser."""
+    def __init__(self, cache: Optional[ResumeParseCache] = None):
+        """
+        Initialize the resume parser.
+        
+        Args:
+            cache: Parse cache for extracted text. Defaults to the shared cache
+                configured in config.toml.
+        """
         self.path_manager = PathManager()
+        self.cache = cache or get_resume_parse_cache()
+        
+        # PDF backend from the optional [resume] section, else the fastest installed
+        settings = ConfigManager().get_section('resume')
+        try:
+            self.pdf_backend = get_pdf_backend(settings.get('pdf_backend'))
+        except ValueError as e:
+            print(f"Error selecting PDF backend: {str(e)}")
+            self.pdf_backend = get_pdf_backend()
+        
+        # Large PDFs are split across worker processes; 0 disables parallel extraction
+        self.parallel_page_threshold = settings.get('parallel_page_threshold', DEFAULT_PARALLEL_THRESHOLD) or None
+        self.max_workers = settings.get('max_workers')
     
     def load_default_resume(self) -> str:
         """
@@ -51,7 +79,7 @@ class ResumeParser:
             file_path: Path to the resume file.
             
         Returns:
-            Content of the resume as text.
+            Content of the resume as normalized text.
             
         Raises:
             FileNotFoundError: If the resume file is not found.
@@ -64,26 +92,57 @@ class ResumeParser:
         file_extension = os.path.splitext(file_path)[1].lower()
         
         if file_extension == '.pdf':
-            return self._parse_pdf(file_path)
+            parse = self._parse_pdf
         elif file_extension == '.docx':
-            return self._parse_docx(file_path)
+            parse = self._parse_docx
         else:
             raise ValueError(f"Unsupported file format: {file_extension}")
+        
+        if self.cache is None:
+            return normalize_whitespace(parse(file_path))
+        
+        # An unchanged file is looked up by its remembered hash without reading it
+        content_hash = self.cache.hash_file(file_path)
+        key = self.cache.make_key(content_hash, self._parser_id(file_extension))
+        metadata = {
+            "file_name": os.path.basename(file_path),
+            "file_size": os.path.getsize(file_path),
+            "content_hash": content_hash,
+            "parser": self._parser_id(file_extension)
+        }
+        return self._get_or_parse(key, lambda: parse(file_path), metadata)
+    
+    def is_cached(self, file_path: str) -> bool:
+        """
+        Check whether the text of a resume file is in the parse cache.
+        
+        Args:
+            file_path: Path to the resume file.
+            
+        Returns:
+            True if loading the file would not parse it again.
+        """
+        if self.cache is None:
+            return False
+        file_extension = os.path.splitext(file_path)[1].lower()
+        key = self.cache.make_key(self.cache.hash_file(file_path), self._parser_id(file_extension))
+        return self.cache.get(key) is not None
     
     def load_resume_from_bytes(
         self,
-        file_content: bytes,
+        file_content: Union[bytes, memoryview],
         file_name: str
     ) -> str:
         """
         Load a resume from bytes.
         
         Args:
-            file_content: Content of the resume file as bytes.
+            file_content: Content of the resume file as bytes, or a view of it
+                such as a memory-mapped file.
             file_name: Name of the resume file.
             
         Returns:
-            Content of the resume as text.
+            Content of the resume as normalized text.
             
         Raises:
             ValueError: If the file format is not supported.
@@ -92,11 +151,73 @@ class ResumeParser:
         file_extension = os.path.splitext(file_name)[1].lower()
         
         if file_extension == '.pdf':
-            return self._parse_pdf_bytes(file_content)
+            parse = self._parse_pdf_bytes
         elif file_extension == '.docx':
-            return self._parse_docx_bytes(file_content)
+            parse = self._parse_docx_bytes
         else:
             raise ValueError(f"Unsupported file format: {file_extension}")
+        
+        if self.cache is None:
+            return normalize_whitespace(parse(file_content))
+        
+        content_hash = self.cache.hash_content(file_content)
+        key = self.cache.make_key(content_hash, self._parser_id(file_extension))
+        metadata = {
+            "file_name": file_name,
+            "file_size": len(file_content),
+            "content_hash": content_hash,
+            "parser": self._parser_id(file_extension)
+        }
+        return self._get_or_parse(key, lambda: parse(file_content), metadata)
+    
+    def _get_or_parse(
+        self,
+        key: str,
+        parse: Callable[[], str],
+        metadata: Dict[str, Any]
+    ) -> str:
+        """
+        Get parsed text from the cache, parsing and storing it on a miss.
+        
+        Args:
+            key: Parse cache key for the file.
+            parse: Function that parses the file.
+            metadata: Details about the file stored with its text.
+            
+        Returns:
+            Content of the resume as normalized text.
+        """
+        text = self.cache.get(key)
+        if text is None:
+            start_time = time.perf_counter()
+            text = normalize_whitespace(parse())
+            metadata = {
+                **metadata,
+                "characters": len(text),
+                "parse_seconds": round(time.perf_counter() - start_time, 4),
+                "parsed_at": time.time()
+            }
+            try:
+                self.cache.set(key, text, metadata)
+            except OSError as e:
+                print(f"Error caching parsed resume: {str(e)}")
+        return text
+    
+    def _parser_id(self, file_extension: str) -> str:
+        """
+        Identify the parser producing a text for the cache key.
+        
+        Path and bytes input share an identifier since they are parsed the same way.
+        
+        Args:
+            file_extension: Extension of the resume file.
+            
+        Returns:
+            Parser name, backend and version.
+        """
+        if file_extension == '.pdf':
+            return f"pdf:{self.pdf_backend}:v{PARSER_VERSION}"
+        return f"{file_extension.lstrip('.')}:v{PARSER_VERSION}"
     
     def _parse_pdf(self, file_path: str) -> str:
         """
@@ -108,30 +229,29 @@ class ResumeParser:
         Returns:
             Content of the PDF as text.
         """
-        loader = PyPDFLoader(file_path)
-        docs = loader.load()
-        return '\n'.join([doc.page_content for doc in docs])
+        return extract_pdf_text(
+            file_path,
+            self.pdf_backend,
+            parallel_threshold=self.parallel_page_threshold,
+            max_workers=self.max_workers
+        )
     
-    def _parse_pdf_bytes(self, file_content: bytes) -> str:
+    def _parse_pdf_bytes(self, file_content: Union[bytes, memoryview]) -> str:
         """
         Parse a PDF file from bytes.
         
         Args:
-            file_content: Content of the PDF file as bytes.
+            file_content: Content of the PDF file as bytes or a view of it.
             
         Returns:
             Content of the PDF as text.
         """
-        from PyPDF2 import PdfReader
-        
-        pdf_file = io.BytesIO(file_content)
-        pdf_reader = PdfReader(pdf_file)
-        text = ""
-        
-        for page in pdf_reader.pages:
-            text += page.extract_text()
-        
-        return text
+        return extract_pdf_text(
+            file_content,
+            self.pdf_backend,
+            parallel_threshold=self.parallel_page_threshold,
+            max_workers=self.max_workers
+        )
     
     def _parse_docx(self, file_path: str) -> str:
         """
@@ -141,21 +261,20 @@ class ResumeParser:
             file_path: Path to the DOCX file.
             
         Returns:
-            Content of the DOCX as text.
+            Content of the DOCX as text, including tables, text boxes,
+            headers and footers.
         """
-        doc = Document(file_path)
-        return '\n'.join([paragraph.text for paragraph in doc.paragraphs])
+        return extract_docx_text(file_path)
     
-    def _parse_docx_bytes(self, file_content: bytes) -> str:
+    def _parse_docx_bytes(self, file_content: Union[bytes, memoryview]) -> str:
         """
         Parse a DOCX file from bytes.
         
         Args:
-            file_content: Content of the DOCX file as bytes.
+            file_content: Content of the DOCX file as bytes or a view of it.
             
         Returns:
-            Content of the DOCX as text.
+            Content of the DOCX as text, including tables, text boxes,
+            headers and footers.
         """
-        docx_file = io.BytesIO(file_content)
-        doc = Document(docx_file)
-        return '\n'.join([paragraph.text for paragraph in doc.paragraphs])
+        return extract_docx_text(file_content)
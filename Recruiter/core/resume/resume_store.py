@@ -0,0 +1,143 @@
+"""
+Resume Store for RecruitReach.
+
+This module stores uploaded resumes on disk by content hash, so sessions keep
+only a small reference to their resume instead of the file content.
+"""
+
+import io
+import os
+import hashlib
+import tempfile
+import threading
+from typing import BinaryIO, Optional, Union
+
+from Recruiter.models.schemas import StoredResume
+from Recruiter.utils.config.config_manager import ConfigManager
+from Recruiter.utils.file_utils.file_store import entry_paths, evict_entries, remove_file
+from Recruiter.utils.file_utils.path_manager import PathManager
+
+# Size of the chunks in which uploads are hashed and written
+CHUNK_SIZE = 1024 * 1024
+
+
+class ResumeStore:
+    """
+    Content-addressed store of uploaded resume files.
+    
+    Each upload is written once to '<content hash><extension>', so identical
+    uploads from any number of sessions share one file on disk. The files are
+    read back through memory maps, which the OS shares between processes.
+    """
+    
+    def __init__(self, store_dir: Optional[str] = None, max_entries: int = 100):
+        """
+        Initialize the resume store.
+        
+        Args:
+            store_dir: Directory for stored files. Defaults to 'data/cache/uploads'.
+            max_entries: Maximum number of files kept; the least recently
+                used are removed first.
+        """
+        self.store_dir = store_dir or PathManager().get_cache_dir('uploads')
+        os.makedirs(self.store_dir, exist_ok=True)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+    
+    def save(
+        self,
+        file_content: Union[bytes, memoryview, BinaryIO],
+        filename: str
+    ) -> StoredResume:
+        """
+        Store an uploaded resume.
+        
+        In-memory uploads are hashed and written through a view of their
+        buffer, and other file objects are copied in chunks, so the upload is
+        never held in memory as a second bytes object.
+        
+        Args:
+            file_content: Content of the file, a view of it, or a binary file object.
+            filename: Original name of the file.
+            
+        Returns:
+            Reference to the stored file.
+        """
+        extension = os.path.splitext(filename)[1].lower()
+        digest = hashlib.sha256()
+        fd, tmp_path = tempfile.mkstemp(dir=self.store_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                if isinstance(file_content, (bytes, bytearray, memoryview)):
+                    digest.update(file_content)
+                    f.write(file_content)
+                elif isinstance(file_content, io.BytesIO):
+                    with file_content.getbuffer() as view:
+                        digest.update(view)
+                        f.write(view)
+                else:
+                    file_content.seek(0)
+                    for chunk in iter(lambda: file_content.read(CHUNK_SIZE), b""):
+                        digest.update(chunk)
+                        f.write(chunk)
+            
+            content_hash = digest.hexdigest()
+            path = os.path.join(self.store_dir, f"{content_hash}{extension}")
+            with self._lock:
+                if os.path.exists(path):
+                    # Already stored by another session; refresh it for eviction
+                    os.utime(path)
+                    remove_file(tmp_path)
+                else:
+                    os.replace(tmp_path, path)
+                    evict_entries(entry_paths(self.store_dir), self.max_entries)
+        except Exception:
+            remove_file(tmp_path)
+            raise
+        
+        return StoredResume(content_hash=content_hash, path=path, filename=filename)
+    
+    def get(self, path: str) -> Optional[str]:
+        """
+        Look up a stored resume and mark it as just used.
+        
+        Eviction goes by modification time, so refreshing it on every
+        lookup keeps files that live sessions still use from being evicted
+        by uploads from other sessions.
+        
+        Args:
+            path: Path of the stored file, as returned by save.
+            
+        Returns:
+            The path, or None if the file is no longer stored.
+        """
+        with self._lock:
+            try:
+                os.utime(path)
+            except OSError:
+                return None
+        return path
+    
+
+
+_default_store: Optional[ResumeStore] = None
+_default_store_lock = threading.Lock()
+
+
+def get_resume_store() -> ResumeStore:
+    """
+    Get the shared resume store configured in config.toml.
+    
+    The store is configured by the optional 'max_uploads' key of the
+    [resume] section.
+    
+    Returns:
+        The shared ResumeStore instance.
+    """
+    global _default_store
+    
+    with _default_store_lock:
+        if _default_store is None:
+            settings = ConfigManager().get_section('resume')
+            _default_store = ResumeStore(max_entries=settings.get('max_uploads', 100))
+        return _default_store
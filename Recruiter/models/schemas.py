@@ -5,7 +5,7 @@ This module defines the Pydantic models used throughout the application
 for data validation and serialization.
 """
 
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field, EmailStr
 
 
@@ -51,6 +51,115 @@ class CoverLetterContent(BaseModel):
     )
 
 
+class EmailRevision(BaseModel):
+    """Schema for the fields changed when revising an email."""
+    
+    subject: Optional[str] = Field(
+        default=None,
+        description="Revised subject line, or null if unchanged"
+    )
+    body_text: Optional[str] = Field(
+        default=None,
+        description="Revised plain text email body, or null if unchanged"
+    )
+    body_html: Optional[str] = Field(
+        default=None,
+        description="Revised HTML email body, or null if unchanged"
+    )
+
+
+class CoverLetterRevision(BaseModel):
+    """Schema for the fields changed when revising a cover letter."""
+    
+    content_text: Optional[str] = Field(
+        default=None,
+        description="Revised plain text cover letter, or null if unchanged"
+    )
+    content_html: Optional[str] = Field(
+        default=None,
+        description="Revised HTML cover letter, or null if unchanged"
+    )
+
+
+class ResumeContact(BaseModel):
+    """Schema for the contact details on a resume."""
+    
+    name: Optional[str] = Field(default=None, description="Full name of the candidate")
+    email: Optional[str] = Field(default=None, description="Email address")
+    phone: Optional[str] = Field(default=None, description="Phone number")
+    location: Optional[str] = Field(default=None, description="City, region or country")
+    links: List[str] = Field(
+        default_factory=list,
+        description="Profile and portfolio URLs such as LinkedIn or GitHub"
+    )
+
+
+class ResumeExperience(BaseModel):
+    """Schema for one position in the work experience of a resume."""
+    
+    title: str = Field(..., description="Job title")
+    company: str = Field(..., description="Name of the employer")
+    start_date: Optional[str] = Field(default=None, description="Start date as written on the resume")
+    end_date: Optional[str] = Field(default=None, description="End date as written, or 'Present'")
+    highlights: List[str] = Field(
+        default_factory=list,
+        description="Achievements and responsibilities, one short sentence each"
+    )
+    technologies: List[str] = Field(
+        default_factory=list,
+        description="Tools and technologies used in the position"
+    )
+
+
+class ResumeEducation(BaseModel):
+    """Schema for one degree or qualification on a resume."""
+    
+    degree: str = Field(..., description="Degree or qualification")
+    institution: str = Field(..., description="School, college or university")
+    year: Optional[str] = Field(default=None, description="Graduation year or period")
+    details: Optional[str] = Field(default=None, description="Grade, honours or focus area")
+
+
+class ResumeProject(BaseModel):
+    """Schema for one project on a resume."""
+    
+    name: str = Field(..., description="Name of the project")
+    description: str = Field(..., description="One or two sentence summary of the project")
+    technologies: List[str] = Field(
+        default_factory=list,
+        description="Tools and technologies used in the project"
+    )
+
+
+class ParsedResume(BaseModel):
+    """Schema for the structured content of a resume."""
+    
+    contact: ResumeContact = Field(
+        default_factory=ResumeContact,
+        description="Contact details of the candidate"
+    )
+    summary: Optional[str] = Field(
+        default=None,
+        description="Professional summary in at most three sentences"
+    )
+    skills: List[str] = Field(
+        default_factory=list,
+        description="Individual skills, one per item"
+    )
+    experience: List[ResumeExperience] = Field(
+        default_factory=list,
+        description="Work experience, most recent first"
+    )
+    education: List[ResumeEducation] = Field(
+        default_factory=list,
+        description="Education, most recent first"
+    )
+    projects: List[ResumeProject] = Field(
+        default_factory=list,
+        description="Personal or professional projects"
+    )
+
+
 class EmailConfig(BaseModel):
     """Configuration for email sending functionality."""
     
@@ -90,3 +199,90 @@ class AppConfig(BaseModel):
     
     email: Optional[EmailConfig] = None
     api: Optional[APIConfig] = None
+
+
+class ModelProfile(BaseModel):
+    """Model settings for one language model task."""
+    
+    model: str = Field(
+        default="gpt-4o-mini",
+        description="Name of the language model"
+    )
+    temperature: float = Field(
+        default=0.2,
+        description="Temperature parameter for text generation"
+    )
+    max_tokens: Optional[int] = Field(
+        default=None,
+        description="Maximum number of completion tokens"
+    )
+    timeout: Optional[float] = Field(
+        default=None,
+        description="Request timeout in seconds before falling back"
+    )
+    fallback_model: Optional[str] = Field(
+        default=None,
+        description="Model used when a request to the primary model times out"
+    )
+
+
+class LLMCallRecord(BaseModel):
+    """Telemetry recorded for a single language model call."""
+    
+    component: str = Field(
+        ...,
+        description="Component that made the call (e.g., email, cover_letter, extraction, research)"
+    )
+    model: str = Field(
+        ...,
+        description="Name of the language model"
+    )
+    prompt_tokens: Optional[int] = Field(
+        default=None,
+        description="Number of prompt tokens reported by the provider"
+    )
+    completion_tokens: Optional[int] = Field(
+        default=None,
+        description="Number of completion tokens reported by the provider"
+    )
+    cached_prompt_tokens: Optional[int] = Field(
+        default=None,
+        description="Number of prompt tokens served from the provider's prompt cache"
+    )
+    wall_time: float = Field(
+        ...,
+        description="Wall time of the call in seconds, including queueing and retries"
+    )
+    time_to_first_token: Optional[float] = Field(
+        default=None,
+        description="Seconds until the first streamed token, for streaming calls"
+    )
+    success: bool = Field(
+        default=True,
+        description="Whether the call succeeded"
+    )
+    error: Optional[str] = Field(
+        default=None,
+        description="Error message if the call failed"
+    )
+    timestamp: float = Field(
+        ...,
+        description="Unix time at which the call started"
+    )
+
+
+class StoredResume(BaseModel):
+    """Reference to an uploaded resume stored on disk."""
+    
+    content_hash: str = Field(
+        ...,
+        description="SHA-256 digest of the file content"
+    )
+    path: str = Field(
+        ...,
+        description="Path to the stored file"
+    )
+    filename: str = Field(
+        ...,
+        description="Original name of the uploaded file"
+    )
@@ -4,6 +4,9 @@ Company Research Prompts for RecruitReach.
 This module contains prompts used for company research and job description analysis.
 """
 
+from Recruiter.prompts.prompt_layout import PromptLayout
+
+
 # Prompt for researching a company
 COMPANY_RESEARCH_PROMPT = """
 You are a helpful assistant that provides information about companies.
@@ -43,5 +46,13 @@ Given the following job description, please extract the company name,
 recruiter email, and job position. Return the results in a structured format.
 double check the details of comapny name does not look like the company name leave it blank
 If you are not sure about any of these details, leave them blank.
-{job_description}
+The job description is provided in the user message.
 """
+
+# Job details extraction prompt: static instructions followed by the job description.
+# Every input is a different job, so only the short instructions are shared
+# and the prompt is not expected to reach the prompt cache
+JOB_DETAILS_EXTRACTION_LAYOUT = PromptLayout(
+    instructions=JOB_DETAILS_EXTRACTION_PROMPT,
+    sections=[("JOB DESCRIPTION", "job_description")]
+)
@@ -4,38 +4,19 @@ Cover Letter Prompts for RecruitReach.
 This module contains prompts used for generating cover letters.
 """
 
-# Base prompt for cover letter generation
-COVER_LETTER_GENERATION_PROMPT = """
-You are an expert cover letter writer with extensive experience in crafting compelling, personalized cover letters that help job seekers stand out.
-
-# INPUT DATA
-## Resume Data
-```
-{resume_data}
-```
+from Recruiter.prompts.prompt_layout import PromptLayout
 
-## Job Description
-```
-{job_description}
-```
 
-## Company Information
-```
-{company_info}
-```
-
-## Position
-{position}
-
-## Company Name
-{company_name}
+# Instructions for cover letter generation
+COVER_LETTER_GENERATION_PROMPT = """
+You are an expert cover letter writer with extensive experience in crafting compelling, personalized cover letters that help job seekers stand out.
 
 # TASK
-Create a professional, personalized cover letter for the job application based on the provided resume, job description, and company information. The cover letter should:
+Create a professional, personalized cover letter for the job application based on the resume, job description, and company information provided in the user message. The cover letter should:
 
 1. Be addressed to the hiring manager or relevant recipient
 2. Have a compelling introduction that grabs attention and mentions the specific position
-3. Highlight 2-3 key qualifications from the resume that directly match the job requirements
+3. Highlight 2-3 key qualifications from the resume that directly match the job requirements, starting from the resume highlights matching the job when they are given
 4. Demonstrate knowledge of the company by referencing specific company values, projects, or achievements
 5. Explain why the candidate is a good fit for both the role and the company culture
 6. Include a strong closing paragraph with a call to action
@@ -52,12 +33,53 @@ Return the cover letter in two formats:
 For the HTML version, include appropriate CSS styling to make the cover letter visually appealing and professional. Use a clean, modern design with proper spacing, font choices, and subtle styling.
 """
 
-# Additional prompt section for feedback
-COVER_LETTER_FEEDBACK_PROMPT = """
+# Cover letter generation prompt: static instructions and the job-independent
+# resume, which together form the prefix shared by every job, then the per-job inputs
+COVER_LETTER_GENERATION_LAYOUT = PromptLayout(
+    instructions=COVER_LETTER_GENERATION_PROMPT,
+    sections=[
+        ("Resume Data", "resume_data"),
+        ("Company Information", "company_info"),
+        ("Company Name", "company_name"),
+        ("Job Description", "job_description"),
+        ("Resume Highlights Matching This Job", "resume_highlights"),
+        ("Position", "position"),
+        ("Feedback For Regeneration (incorporate this feedback when regenerating the cover letter)", "feedback")
+    ],
+    optional=["resume_highlights", "feedback"],
+    section_format="## {heading}\n```\n{placeholder}\n```",
+    stable=["resume_data"],
+    name="cover letter generation"
+)
 
-# FEEDBACK FOR REGENERATION
-Please incorporate the following feedback when regenerating the cover letter:
-```
-{feedback}
-```
+# Instructions for revising an existing cover letter
+COVER_LETTER_REVISION_PROMPT = """
+You are an expert cover letter writer revising a cover letter that has already been written.
+
+# INPUT DATA
+You will receive the current draft as JSON with two fields:
+- content_text: the plain text cover letter
+- content_html: the HTML cover letter with CSS styling
+
+and the changes requested by the candidate.
+
+# TASK
+1. Apply only the requested changes. Keep all other wording, facts, structure and styling exactly as they are
+2. Keep the cover letter professional, personalized and concise (300-400 words maximum)
+3. Keep the date, addresses, salutation and signature unless the changes ask otherwise
+
+# OUTPUT FORMAT
+Return only the fields that change and leave unchanged fields null. If you change the
+letter's content, return both content_text and content_html so the two versions stay consistent.
 """
+
+# Cover letter revision prompt: the static instructions are followed by the draft.
+# The prompt is short, so it is not expected to reach the prompt cache
+COVER_LETTER_REVISION_LAYOUT = PromptLayout(
+    instructions=COVER_LETTER_REVISION_PROMPT,
+    sections=[
+        ("Current Draft", "draft"),
+        ("Requested Changes", "feedback")
+    ],
+    section_format="## {heading}\n```\n{placeholder}\n```"
+)
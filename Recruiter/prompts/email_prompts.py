@@ -4,7 +4,10 @@ Email Prompts for RecruitReach.
 This module contains prompts used for generating emails.
 """
 
-# Base prompt for email generation
+from Recruiter.prompts.prompt_layout import PromptLayout
+
+
+# Instructions for email generation
 EMAIL_GENERATION_PROMPT = """
 You are a highly professional assistant helping me write a recruiter outreach email for an open position and then convert it into a well-designed HTML format.
 
@@ -13,7 +16,7 @@ my email id is raviahuja1998@gmail.com
 ### Part 1: Generate a Professional Recruiter Outreach Email
 
 I will provide:
-1. My resume details.
+1. My resume details, and sometimes the resume highlights that match this job.
 2. The job description (JD).
 3. A brief overview of the company.
 4. Recruiter email and job source.
@@ -66,25 +69,56 @@ Guidelines:
 - Ensure accessibility: good contrast, alt text (if images are used), and simple structure.
 - Do Not Generate Footer, Header.
 
-Inputs:
-COMPANY NAME: {company_name}
-RECRUITER EMAIL: {recruiter_email}
-JOB POSITION: {job_position}
-JOB SOURCE: {job_source}
-
-RESUME DETAILS:
-{resume_details}
-
-JOB DESCRIPTION:
-{job_description}
-
-COMPANY OVERVIEW:
-{company_overview}
+The inputs are provided in the user message.
 """
 
-# Additional prompt section for feedback
-EMAIL_FEEDBACK_PROMPT = """
-FEEDBACK FOR REGENERATION:
-Please incorporate the following feedback when regenerating the email:
-{feedback}
+# Email generation prompt: static instructions and the job-independent resume,
+# which together form the prefix shared by every job, then the per-job inputs
+EMAIL_GENERATION_LAYOUT = PromptLayout(
+    instructions=EMAIL_GENERATION_PROMPT,
+    sections=[
+        ("RESUME DETAILS", "resume_details"),
+        ("COMPANY OVERVIEW", "company_overview"),
+        ("COMPANY NAME", "company_name"),
+        ("JOB DESCRIPTION", "job_description"),
+        ("RESUME HIGHLIGHTS MATCHING THIS JOB", "resume_highlights"),
+        ("JOB POSITION", "job_position"),
+        ("RECRUITER EMAIL", "recruiter_email"),
+        ("JOB SOURCE", "job_source"),
+        ("FEEDBACK FOR REGENERATION (incorporate this feedback when regenerating the email)", "feedback")
+    ],
+    optional=["resume_highlights", "feedback"],
+    stable=["resume_details"],
+    name="email generation"
+)
+
+# Instructions for revising an existing email
+EMAIL_REVISION_PROMPT = """
+You are a highly professional assistant revising a recruiter outreach email that has already been written.
+
+You will receive the current draft as JSON with three fields:
+- subject: the subject line
+- body_text: the plain text email body
+- body_html: the HTML email body
+
+and the changes requested by the sender.
+
+Your task:
+- Apply only the requested changes. Keep all other wording, facts, structure and styling exactly as they are.
+- Return only the fields that change. Leave unchanged fields null.
+- If you change the email body, return both body_text and body_html so the two versions stay consistent.
+- The HTML body must start with `<!DOCTYPE html>`, use inline CSS and contain only the code.
+- Do not add the subject line to the email body.
+- Keep the email polite, confident, concise and personalized.
+- Double-check the position title and company name.
 """
+
+# Email revision prompt: the static instructions are followed by the draft.
+# The prompt is short, so it is not expected to reach the prompt cache
+EMAIL_REVISION_LAYOUT = PromptLayout(
+    instructions=EMAIL_REVISION_PROMPT,
+    sections=[
+        ("CURRENT DRAFT", "draft"),
+        ("REQUESTED CHANGES", "feedback")
+    ]
+)
@@ -0,0 +1,158 @@
+"""
+Prompt Layout for RecruitReach.
+
+This module assembles prompts with the static instructions first and the
+per-request input sections last, in a fixed order, so repeated calls share
+the longest possible prefix. The provider only caches that prefix once it
+reaches MIN_CACHEABLE_PREFIX_TOKENS, which layouts check at runtime.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from Recruiter.utils.text.token_counter import count_tokens
+
+
+# OpenAI only caches prompts whose shared prefix is at least this long
+MIN_CACHEABLE_PREFIX_TOKENS = 1024
+
+
+class PromptLayout:
+    """
+    Prompt split into static instructions and variable input sections.
+    
+    The instructions become the system message and never contain template
+    variables, so they are byte-identical on every call. The input sections
+    become the human message, ordered from the most to the least reused
+    input so consecutive requests also share the start of that message.
+    Leading sections marked stable (such as a job-independent resume) count
+    towards the shared prefix.
+    """
+    
+    def __init__(
+        self,
+        instructions: str,
+        sections: List[Tuple[str, str]],
+        optional: Iterable[str] = (),
+        section_format: str = "{heading}:\n{placeholder}",
+        stable: Iterable[str] = (),
+        name: str = "prompt"
+    ):
+        """
+        Initialize the prompt layout.
+        
+        Args:
+            instructions: Static instructions. Braces are escaped, so they are
+                never treated as template variables.
+            sections: (heading, variable name) pairs in the order they are sent.
+            optional: Variable names whose sections are left out when empty.
+            section_format: Format of one section, with 'heading' and
+                'placeholder' fields.
+            stable: Variable names whose values repeat across requests. Only
+                stable sections at the start of the message are shared.
+            name: Name of the prompt used in messages.
+        """
+        self.instructions = instructions
+        self.sections = list(sections)
+        self.optional = set(optional)
+        self.section_format = section_format
+        self.stable = set(stable)
+        self.name = name
+        self._prefix_tokens: Optional[int] = None
+        self._warned = False
+    
+    @property
+    def system_template(self) -> str:
+        """Template for the static system message."""
+        return self.instructions.replace("{", "{{").replace("}", "}}")
+    
+    @property
+    def variables(self) -> List[str]:
+        """Names of the input variables, in section order."""
+        return [variable for _, variable in self.sections]
+    
+    @property
+    def prefix_tokens(self) -> int:
+        """Number of tokens in the static prefix shared by every call."""
+        if self._prefix_tokens is None:
+            self._prefix_tokens = count_tokens(self.instructions)
+        return self._prefix_tokens
+    
+    def shared_prefix_tokens(self, input_variables: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Count the tokens shared by requests with the same stable inputs.
+        
+        Args:
+            input_variables: Input variables for the request.
+        
+        Returns:
+            Tokens in the instructions plus the leading stable sections.
+        """
+        input_variables = input_variables or {}
+        stable_sections = []
+        for heading, variable in self._included_sections(input_variables):
+            if variable not in self.stable:
+                break
+            stable_sections.append(self.section_format.format(
+                heading=heading,
+                placeholder=input_variables.get(variable, "")
+            ))
+        
+        tokens = self.prefix_tokens
+        if stable_sections:
+            tokens += count_tokens("\n\n".join(stable_sections))
+        return tokens
+    
+    def is_cacheable(self, input_variables: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Check whether the shared prefix is long enough for prompt caching.
+        
+        Args:
+            input_variables: Input variables for the request.
+        
+        Returns:
+            True if the shared prefix reaches MIN_CACHEABLE_PREFIX_TOKENS.
+        """
+        return self.shared_prefix_tokens(input_variables) >= MIN_CACHEABLE_PREFIX_TOKENS
+    
+    def check_cacheable(self, input_variables: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Check a request's shared prefix and report once if it is too short.
+        
+        Args:
+            input_variables: Input variables for the request.
+        
+        Returns:
+            True if the shared prefix is long enough for prompt caching.
+        """
+        tokens = self.shared_prefix_tokens(input_variables)
+        cacheable = tokens >= MIN_CACHEABLE_PREFIX_TOKENS
+        if not cacheable and not self._warned:
+            self._warned = True
+            print(
+                f"Prompt prefix for {self.name} is {tokens} tokens, below the "
+                f"{MIN_CACHEABLE_PREFIX_TOKENS} tokens needed for prompt caching"
+            )
+        return cacheable
+    
+    def human_template(self, input_variables: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Get the template for the human message.
+        
+        Args:
+            input_variables: Input variables for the request. Optional sections
+                are only included when their variable is set.
+        
+        Returns:
+            Template with one section per input variable.
+        """
+        return "\n\n".join(
+            self.section_format.format(heading=heading, placeholder="{" + variable + "}")
+            for heading, variable in self._included_sections(input_variables or {})
+        )
+    
+    def _included_sections(self, input_variables: Dict[str, Any]) -> List[Tuple[str, str]]:
+        """Get the sections sent for a request, leaving out empty optional ones."""
+        return [
+            (heading, variable) for heading, variable in self.sections
+            if variable not in self.optional or input_variables.get(variable)
+        ]
@@ -0,0 +1,30 @@
+"""
+Resume Prompts for RecruitReach.
+
+This module contains prompts used for extracting structured data from resumes.
+"""
+
+from Recruiter.prompts.prompt_layout import PromptLayout
+
+
+# Instructions for resume extraction
+RESUME_EXTRACTION_PROMPT = """
+You extract the content of a resume into a structured format.
+The resume text is provided in the user message. It was extracted from a PDF
+or DOCX file, so columns, headers and bullet points may be out of order or
+split across lines; reconstruct each entry from its context.
+
+Rules:
+- Copy facts from the resume only. Never invent or embellish anything.
+- List every skill as a separate item, without proficiency levels.
+- Keep each experience highlight to one short sentence with its numbers and results.
+- Order experience and education from most recent to oldest.
+- Leave a field empty if the resume does not contain it.
+"""
+
+# Resume extraction prompt: static instructions followed by the resume.
+# Each resume is extracted once, so the prompt is not expected to reach the prompt cache
+RESUME_EXTRACTION_LAYOUT = PromptLayout(
+    instructions=RESUME_EXTRACTION_PROMPT,
+    sections=[("RESUME", "resume")]
+)
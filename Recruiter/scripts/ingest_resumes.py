@@ -0,0 +1,156 @@
+"""
+Script to ingest a directory of resumes into the parse cache.
+
+This script parses every PDF and DOCX resume in a directory with a pool of
+worker processes and stores the normalized text and its metadata in the
+resume parse cache, so the resumes load instantly in the application.
+
+Usage:
+    python -m Recruiter.scripts.ingest_resumes <directory> [--workers N] [--recursive] [--allow-eviction]
+"""
+
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from Recruiter.core.resume.parse_cache import get_resume_parse_cache
+from Recruiter.core.resume.resume_parser import ResumeParser
+
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx')
+
+
+def find_resumes(directory: str, recursive: bool = False) -> List[str]:
+    """
+    Find the resume files in a directory.
+    
+    Args:
+        directory: Directory to search.
+        recursive: Whether to search subdirectories too.
+    
+    Returns:
+        Sorted paths of the PDF and DOCX files.
+    """
+    pattern = '**/*' if recursive else '*'
+    return sorted(
+        str(path) for path in Path(directory).glob(pattern)
+        if path.is_file() and path.suffix.lower() in SUPPORTED_EXTENSIONS
+    )
+
+
+def ingest_resume(file_path: str) -> Dict[str, Any]:
+    """
+    Parse a resume into the parse cache in a worker process.
+    
+    Args:
+        file_path: Path to the resume file.
+    
+    Returns:
+        Result with the file path, status ('parsed', 'cached', 'not cached'
+        when the parse cache is disabled, or 'failed'), elapsed seconds,
+        number of characters and error message.
+    """
+    start_time = time.perf_counter()
+    result = {"file_path": file_path, "status": "failed", "seconds": 0.0, "characters": 0, "error": None}
+    try:
+        parser = ResumeParser()
+        # Files are already spread across processes
+        parser.parallel_page_threshold = None
+        cached = parser.is_cached(file_path)
+        text = parser.load_resume_from_file(file_path)
+        if parser.cache is None:
+            result["status"] = "not cached"
+        else:
+            result["status"] = "cached" if cached else "parsed"
+        result["characters"] = len(text)
+    except Exception as e:
+        result["error"] = str(e)
+    result["seconds"] = time.perf_counter() - start_time
+    return result
+
+
+def ingest_resumes(file_paths: List[str], max_workers: int) -> List[Dict[str, Any]]:
+    """
+    Ingest resumes in parallel, printing each result as it completes.
+    
+    Args:
+        file_paths: Paths of the resume files.
+        max_workers: Number of worker processes.
+    
+    Returns:
+        Results of ingest_resume in completion order.
+    """
+    results = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(ingest_resume, file_path) for file_path in file_paths]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            
+            line = f"{result['status']:<11}{result['seconds']:>8.2f}s  {result['file_path']}"
+            if result["error"]:
+                line += f"  ({result['error']})"
+            print(line)
+    return results
+
+
+def main() -> int:
+    """
+    Run the ingestion from the command line.
+    
+    Returns:
+        Exit code: 0 if every file was ingested, 1 otherwise.
+    """
+    arg_parser = argparse.ArgumentParser(description="Parse a directory of resumes into the parse cache.")
+    arg_parser.add_argument("directory", help="Directory containing PDF and DOCX resumes")
+    arg_parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Number of worker processes")
+    arg_parser.add_argument("--recursive", action="store_true", help="Include subdirectories")
+    arg_parser.add_argument(
+        "--allow-eviction",
+        action="store_true",
+        help="Ingest even if there are more resumes than the cache holds"
+    )
+    args = arg_parser.parse_args()
+    
+    if not os.path.isdir(args.directory):
+        print(f"Directory not found: {args.directory}")
+        return 1
+    
+    file_paths = find_resumes(args.directory, args.recursive)
+    if not file_paths:
+        print(f"No PDF or DOCX resumes found in {args.directory}")
+        return 0
+    
+    cache = get_resume_parse_cache()
+    if cache is None:
+        print("The resume parse cache is disabled in [resume_cache]; resumes will be parsed but not cached")
+    elif len(file_paths) > cache.max_disk_entries and not args.allow_eviction:
+        # The cache keeps only the newest entries, so the first resumes would be evicted
+        print(
+            f"{len(file_paths)} resumes exceed the cache capacity of {cache.max_disk_entries} "
+            f"(max_disk_entries in [resume_cache]). Raise the capacity or pass --allow-eviction."
+        )
+        return 1
+    
+    start_time = time.perf_counter()
+    results = ingest_resumes(file_paths, max(1, args.workers or 1))
+    elapsed = time.perf_counter() - start_time
+    
+    statuses = ("parsed", "cached", "not cached", "failed")
+    counts = {status: sum(result["status"] == status for result in results) for status in statuses}
+    print(
+        f"\n{len(results)} resumes in {elapsed:.2f}s: "
+        f"{counts['parsed']} parsed, {counts['cached']} already cached, "
+        f"{counts['not cached']} not cached, {counts['failed']} failed"
+    )
+    return 1 if counts["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
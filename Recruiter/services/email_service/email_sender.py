@@ -5,9 +5,11 @@ This module provides a service for sending emails with HTML content and attachme
 """
 
 import os
+import base64
 import smtplib
 from io import BytesIO
 from typing import Union, Optional, Dict, Any
+from email import encoders
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.application import MIMEApplication
@@ -15,6 +17,7 @@ from email.utils import formataddr
 
 from Recruiter.models.schemas import EmailConfig
 from Recruiter.utils.config.config_manager import ConfigManager
+from Recruiter.utils.file_utils.mapped_file import map_file
 
 
 class EmailSenderService:
@@ -66,7 +69,7 @@ class EmailSenderService:
         receiver_email: str,
         subject: str,
         html_body: str,
-        attachment: Optional[Union[str, bytes, BytesIO]] = None,
+        attachment: Optional[Union[str, bytes, memoryview, BytesIO]] = None,
         attachment_filename: Optional[str] = None,
         attachment_type: str = "application/pdf"
     ) -> bool:
@@ -77,7 +80,9 @@ class EmailSenderService:
             receiver_email: Recipient's email address.
             subject: Email subject.
             html_body: HTML content for email body.
-            attachment: Optional attachment as file path, bytes, or BytesIO.
+            attachment: Optional attachment as file path, bytes, memoryview, or
+                BytesIO. Files are memory-mapped and encoded without reading
+                them into memory first.
             attachment_filename: Name for the attachment file.
             attachment_type: MIME type of the attachment.
             
@@ -103,18 +108,22 @@ class EmailSenderService:
             # Handle attachment if provided
             if attachment:
                 try:
-                    # Get attachment content based on type
+                    # Encode attachment content based on type
                     if isinstance(attachment, str):  # File path
                         if os.path.exists(attachment):
-                            with open(attachment, "rb") as file:
-                                attachment_content = file.read()
+                            with map_file(attachment) as content:
+                                attachment_part = self._create_attachment_part(content, attachment_type)
                         else:
                             print(f"Attachment file not found: {attachment}")
                             return False
                     elif isinstance(attachment, BytesIO):  # BytesIO
-                        attachment_content = attachment.read()
-                    else:  # Bytes
-                        attachment_content = attachment
+                        with attachment.getbuffer() as buffer:
+                            attachment_part = self._create_attachment_part(
+                                buffer[attachment.tell():],
+                                attachment_type
+                            )
+                    else:  # Bytes or memoryview
+                        attachment_part = self._create_attachment_part(attachment, attachment_type)
                     
                     # Determine attachment filename
                     if not attachment_filename:
@@ -123,8 +132,6 @@ class EmailSenderService:
                         else:
                             attachment_filename = "attachment.pdf"
                     
-                    # Create attachment part
-                    attachment_part = MIMEApplication(attachment_content, _subtype=attachment_type.split('/')[-1])
                     attachment_part.add_header(
                         "Content-Disposition",
                         f"attachment; filename={attachment_filename}"
@@ -147,6 +154,33 @@ class EmailSenderService:
             print(f"Failed to send email: {str(e)}")
             return False
     
+    @staticmethod
+    def _create_attachment_part(
+        content: Union[bytes, memoryview],
+        attachment_type: str
+    ) -> MIMEApplication:
+        """
+        Create a base64 encoded attachment part.
+        
+        The content is encoded straight from the given buffer instead of being
+        copied into the message first.
+        
+        Args:
+            content: Attachment content as bytes or a view of it.
+            attachment_type: MIME type of the attachment.
+            
+        Returns:
+            MIME part with the encoded content.
+        """
+        encoded = base64.encodebytes(content).decode('ascii')
+        attachment_part = MIMEApplication(
+            encoded,
+            _subtype=attachment_type.split('/')[-1],
+            _encoder=encoders.encode_noop
+        )
+        attachment_part['Content-Transfer-Encoding'] = 'base64'
+        return attachment_part
+    
     @classmethod
     def from_config(cls) -> 'EmailSenderService':
         """
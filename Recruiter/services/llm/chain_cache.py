@@ -0,0 +1,81 @@
+"""
+Chain Cache for RecruitReach.
+
+This module provides an LRU cache of compiled prompt chains so that prompt
+templates and structured output schemas are only processed once.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+
+class ChainCache:
+    """
+    LRU cache of compiled chains.
+    
+    Entries are keyed by the model client, the template and the output
+    schema. The client is held by each entry so its id cannot be reused
+    while the entry is alive.
+    """
+    
+    def __init__(self, max_size: int = 64):
+        """
+        Initialize the chain cache.
+        
+        Args:
+            max_size: Maximum number of compiled chains to keep.
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[Tuple[int, Hashable, Optional[Type[BaseModel]]], Tuple[Any, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get_or_build(
+        self,
+        llm: Any,
+        template: Hashable,
+        output_schema: Optional[Type[BaseModel]],
+        builder: Callable[[], Any]
+    ) -> Any:
+        """
+        Get a compiled chain, building it on a miss.
+        
+        Args:
+            llm: Model client the chain is bound to.
+            template: Template, or tuple of templates, the chain was built from.
+            output_schema: Optional Pydantic model for structured output.
+            builder: Function that builds the value to cache.
+        
+        Returns:
+            The cached or newly built value.
+        """
+        key = (id(llm), template, output_schema)
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is llm:
+                self._entries.move_to_end(key)
+                return entry[1]
+        
+        value = builder()
+        
+        with self._lock:
+            self._entries[key] = (llm, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return value
+    
+    def clear(self) -> None:
+        """Remove all compiled chains."""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        """Get the number of cached chains."""
+        return len(self._entries)
+
+
+chain_cache = ChainCache()
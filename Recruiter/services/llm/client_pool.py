@@ -0,0 +1,228 @@
+"""
+LLM Client Pool for RecruitReach.
+
+This module provides a process-wide registry of language model clients
+that share keep-alive HTTP connection pools.
+"""
+
+import asyncio
+import hashlib
+import threading
+import weakref
+from typing import Dict, Optional, Tuple
+
+import httpx
+import openai
+from langchain_core.runnables import Runnable
+from langchain_openai import ChatOpenAI
+
+from Recruiter.utils.config.config_manager import ConfigManager
+
+
+class LoopLocalAsyncTransport(httpx.AsyncBaseTransport):
+    """
+    Async HTTP transport with a separate connection pool per event loop.
+    
+    Pooled connections belong to the event loop that opened them, so one
+    shared pool fails once that loop is closed (for example by a second
+    asyncio.run call). This transport routes each request to a pool owned
+    by the running loop, creating it on first use.
+    """
+    
+    def __init__(self, limits: httpx.Limits):
+        """
+        Initialize the transport.
+        
+        Args:
+            limits: Connection limits for each event loop's pool.
+        """
+        self.limits = limits
+        self._transports: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """
+        Send a request through the running event loop's connection pool.
+        
+        Args:
+            request: Request to send.
+        
+        Returns:
+            Response from the server.
+        """
+        return await self._get_transport().handle_async_request(request)
+    
+    async def aclose(self) -> None:
+        """Close the connection pool of the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            transport = self._transports.pop(loop, None)
+        if transport is not None:
+            await transport.aclose()
+    
+    def close_all(self) -> None:
+        """
+        Close every event loop's connection pool from synchronous code.
+        
+        Pools of running loops are closed on their loop; pools of closed
+        loops are dropped, since their connections cannot be used anymore.
+        """
+        with self._lock:
+            transports = list(self._transports.items())
+            self._transports.clear()
+        
+        for loop, transport in transports:
+            if loop.is_closed():
+                continue
+            if loop.is_running():
+                asyncio.run_coroutine_threadsafe(transport.aclose(), loop)
+            else:
+                loop.run_until_complete(transport.aclose())
+    
+    def _get_transport(self) -> httpx.AsyncHTTPTransport:
+        """Get the running loop's transport, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            transport = self._transports.get(loop)
+            if transport is None:
+                transport = httpx.AsyncHTTPTransport(limits=self.limits)
+                self._transports[loop] = transport
+            return transport
+
+
+_clients: Dict[Tuple, Runnable] = {}
+_http_client: Optional[httpx.Client] = None
+_http_async_client: Optional[httpx.AsyncClient] = None
+_async_transport: Optional[LoopLocalAsyncTransport] = None
+_lock = threading.Lock()
+
+
+def get_chat_model(
+    model_name: str,
+    temperature: float,
+    api_key: str,
+    max_tokens: Optional[int] = None,
+    timeout: Optional[float] = None,
+    fallback_model: Optional[str] = None
+) -> Runnable:
+    """
+    Get a shared chat model client.
+    
+    Clients are keyed by (API key hash, model, temperature, max tokens,
+    timeout, fallback model) and all of them send requests through the same
+    pooled HTTP clients, so connections and TLS sessions are reused across
+    generators and Streamlit reruns.
+    
+    Args:
+        model_name: Name of the language model to use.
+        temperature: Temperature parameter for text generation.
+        api_key: OpenAI API key.
+        max_tokens: Maximum number of completion tokens, or None for the model default.
+        timeout: Request timeout in seconds, or None for the pool default.
+        fallback_model: Model to retry a request with when it times out.
+    
+    Returns:
+        ChatOpenAI instance for the given parameters, wrapped with the
+        fallback model if one is given.
+    """
+    key = (_hash_api_key(api_key), model_name, temperature, max_tokens, timeout, fallback_model)
+    
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _create_chat_model(model_name, temperature, api_key, max_tokens, timeout)
+            if fallback_model:
+                # The fallback runs without the primary's timeout
+                fallback = _create_chat_model(fallback_model, temperature, api_key, max_tokens, None)
+                client = client.with_fallbacks(
+                    [fallback],
+                    exceptions_to_handle=(openai.APITimeoutError,)
+                )
+            _clients[key] = client
+        return client
+
+
+def clear_pool() -> None:
+    """Drop all pooled clients and close the shared HTTP connections."""
+    global _http_client, _http_async_client, _async_transport
+    
+    with _lock:
+        _clients.clear()
+        if _http_client is not None:
+            _http_client.close()
+        if _async_transport is not None:
+            _async_transport.close_all()
+        _http_client = None
+        _http_async_client = None
+        _async_transport = None
+
+
+def _create_chat_model(
+    model_name: str,
+    temperature: float,
+    api_key: str,
+    max_tokens: Optional[int],
+    timeout: Optional[float]
+) -> ChatOpenAI:
+    """
+    Create a chat model client on the shared HTTP clients. Caller holds the lock.
+    
+    Args:
+        model_name: Name of the language model to use.
+        temperature: Temperature parameter for text generation.
+        api_key: OpenAI API key.
+        max_tokens: Maximum number of completion tokens, or None for the model default.
+        timeout: Request timeout in seconds, or None for the pool default.
+    
+    Returns:
+        New ChatOpenAI instance.
+    """
+    http_client, http_async_client = _get_http_clients()
+    return ChatOpenAI(
+        model=model_name,
+        temperature=temperature,
+        api_key=api_key,
+        max_tokens=max_tokens,
+        timeout=timeout,
+        # Retries are handled by the rate limit scheduler
+        max_retries=0,
+        # Report token usage for streamed responses too
+        stream_usage=True,
+        http_client=http_client,
+        http_async_client=http_async_client
+    )
+
+
+def _get_http_clients() -> Tuple[httpx.Client, httpx.AsyncClient]:
+    """
+    Get the shared HTTP clients, creating them on first use.
+    
+    Pool limits are read from the optional [llm] section of config.toml
+    ('max_connections', 'max_keepalive_connections' and 'keepalive_expiry').
+    
+    Returns:
+        Tuple of the sync and async HTTP clients.
+    """
+    global _http_client, _http_async_client, _async_transport
+    
+    if _http_client is None or _http_async_client is None:
+        settings = ConfigManager().get_section('llm')
+        limits = httpx.Limits(
+            max_connections=settings.get('max_connections', 20),
+            max_keepalive_connections=settings.get('max_keepalive_connections', 10),
+            keepalive_expiry=settings.get('keepalive_expiry', 30.0)
+        )
+        # Same default timeout as the OpenAI SDK uses for its own clients
+        timeout = httpx.Timeout(600.0, connect=5.0)
+        _http_client = httpx.Client(limits=limits, timeout=timeout)
+        # Async connections are pooled per event loop, see LoopLocalAsyncTransport
+        _async_transport = LoopLocalAsyncTransport(limits)
+        _http_async_client = httpx.AsyncClient(transport=_async_transport, timeout=timeout)
+    return _http_client, _http_async_client
+
+
+def _hash_api_key(api_key: str) -> str:
+    """Hash an API key so the raw key is never used as a registry key."""
+    return hashlib.sha256(api_key.encode('utf-8')).hexdigest()
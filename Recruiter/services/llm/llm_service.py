@@ -5,15 +5,28 @@ This module provides a service for interacting with language models.
 """
 
 import os
-from typing import Any, Optional, Type, TypeVar, Dict
+import asyncio
+from typing import Any, Awaitable, Callable, Optional, Type, TypeVar, Dict, Iterator, List, Tuple
 
-from langchain_openai import ChatOpenAI
+from langchain_core.messages import AIMessage
 from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import RunnableLambda
 from pydantic import BaseModel
 
 from Recruiter.utils.config.config_manager import ConfigManager
+from Recruiter.services.llm.chain_cache import chain_cache
+from Recruiter.services.llm.client_pool import get_chat_model
+from Recruiter.services.llm.model_router import get_model_profile
+from Recruiter.services.llm.rate_limiter import get_scheduler
+from Recruiter.services.llm.response_cache import ResponseCache
+from Recruiter.services.llm.telemetry import CallTracker, MetricsSink, get_metrics_sink
+from Recruiter.utils.text.token_counter import count_tokens
 
 T = TypeVar('T', bound=BaseModel)
+R = TypeVar('R')
+
+# Completion tokens reserved against the tokens-per-minute budget per call
+COMPLETION_TOKEN_ESTIMATE = 1000
 
 
 class LLMService:
@@ -28,7 +41,13 @@ class LLMService:
         self,
         model_name: str = "gpt-4o-mini",
         temperature: float = 0.2,
-        api_key: Optional[str] = None
+        api_key: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        component: str = "general",
+        metrics_sink: Optional[MetricsSink] = None,
+        max_tokens: Optional[int] = None,
+        timeout: Optional[float] = None,
+        fallback_model: Optional[str] = None
     ):
         """
         Initialize the language model service.
@@ -37,9 +56,20 @@ class LLMService:
             model_name: Name of the language model to use.
             temperature: Temperature parameter for text generation.
             api_key: OpenAI API key. If not provided, will try to get from config.
+            cache: Optional response cache for generate_with_template.
+            component: Name of the calling component, recorded with each call.
+            metrics_sink: Sink for call telemetry. Defaults to the process-wide sink.
+            max_tokens: Maximum number of completion tokens, or None for the model default.
+            timeout: Request timeout in seconds, or None for the default.
+            fallback_model: Model to retry a request with when it times out.
         """
         self.model_name = model_name
         self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.fallback_model = fallback_model
+        self.cache = cache
+        self.component = component
+        self.metrics_sink = metrics_sink or get_metrics_sink()
         
         # Get API key from config if not provided
         if api_key is None:
@@ -49,11 +79,49 @@ class LLMService:
         if not api_key:
             raise ValueError("OpenAI API key not provided and not found in config")
         
-        # Initialize the language model
-        self.llm = ChatOpenAI(
-            model=model_name,
+        # Get the shared language model client
+        self.llm = get_chat_model(
+            model_name=model_name,
             temperature=temperature,
-            api_key=api_key
+            api_key=api_key,
+            max_tokens=max_tokens,
+            timeout=timeout,
+            fallback_model=fallback_model
+        )
+        
+        # Shared scheduler for the key's rate limits and retries
+        self.scheduler = get_scheduler(api_key)
+    
+    @classmethod
+    def for_task(
+        cls,
+        task: str,
+        api_key: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        component: Optional[str] = None
+    ) -> "LLMService":
+        """
+        Create a service using the model profile configured for a task.
+        
+        Args:
+            task: Task name (extraction, research, email, cover_letter or regeneration).
+            api_key: OpenAI API key. If not provided, will try to get from config.
+            cache: Optional response cache for generate_with_template.
+            component: Name recorded with each call. Defaults to the task name.
+            
+        Returns:
+            LLMService configured for the task.
+        """
+        profile = get_model_profile(task)
+        return cls(
+            model_name=profile.model,
+            temperature=profile.temperature,
+            api_key=api_key,
+            cache=cache,
+            component=component or task,
+            max_tokens=profile.max_tokens,
+            timeout=profile.timeout,
+            fallback_model=profile.fallback_model
         )
     
     def generate_text(self, prompt: str) -> str:
@@ -66,14 +134,35 @@ class LLMService:
         Returns:
             Generated text.
         """
-        response = self.llm.invoke(prompt)
+        response = self._call(
+            lambda config: self.llm.invoke(prompt, config=config),
+            self._estimate_tokens(prompt)
+        )
+        return response.content
+    
+    async def agenerate_text(self, prompt: str) -> str:
+        """
+        Generate text using the language model asynchronously.
+        
+        Args:
+            prompt: Prompt for text generation.
+            
+        Returns:
+            Generated text.
+        """
+        response = await self._acall(
+            lambda config: self.llm.ainvoke(prompt, config=config),
+            self._estimate_tokens(prompt)
+        )
         return response.content
     
     def generate_with_template(
         self,
         template: str,
         input_variables: Dict[str, Any],
-        output_schema: Optional[Type[T]] = None
+        output_schema: Optional[Type[T]] = None,
+        bypass_cache: bool = False,
+        human_template: Optional[str] = None
     ) -> Any:
         """
         Generate text using a template and input variables.
@@ -82,19 +171,450 @@ class LLMService:
             template: Template for text generation.
             input_variables: Input variables for the template.
             output_schema: Optional Pydantic model for structured output.
+            bypass_cache: If True, skip the cache lookup and store the fresh result.
+            human_template: Optional template for the human message. Keeping
+                variables here leaves the system message identical across calls.
             
         Returns:
             Generated text or structured output.
         """
-        # Create prompt template
-        prompt_messages = [("system", template), ("human", "generate")]
-        chat_prompt = ChatPromptTemplate(prompt_messages)
+        chat_prompt, chain = self._compile(template, output_schema, human_template)
+        cache_key, cached = self._lookup_cache(chat_prompt, input_variables, output_schema, bypass_cache)
+        if cached is not None:
+            return cached
+        
+        # Invoke the chain with input variables
+        result = self._call(
+            lambda config: chain.invoke(input_variables, config=config),
+            self._estimate_template_tokens(chat_prompt, input_variables)
+        )
+        
+        self._store_cache(cache_key, result, output_schema)
+        return result
+    
+    async def agenerate_with_template(
+        self,
+        template: str,
+        input_variables: Dict[str, Any],
+        output_schema: Optional[Type[T]] = None,
+        bypass_cache: bool = False,
+        human_template: Optional[str] = None
+    ) -> Any:
+        """
+        Generate text using a template and input variables asynchronously.
+        
+        Args:
+            template: Template for text generation.
+            input_variables: Input variables for the template.
+            output_schema: Optional Pydantic model for structured output.
+            bypass_cache: If True, skip the cache lookup and store the fresh result.
+            human_template: Optional template for the human message. Keeping
+                variables here leaves the system message identical across calls.
+            
+        Returns:
+            Generated text or structured output.
+        """
+        chat_prompt, chain = self._compile(template, output_schema, human_template)
+        # Cache reads and writes are disk I/O, kept off the event loop
+        cache_key, cached = await asyncio.to_thread(
+            self._lookup_cache, chat_prompt, input_variables, output_schema, bypass_cache
+        )
+        if cached is not None:
+            return cached
+        
+        # Await the chain with input variables
+        result = await self._acall(
+            lambda config: chain.ainvoke(input_variables, config=config),
+            self._estimate_template_tokens(chat_prompt, input_variables)
+        )
+        
+        await asyncio.to_thread(self._store_cache, cache_key, result, output_schema)
+        return result
+    
+    def stream_with_template(
+        self,
+        template: str,
+        input_variables: Dict[str, Any],
+        output_schema: Type[T],
+        bypass_cache: bool = False,
+        human_template: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream structured output as it is generated.
+        
+        Each yielded dictionary is a snapshot of the fields generated so far,
+        filled in the order they are declared on the schema. The final
+        snapshot is validated against the schema and cached.
+        
+        Args:
+            template: Template for text generation.
+            input_variables: Input variables for the template.
+            output_schema: Pydantic model for structured output.
+            bypass_cache: If True, skip the cache lookup and store the fresh result.
+            human_template: Optional template for the human message.
+        
+        Yields:
+            Partial output dictionaries, ending with the complete output.
+        """
+        chat_prompt, chain = self._compile(template, output_schema, human_template, streaming=True)
+        cache_key, cached = self._lookup_cache(chat_prompt, input_variables, output_schema, bypass_cache)
+        if cached is not None:
+            yield cached.model_dump()
+            return
+        
+        tracker = CallTracker(self.component, self.model_name)
+        config = {"callbacks": [tracker]}
+        
+        # Retries are only possible until the first chunk arrives
+        def start_stream() -> Tuple[Iterator[Dict[str, Any]], Optional[Dict[str, Any]]]:
+            stream = iter(chain.stream(input_variables, config=config))
+            return stream, next(stream, None)
+        
+        stream = None
+        error: Optional[Exception] = None
+        completed = False
+        try:
+            stream, partial = self.scheduler.run(
+                start_stream,
+                self._estimate_template_tokens(chat_prompt, input_variables)
+            )
+            if partial is None:
+                raise ValueError("Language model returned no output")
+            tracker.mark_first_token()
+            
+            yield partial
+            for partial in stream:
+                yield partial
+            completed = True
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            # Also runs when the caller stops iterating early (GeneratorExit)
+            if not completed:
+                if hasattr(stream, 'close'):
+                    stream.close()
+                if error is None:
+                    error = RuntimeError("Stream closed before completion")
+            self._record(tracker, error)
+        
+        self._store_cache(cache_key, output_schema.model_validate(partial), output_schema)
+    
+    def batch_with_template(
+        self,
+        template: str,
+        inputs: List[Dict[str, Any]],
+        output_schema: Optional[Type[T]] = None,
+        max_concurrency: int = 5,
+        bypass_cache: bool = False,
+        human_template: Optional[str] = None
+    ) -> List[Any]:
+        """
+        Generate outputs for many input variable sets with one template.
+        
+        Cached responses are served directly; the remaining inputs are run
+        through the chain's batch execution with bounded concurrency.
+        
+        Args:
+            template: Template for text generation.
+            inputs: Input variables for each request.
+            output_schema: Optional Pydantic model for structured output.
+            max_concurrency: Maximum number of requests in flight at once.
+            bypass_cache: If True, skip the cache lookup and store the fresh results.
+            human_template: Optional template for the human message.
+            
+        Returns:
+            Results in input order. A failed item holds its exception instead
+            of a result.
+        """
+        chat_prompt, chain = self._compile(template, output_schema, human_template)
+        results: List[Any] = [None] * len(inputs)
+        cache_keys: List[Optional[str]] = [None] * len(inputs)
+        pending = []
+        
+        for index, input_variables in enumerate(inputs):
+            try:
+                cache_key, cached = self._lookup_cache(
+                    chat_prompt, input_variables, output_schema, bypass_cache
+                )
+            except Exception as e:
+                results[index] = e
+                continue
+            
+            if cached is not None:
+                results[index] = cached
+            else:
+                cache_keys[index] = cache_key
+                pending.append(index)
+        
+        if pending:
+            # Each item goes through the scheduler so it is budgeted and retried
+            scheduled_chain = RunnableLambda(
+                lambda item: self._call(
+                    lambda config: chain.invoke(item, config=config),
+                    self._estimate_template_tokens(chat_prompt, item)
+                )
+            )
+            outputs = scheduled_chain.batch(
+                [inputs[index] for index in pending],
+                config={"max_concurrency": max_concurrency},
+                return_exceptions=True
+            )
+            for index, output in zip(pending, outputs):
+                results[index] = output
+                if not isinstance(output, Exception):
+                    self._store_cache(cache_keys[index], output, output_schema)
+        
+        return results
+    
+    def _call(self, invoke: Callable[[Dict[str, Any]], R], tokens: int) -> R:
+        """
+        Run a model call through the scheduler and record its telemetry.
+        
+        Args:
+            invoke: Function performing the call with the given runnable config.
+            tokens: Estimated number of tokens for the call.
+            
+        Returns:
+            The call's result.
+        """
+        tracker = CallTracker(self.component, self.model_name)
+        try:
+            result = self.scheduler.run(lambda: invoke({"callbacks": [tracker]}), tokens)
+        except Exception as e:
+            self._record(tracker, e)
+            raise
+        self._record(tracker)
+        return result
+    
+    async def _acall(self, invoke: Callable[[Dict[str, Any]], Awaitable[R]], tokens: int) -> R:
+        """
+        Run an asynchronous model call through the scheduler and record its telemetry.
+        
+        Args:
+            invoke: Function returning an awaitable for the call with the given runnable config.
+            tokens: Estimated number of tokens for the call.
+            
+        Returns:
+            The call's result.
+        """
+        tracker = CallTracker(self.component, self.model_name)
+        try:
+            result = await self.scheduler.arun(lambda: invoke({"callbacks": [tracker]}), tokens)
+        except Exception as e:
+            self._record(tracker, e)
+            raise
+        self._record(tracker)
+        return result
+    
+    def _record(self, tracker: CallTracker, error: Optional[Exception] = None) -> None:
+        """
+        Send a finished call's telemetry to the metrics sink.
+        
+        Args:
+            tracker: Tracker for the call.
+            error: Exception raised by the call, if it failed.
+        """
+        try:
+            self.metrics_sink.record(tracker.to_record(error))
+        except Exception as e:
+            print(f"Error recording LLM metrics: {str(e)}")
+    
+    def _estimate_tokens(self, prompt: str) -> int:
+        """
+        Estimate the tokens a call draws from the tokens-per-minute budget.
+        
+        Args:
+            prompt: Prompt text sent to the model.
+            
+        Returns:
+            Prompt tokens plus a completion allowance, or 0 without a token budget.
+        """
+        if not self.scheduler.tracks_tokens:
+            return 0
+        return count_tokens(prompt) + COMPLETION_TOKEN_ESTIMATE
+    
+    def _estimate_template_tokens(
+        self,
+        chat_prompt: ChatPromptTemplate,
+        input_variables: Dict[str, Any]
+    ) -> int:
+        """
+        Estimate the tokens a templated call draws from the token budget.
+        
+        Args:
+            chat_prompt: Chat prompt for the request.
+            input_variables: Input variables for the template.
+            
+        Returns:
+            Prompt tokens plus a completion allowance, or 0 without a token budget.
+        """
+        if not self.scheduler.tracks_tokens:
+            return 0
+        return self._estimate_tokens(self._render(chat_prompt, input_variables))
+    
+    def _compile(
+        self,
+        template: str,
+        output_schema: Optional[Type[T]] = None,
+        human_template: Optional[str] = None,
+        streaming: bool = False
+    ) -> Tuple[ChatPromptTemplate, Any]:
+        """
+        Get the prompt and chain for a template, reusing compiled chains.
+        
+        Args:
+            template: Template for text generation.
+            output_schema: Optional Pydantic model for structured output.
+            human_template: Optional template for the human message.
+            streaming: If True, build the chain for streaming partial structured output.
+            
+        Returns:
+            Tuple of the chat prompt and the chain built from it.
+        """
+        def build() -> Tuple[ChatPromptTemplate, Any]:
+            chat_prompt = self._build_prompt(template, human_template)
+            return chat_prompt, self._build_chain(chat_prompt, output_schema, streaming)
+        
+        key = template if human_template is None else (template, human_template)
+        if streaming:
+            key = ("stream", key)
+        return chain_cache.get_or_build(self.llm, key, output_schema, build)
+    
+    def _build_prompt(
+        self,
+        template: str,
+        human_template: Optional[str] = None
+    ) -> ChatPromptTemplate:
+        """
+        Create the chat prompt for a template.
+        
+        Args:
+            template: Template for text generation.
+            human_template: Optional template for the human message.
+            
+        Returns:
+            Chat prompt with the template as the system message.
+        """
+        prompt_messages = [("system", template), ("human", human_template or "generate")]
+        return ChatPromptTemplate(prompt_messages)
+    
+    def _build_chain(
+        self,
+        chat_prompt: ChatPromptTemplate,
+        output_schema: Optional[Type[T]] = None,
+        streaming: bool = False
+    ) -> Any:
+        """
+        Create a chain with or without structured output.
         
-        # Create chain with or without structured output
+        Args:
+            chat_prompt: Chat prompt for the request.
+            output_schema: Optional Pydantic model for structured output.
+            streaming: If True, parse structured output into partial dictionaries.
+            
+        Returns:
+            Runnable chain from the prompt to the model.
+        """
+        if output_schema and streaming:
+            # A plain JSON schema makes the parser emit partial dictionaries
+            return chat_prompt | self.llm.with_structured_output(
+                output_schema.model_json_schema(),
+                method="function_calling"
+            )
         if output_schema:
-            chain = chat_prompt | self.llm.with_structured_output(output_schema)
-        else:
-            chain = chat_prompt | self.llm
+            return chat_prompt | self.llm.with_structured_output(output_schema)
+        return chat_prompt | self.llm
+    
+    def _lookup_cache(
+        self,
+        chat_prompt: ChatPromptTemplate,
+        input_variables: Dict[str, Any],
+        output_schema: Optional[Type[T]],
+        bypass_cache: bool
+    ) -> Tuple[Optional[str], Any]:
+        """
+        Look up a previous response for the same rendered prompt.
         
-        # Invoke the chain with input variables
-        return chain.invoke(input_variables)
+        Args:
+            chat_prompt: Chat prompt for the request.
+            input_variables: Input variables for the template.
+            output_schema: Optional Pydantic model for structured output.
+            bypass_cache: If True, only compute the key and skip the lookup.
+            
+        Returns:
+            Tuple of the cache key (None without a cache) and the cached result.
+        """
+        if self.cache is None:
+            return None, None
+        
+        cache_key = self._cache_key(chat_prompt, input_variables, output_schema)
+        if bypass_cache:
+            return cache_key, None
+        
+        cached = self.cache.get(cache_key, output_schema)
+        if cached is not None and not output_schema:
+            cached = AIMessage(content=cached)
+        return cache_key, cached
+    
+    def _store_cache(
+        self,
+        cache_key: Optional[str],
+        result: Any,
+        output_schema: Optional[Type[T]]
+    ) -> None:
+        """
+        Store a fresh response in the cache.
+        
+        Args:
+            cache_key: Cache key from _lookup_cache, or None to skip caching.
+            result: Result returned by the chain.
+            output_schema: Optional Pydantic model for structured output.
+        """
+        if cache_key is not None:
+            self.cache.set(cache_key, result if output_schema else result.content)
+    
+    def _cache_key(
+        self,
+        chat_prompt: ChatPromptTemplate,
+        input_variables: Dict[str, Any],
+        output_schema: Optional[Type[T]]
+    ) -> str:
+        """
+        Build the response cache key for a rendered prompt.
+        
+        Args:
+            chat_prompt: Prompt template for the request.
+            input_variables: Input variables for the template.
+            output_schema: Optional Pydantic model for structured output.
+            
+        Returns:
+            Cache key for the request.
+        """
+        rendered = self._render(chat_prompt, input_variables)
+        return self.cache.make_key(
+            rendered,
+            self.model_name,
+            self.temperature,
+            output_schema,
+            max_tokens=self.max_tokens,
+            fallback_model=self.fallback_model
+        )
+    
+    def _render(
+        self,
+        chat_prompt: ChatPromptTemplate,
+        input_variables: Dict[str, Any]
+    ) -> str:
+        """
+        Render a chat prompt to text.
+        
+        Args:
+            chat_prompt: Chat prompt for the request.
+            input_variables: Input variables for the template.
+            
+        Returns:
+            The rendered messages, one per line prefixed with their role.
+        """
+        messages = chat_prompt.format_messages(**input_variables)
+        return "\n".join(f"{message.type}: {message.content}" for message in messages)
@@ -0,0 +1,62 @@
+"""
+Model Router for RecruitReach.
+
+This module maps each language model task to a model profile (model,
+temperature, max tokens, timeout and fallback model) configured in the
+[models] section of config.toml.
+"""
+
+from typing import Dict
+
+from pydantic import ValidationError
+
+from Recruiter.models.schemas import ModelProfile
+from Recruiter.utils.config.config_manager import ConfigManager
+
+
+# Task names
+TASK_EXTRACTION = "extraction"
+TASK_RESUME_EXTRACTION = "resume_extraction"
+TASK_RESEARCH = "research"
+TASK_WEB_RESEARCH = "web_research"
+TASK_EMAIL = "email"
+TASK_COVER_LETTER = "cover_letter"
+TASK_REGENERATION = "regeneration"
+
+# Defaults keep every task on the small model; extraction is deterministic
+# and short, so it also gets a low completion limit
+DEFAULT_PROFILES: Dict[str, ModelProfile] = {
+    TASK_EXTRACTION: ModelProfile(model="gpt-4o-mini", temperature=0.0, max_tokens=512),
+    TASK_RESUME_EXTRACTION: ModelProfile(model="gpt-4o-mini", temperature=0.0, max_tokens=2500),
+    TASK_RESEARCH: ModelProfile(model="gpt-4o-mini", temperature=0.2, max_tokens=1500),
+    TASK_WEB_RESEARCH: ModelProfile(model="gpt-4o-mini", temperature=0.2, max_tokens=1500),
+    TASK_EMAIL: ModelProfile(model="gpt-4o-mini", temperature=0.2),
+    TASK_COVER_LETTER: ModelProfile(model="gpt-4o-mini", temperature=0.2),
+    TASK_REGENERATION: ModelProfile(model="gpt-4o-mini", temperature=0.2)
+}
+
+
+def get_model_profile(task: str) -> ModelProfile:
+    """
+    Get the model profile for a task.
+    
+    Settings in the [models.<task>] table of config.toml override the
+    task's defaults field by field.
+    
+    Args:
+        task: Task name (extraction, resume_extraction, research,
+            web_research, email, cover_letter or regeneration).
+    
+    Returns:
+        ModelProfile for the task.
+    """
+    profile = DEFAULT_PROFILES.get(task, ModelProfile())
+    overrides = ConfigManager().get_section('models').get(task)
+    if not overrides:
+        return profile
+    
+    try:
+        return ModelProfile(**{**profile.model_dump(), **overrides})
+    except (TypeError, ValidationError) as e:
+        print(f"Error reading model profile for {task}: {str(e)}")
+        return profile
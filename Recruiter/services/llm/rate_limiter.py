@@ -0,0 +1,285 @@
+"""
+Rate Limit Scheduler for RecruitReach.
+
+This module provides a scheduler that keeps OpenAI calls within
+requests-per-minute and tokens-per-minute budgets and retries rate-limited
+or transient failures with jittered exponential backoff.
+"""
+
+import time
+import random
+import asyncio
+import hashlib
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+import openai
+
+from Recruiter.utils.config.config_manager import ConfigManager
+
+R = TypeVar('R')
+
+# HTTP status codes worth retrying
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
+
+class RateLimitScheduler:
+    """
+    Scheduler for rate-limited language model calls.
+    
+    Requests and tokens are drawn from two token buckets that refill
+    continuously up to their per-minute budgets. Callers wait until both
+    buckets can cover their request. Failed calls are retried with jittered
+    exponential backoff, honouring the server's Retry-After header; a 429
+    pauses every caller sharing the scheduler until the retry time.
+    """
+    
+    def __init__(
+        self,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        max_retries: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0
+    ):
+        """
+        Initialize the scheduler.
+        
+        Args:
+            requests_per_minute: Request budget, or None for no limit.
+            tokens_per_minute: Token budget, or None for no limit.
+            max_retries: Maximum number of retries per call.
+            base_delay: Initial backoff delay in seconds.
+            max_delay: Maximum backoff delay in seconds.
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        
+        self._request_allowance = float(requests_per_minute or 0)
+        self._token_allowance = float(tokens_per_minute or 0)
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+    
+    @property
+    def tracks_tokens(self) -> bool:
+        """Whether calls need a token estimate."""
+        return bool(self.tokens_per_minute)
+    
+    def acquire(self, tokens: int = 0) -> None:
+        """
+        Block until the budgets can cover a request.
+        
+        Args:
+            tokens: Estimated number of tokens for the request.
+        """
+        while True:
+            wait = self._reserve(tokens)
+            if wait <= 0:
+                return
+            time.sleep(wait)
+    
+    async def aacquire(self, tokens: int = 0) -> None:
+        """
+        Wait asynchronously until the budgets can cover a request.
+        
+        Args:
+            tokens: Estimated number of tokens for the request.
+        """
+        while True:
+            wait = self._reserve(tokens)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+    
+    def run(self, func: Callable[[], R], tokens: int = 0) -> R:
+        """
+        Run a call within the budgets, retrying transient failures.
+        
+        Args:
+            func: Function performing the call.
+            tokens: Estimated number of tokens for the call.
+        
+        Returns:
+            The function's result.
+        """
+        attempt = 0
+        while True:
+            self.acquire(tokens)
+            try:
+                return func()
+            except Exception as e:
+                delay = self._retry_delay(e, attempt)
+                if delay is None:
+                    raise
+                print(f"Retrying LLM call in {delay:.1f}s after error: {str(e)}")
+                attempt += 1
+                time.sleep(delay)
+    
+    async def arun(self, func: Callable[[], Awaitable[R]], tokens: int = 0) -> R:
+        """
+        Run an asynchronous call within the budgets, retrying transient failures.
+        
+        Args:
+            func: Function returning an awaitable that performs the call.
+            tokens: Estimated number of tokens for the call.
+        
+        Returns:
+            The awaited result.
+        """
+        attempt = 0
+        while True:
+            await self.aacquire(tokens)
+            try:
+                return await func()
+            except Exception as e:
+                delay = self._retry_delay(e, attempt)
+                if delay is None:
+                    raise
+                print(f"Retrying LLM call in {delay:.1f}s after error: {str(e)}")
+                attempt += 1
+                await asyncio.sleep(delay)
+    
+    def _reserve(self, tokens: int) -> float:
+        """
+        Try to take a request and tokens from the buckets.
+        
+        Args:
+            tokens: Estimated number of tokens for the request.
+        
+        Returns:
+            0 if the request was admitted, otherwise seconds to wait.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now < self._blocked_until:
+                return self._blocked_until - now
+            
+            elapsed = now - self._last_refill
+            self._last_refill = now
+            waits = [0.0]
+            
+            if self.requests_per_minute:
+                rate = self.requests_per_minute / 60.0
+                self._request_allowance = min(
+                    float(self.requests_per_minute),
+                    self._request_allowance + elapsed * rate
+                )
+                if self._request_allowance < 1:
+                    waits.append((1 - self._request_allowance) / rate)
+            
+            if self.tokens_per_minute:
+                # A request larger than the whole budget waits for a full bucket
+                tokens = min(tokens, self.tokens_per_minute)
+                rate = self.tokens_per_minute / 60.0
+                self._token_allowance = min(
+                    float(self.tokens_per_minute),
+                    self._token_allowance + elapsed * rate
+                )
+                if self._token_allowance < tokens:
+                    waits.append((tokens - self._token_allowance) / rate)
+            
+            wait = max(waits)
+            if wait > 0:
+                return wait
+            
+            if self.requests_per_minute:
+                self._request_allowance -= 1
+            if self.tokens_per_minute:
+                self._token_allowance -= tokens
+            return 0.0
+    
+    def _retry_delay(self, error: Exception, attempt: int) -> Optional[float]:
+        """
+        Get the delay before retrying a failed call.
+        
+        Args:
+            error: Exception raised by the call.
+            attempt: Number of retries already made.
+        
+        Returns:
+            Seconds to wait, or None if the error should not be retried.
+        """
+        if attempt >= self.max_retries:
+            return None
+        
+        if isinstance(error, openai.APIStatusError):
+            if error.status_code not in RETRYABLE_STATUS_CODES:
+                return None
+            retry_after = _parse_retry_after(error.response.headers)
+        elif isinstance(error, openai.APIConnectionError):
+            # Also covers openai.APITimeoutError
+            retry_after = None
+        else:
+            return None
+        
+        # Full jitter keeps concurrent callers from retrying in lockstep
+        backoff = min(self.max_delay, self.base_delay * (2 ** attempt))
+        delay = random.uniform(0, backoff)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        
+        if isinstance(error, openai.RateLimitError):
+            with self._lock:
+                self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+        return delay
+
+
+def _parse_retry_after(headers: Any) -> Optional[float]:
+    """
+    Read the retry delay from response headers.
+    
+    Args:
+        headers: Response headers.
+    
+    Returns:
+        Delay in seconds, or None if the headers do not specify one.
+    """
+    try:
+        retry_after_ms = headers.get("retry-after-ms")
+        if retry_after_ms is not None:
+            return float(retry_after_ms) / 1000.0
+        retry_after = headers.get("retry-after")
+        if retry_after is not None:
+            return float(retry_after)
+    except (TypeError, ValueError):
+        pass
+    return None
+
+
+_schedulers: Dict[str, RateLimitScheduler] = {}
+_schedulers_lock = threading.Lock()
+
+
+def get_scheduler(api_key: str) -> RateLimitScheduler:
+    """
+    Get the shared scheduler for an API key.
+    
+    Budgets are read from the optional [rate_limit] section of config.toml
+    ('requests_per_minute', 'tokens_per_minute', 'max_retries', 'base_delay'
+    and 'max_delay').
+    
+    Args:
+        api_key: OpenAI API key whose quota the scheduler tracks.
+    
+    Returns:
+        RateLimitScheduler shared by all callers using the key.
+    """
+    key = hashlib.sha256(api_key.encode('utf-8')).hexdigest()
+    
+    with _schedulers_lock:
+        scheduler = _schedulers.get(key)
+        if scheduler is None:
+            settings = ConfigManager().get_section('rate_limit')
+            scheduler = RateLimitScheduler(
+                requests_per_minute=settings.get('requests_per_minute'),
+                tokens_per_minute=settings.get('tokens_per_minute'),
+                max_retries=settings.get('max_retries', 5),
+                base_delay=settings.get('base_delay', 1.0),
+                max_delay=settings.get('max_delay', 60.0)
+            )
+            _schedulers[key] = scheduler
+        return scheduler
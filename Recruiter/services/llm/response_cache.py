@@ -0,0 +1,236 @@
+"""
+Response Cache for RecruitReach.
+
+This module provides a persistent, content-addressed cache for language
+model responses so that identical requests are served from disk.
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Type
+
+from pydantic import BaseModel, ValidationError
+
+from Recruiter.utils.config.config_manager import ConfigManager
+from Recruiter.utils.file_utils.file_store import entry_paths, evict_entries, read_json, remove_file, write_json
+from Recruiter.utils.file_utils.path_manager import PathManager
+
+
+class ResponseCache:
+    """
+    On-disk cache for language model responses.
+    
+    Each entry is stored as a JSON file named after the SHA-256 hash of the
+    rendered prompt, the model parameters (including the completion limit
+    and fallback model) and the output schema. Entries expire after a TTL
+    and the oldest entries are evicted once the cache grows beyond its
+    maximum size. Eviction scans the whole directory, so it runs once every
+    evict_interval writes rather than on each one.
+    """
+    
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_entries: int = 1000,
+        ttl_seconds: float = 7 * 24 * 60 * 60,
+        evict_interval: int = 50
+    ):
+        """
+        Initialize the response cache.
+        
+        Args:
+            cache_dir: Directory for cache files. Defaults to 'data/cache/llm'.
+            max_entries: Maximum number of entries kept on disk.
+            ttl_seconds: Time in seconds after which an entry expires.
+            evict_interval: Number of writes between evictions; the cache may
+                hold up to this many entries beyond max_entries in between.
+        """
+        self.cache_dir = cache_dir or PathManager().get_cache_dir('llm')
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.evict_interval = max(1, evict_interval)
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(
+        prompt: str,
+        model_name: str,
+        temperature: float,
+        output_schema: Optional[Type[BaseModel]] = None,
+        max_tokens: Optional[int] = None,
+        fallback_model: Optional[str] = None
+    ) -> str:
+        """
+        Build a cache key for a request.
+        
+        Args:
+            prompt: Fully rendered prompt text.
+            model_name: Name of the language model.
+            temperature: Temperature parameter used for generation.
+            output_schema: Optional Pydantic model for structured output.
+            max_tokens: Completion token limit, since a response cut short
+                under a small limit must not be served for a larger one.
+            fallback_model: Model answering when the primary model times out.
+        
+        Returns:
+            Hex digest identifying the request.
+        """
+        schema = _schema_digest(output_schema) if output_schema else None
+        payload = json.dumps(
+            {
+                "prompt": prompt,
+                "model": model_name,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+                "fallback_model": fallback_model,
+                "schema": schema
+            },
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def get(self, key: str, output_schema: Optional[Type[BaseModel]] = None) -> Optional[Any]:
+        """
+        Look up a cached response.
+        
+        Args:
+            key: Cache key returned by make_key.
+            output_schema: Pydantic model used to re-validate structured output.
+        
+        Returns:
+            The cached response, or None on a miss.
+        """
+        path = self._entry_path(key)
+        entry = read_json(path)
+        if not isinstance(entry, dict):
+            self._record(hit=False)
+            return None
+        
+        if time.time() - entry.get("created_at", 0) > self.ttl_seconds:
+            remove_file(path)
+            self._record(hit=False)
+            return None
+        
+        value = entry.get("value")
+        if output_schema is not None:
+            try:
+                value = output_schema.model_validate(value)
+            except ValidationError:
+                # Schema changed since the entry was written
+                remove_file(path)
+                self._record(hit=False)
+                return None
+        
+        self._record(hit=True)
+        return value
+    
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a response in the cache.
+        
+        Args:
+            key: Cache key returned by make_key.
+            value: Response to store. Pydantic models are stored as dictionaries.
+        """
+        if isinstance(value, BaseModel):
+            value = value.model_dump()
+        entry = {"created_at": time.time(), "value": value}
+        
+        with self._lock:
+            write_json(self._entry_path(key), entry)
+            self._writes += 1
+            if self._writes >= self.evict_interval:
+                self._writes = 0
+                evict_entries(self._entry_paths(), self.max_entries, self.ttl_seconds)
+    
+    def clear(self) -> None:
+        """Remove every entry from the cache and reset the counters."""
+        with self._lock:
+            for path in self._entry_paths():
+                remove_file(path)
+            self.hits = 0
+            self.misses = 0
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dictionary with hit, miss and entry counts.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entry_paths())
+        }
+    
+    def _record(self, hit: bool) -> None:
+        """Update the hit/miss counters."""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+    
+    def _entry_path(self, key: str) -> str:
+        """Get the file path for a cache key."""
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def _entry_paths(self) -> List[str]:
+        """List the file paths of all cache entries."""
+        return entry_paths(self.cache_dir, '.json')
+
+
+@lru_cache(maxsize=256)
+def _schema_digest(output_schema: Type[BaseModel]) -> str:
+    """
+    Get a digest of a Pydantic model's JSON schema.
+    
+    Building the JSON schema takes milliseconds for larger models, so the
+    digest is computed once per model class.
+    
+    Args:
+        output_schema: Pydantic model for structured output.
+    
+    Returns:
+        SHA-256 hex digest of the schema serialized with sorted keys.
+    """
+    schema = json.dumps(output_schema.model_json_schema(), sort_keys=True)
+    return hashlib.sha256(schema.encode('utf-8')).hexdigest()
+
+
+_default_cache: Optional[ResponseCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    Get the shared response cache configured in config.toml.
+    
+    The cache is configured by the optional [llm_cache] section with the
+    keys 'enabled', 'max_entries', 'ttl_seconds' and 'evict_interval'.
+    
+    Returns:
+        The shared ResponseCache instance, or None if caching is disabled.
+    """
+    global _default_cache
+    
+    with _default_cache_lock:
+        if _default_cache is None:
+            settings = ConfigManager().get_section('llm_cache')
+            if not settings.get('enabled', True):
+                return None
+            _default_cache = ResponseCache(
+                max_entries=settings.get('max_entries', 1000),
+                ttl_seconds=settings.get('ttl_seconds', 7 * 24 * 60 * 60),
+                evict_interval=settings.get('evict_interval', 50)
+            )
+        return _default_cache
@@ -0,0 +1,326 @@
+"""
+LLM Telemetry for RecruitReach.
+
+This module provides token, latency and cost telemetry for language model
+calls, with pluggable metrics sinks.
+"""
+
+import os
+import time
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from Recruiter.models.schemas import LLMCallRecord
+from Recruiter.utils.config.config_manager import ConfigManager
+from Recruiter.utils.file_utils.path_manager import PathManager
+
+
+class MetricsSink(ABC):
+    """Destination for LLM call records."""
+    
+    @abstractmethod
+    def record(self, record: LLMCallRecord) -> None:
+        """
+        Record a completed call.
+        
+        Args:
+            record: Telemetry for the call.
+        """
+
+
+class InMemoryMetricsAggregator(MetricsSink):
+    """
+    Metrics sink that keeps records in memory and aggregates them.
+    
+    Summaries are grouped by component and model so the expensive paths
+    can be compared directly.
+    """
+    
+    def __init__(self, max_records: int = 10000):
+        """
+        Initialize the aggregator.
+        
+        Args:
+            max_records: Maximum number of records kept; the oldest are dropped first.
+        """
+        self.max_records = max_records
+        self._records: List[LLMCallRecord] = []
+        self._lock = threading.Lock()
+    
+    def record(self, record: LLMCallRecord) -> None:
+        """
+        Record a completed call.
+        
+        Args:
+            record: Telemetry for the call.
+        """
+        with self._lock:
+            self._records.append(record)
+            if len(self._records) > self.max_records:
+                del self._records[:len(self._records) - self.max_records]
+    
+    def records(self) -> List[LLMCallRecord]:
+        """
+        Get the recorded calls.
+        
+        Returns:
+            List of call records, oldest first.
+        """
+        with self._lock:
+            return list(self._records)
+    
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Aggregate the recorded calls by component and model.
+        
+        Returns:
+            Dictionary keyed by 'component/model' with call counts, error
+            counts, token totals (including prompt-cache hits) and
+            average/max latencies.
+        """
+        groups: Dict[str, List[LLMCallRecord]] = {}
+        for record in self.records():
+            groups.setdefault(f"{record.component}/{record.model}", []).append(record)
+        
+        summary = {}
+        for key, records in groups.items():
+            wall_times = [record.wall_time for record in records]
+            first_token_times = [
+                record.time_to_first_token for record in records
+                if record.time_to_first_token is not None
+            ]
+            summary[key] = {
+                "calls": len(records),
+                "errors": sum(1 for record in records if not record.success),
+                "prompt_tokens": sum(record.prompt_tokens or 0 for record in records),
+                "completion_tokens": sum(record.completion_tokens or 0 for record in records),
+                "cached_prompt_tokens": sum(record.cached_prompt_tokens or 0 for record in records),
+                "avg_wall_time": sum(wall_times) / len(wall_times),
+                "max_wall_time": max(wall_times),
+                "avg_time_to_first_token": (
+                    sum(first_token_times) / len(first_token_times) if first_token_times else None
+                )
+            }
+        return summary
+    
+    def clear(self) -> None:
+        """Remove all records."""
+        with self._lock:
+            self._records.clear()
+
+
+class JsonlMetricsExporter(MetricsSink):
+    """Metrics sink that appends each record as a JSON line to a file."""
+    
+    def __init__(self, file_path: str):
+        """
+        Initialize the exporter.
+        
+        Args:
+            file_path: Path of the JSONL file to append to.
+        """
+        self.file_path = file_path
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+    
+    def record(self, record: LLMCallRecord) -> None:
+        """
+        Append a record to the file.
+        
+        Args:
+            record: Telemetry for the call.
+        """
+        line = record.model_dump_json() + "\n"
+        with self._lock:
+            with open(self.file_path, 'a', encoding='utf-8') as f:
+                f.write(line)
+
+
+class CompositeMetricsSink(MetricsSink):
+    """Metrics sink that forwards records to several sinks."""
+    
+    def __init__(self, sinks: List[MetricsSink]):
+        """
+        Initialize the composite sink.
+        
+        Args:
+            sinks: Sinks that receive every record.
+        """
+        self.sinks = sinks
+    
+    def record(self, record: LLMCallRecord) -> None:
+        """
+        Forward a record to every sink.
+        
+        Args:
+            record: Telemetry for the call.
+        """
+        for sink in self.sinks:
+            try:
+                sink.record(record)
+            except Exception as e:
+                print(f"Error recording LLM metrics: {str(e)}")
+
+
+class CallTracker(BaseCallbackHandler):
+    """
+    Callback handler that measures a single language model call.
+    
+    Token counts and the name of the model that answered are read from the
+    provider's response metadata, and the time to first token from the
+    first streamed token.
+    """
+    
+    def __init__(self, component: str, model: str):
+        """
+        Start tracking a call.
+        
+        Args:
+            component: Component making the call.
+            model: Name of the requested language model, replaced by the model
+                reported in the response (e.g. the fallback model).
+        """
+        super().__init__()
+        self.component = component
+        self.model = model
+        self.timestamp = time.time()
+        self._start = time.perf_counter()
+        self.time_to_first_token: Optional[float] = None
+        self.prompt_tokens: Optional[int] = None
+        self.completion_tokens: Optional[int] = None
+        self.cached_prompt_tokens: Optional[int] = None
+    
+    def on_llm_new_token(self, token: Any, **kwargs: Any) -> None:
+        """Record the arrival of the first streamed token."""
+        self.mark_first_token()
+    
+    def on_llm_end(self, response: Any, **kwargs: Any) -> None:
+        """Read token usage and the answering model from the model response."""
+        prompt_tokens = 0
+        completion_tokens = 0
+        cached_prompt_tokens = 0
+        found = False
+        
+        model_name = (response.llm_output or {}).get('model_name')
+        for generations in response.generations:
+            for generation in generations:
+                message = getattr(generation, 'message', None)
+                model_name = model_name or (getattr(message, 'response_metadata', None) or {}).get('model_name')
+                usage = getattr(message, 'usage_metadata', None)
+                if usage:
+                    prompt_tokens += usage.get('input_tokens', 0)
+                    completion_tokens += usage.get('output_tokens', 0)
+                    cached_prompt_tokens += (usage.get('input_token_details') or {}).get('cache_read', 0)
+                    found = True
+        
+        if not found:
+            usage = (response.llm_output or {}).get('token_usage') or {}
+            if usage:
+                prompt_tokens = usage.get('prompt_tokens', 0)
+                completion_tokens = usage.get('completion_tokens', 0)
+                cached_prompt_tokens = (usage.get('prompt_tokens_details') or {}).get('cached_tokens', 0)
+                found = True
+        
+        if model_name:
+            self.model = model_name
+        
+        if found:
+            self.prompt_tokens = (self.prompt_tokens or 0) + prompt_tokens
+            self.completion_tokens = (self.completion_tokens or 0) + completion_tokens
+            self.cached_prompt_tokens = (self.cached_prompt_tokens or 0) + cached_prompt_tokens
+    
+    def mark_first_token(self) -> None:
+        """Record the time to first token if it is not set yet."""
+        if self.time_to_first_token is None:
+            self.time_to_first_token = time.perf_counter() - self._start
+    
+    def to_record(self, error: Optional[Exception] = None) -> LLMCallRecord:
+        """
+        Build the record for the finished call.
+        
+        Args:
+            error: Exception raised by the call, if it failed.
+        
+        Returns:
+            Telemetry for the call.
+        """
+        return LLMCallRecord(
+            component=self.component,
+            model=self.model,
+            prompt_tokens=self.prompt_tokens,
+            completion_tokens=self.completion_tokens,
+            cached_prompt_tokens=self.cached_prompt_tokens,
+            wall_time=time.perf_counter() - self._start,
+            time_to_first_token=self.time_to_first_token,
+            success=error is None,
+            error=str(error) if error is not None else None,
+            timestamp=self.timestamp
+        )
+
+
+_metrics_sink: Optional[MetricsSink] = None
+_metrics_aggregator: Optional[InMemoryMetricsAggregator] = None
+_metrics_lock = threading.Lock()
+
+
+def get_metrics_sink() -> MetricsSink:
+    """
+    Get the process-wide metrics sink.
+    
+    By default this is an in-memory aggregator, combined with a JSONL
+    exporter when the [telemetry] section of config.toml sets 'jsonl_path'
+    (relative paths are resolved against the data directory).
+    
+    Returns:
+        The metrics sink used by LLMService.
+    """
+    global _metrics_sink
+    
+    with _metrics_lock:
+        if _metrics_sink is None:
+            sinks: List[MetricsSink] = [_get_aggregator()]
+            jsonl_path = ConfigManager().get_value('telemetry', 'jsonl_path')
+            if jsonl_path:
+                if not os.path.isabs(jsonl_path):
+                    jsonl_path = PathManager().get_data_path(jsonl_path)
+                sinks.append(JsonlMetricsExporter(jsonl_path))
+            _metrics_sink = CompositeMetricsSink(sinks)
+        return _metrics_sink
+
+
+def set_metrics_sink(sink: MetricsSink) -> None:
+    """
+    Replace the process-wide metrics sink.
+    
+    Args:
+        sink: Sink that receives every LLM call record.
+    """
+    global _metrics_sink
+    
+    with _metrics_lock:
+        _metrics_sink = sink
+
+
+def get_metrics_aggregator() -> InMemoryMetricsAggregator:
+    """
+    Get the default in-memory aggregator.
+    
+    Returns:
+        The aggregator included in the default metrics sink.
+    """
+    with _metrics_lock:
+        return _get_aggregator()
+
+
+def _get_aggregator() -> InMemoryMetricsAggregator:
+    """Get the default aggregator, creating it on first use. Caller holds the lock."""
+    global _metrics_aggregator
+    
+    if _metrics_aggregator is None:
+        _metrics_aggregator = InMemoryMetricsAggregator()
+    return _metrics_aggregator
@@ -0,0 +1,142 @@
+"""
+File-backed store helpers for RecruitReach.
+
+This module provides the file operations shared by the on-disk caches and
+stores: atomic writes, listing entry files and evicting them by age and count.
+"""
+
+import os
+import json
+import time
+import tempfile
+from typing import Any, List, Optional, Union
+
+
+def write_atomic(path: str, content: Union[str, bytes]) -> None:
+    """
+    Write a file atomically.
+    
+    The content is written to a temporary file in the same directory and
+    moved over the target, so readers never see a partially written file.
+    
+    Args:
+        path: Path of the file to write.
+        content: Text or bytes to write.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    try:
+        if isinstance(content, str):
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(content)
+        else:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+        os.replace(tmp_path, path)
+    except Exception:
+        remove_file(tmp_path)
+        raise
+
+
+def write_json(path: str, data: Any, indent: Optional[int] = None) -> None:
+    """
+    Write JSON data to a file atomically.
+    
+    Args:
+        path: Path of the file to write.
+        data: JSON-serializable data.
+        indent: Optional indentation passed to json.dumps.
+    """
+    write_atomic(path, json.dumps(data, indent=indent))
+
+
+def read_json(path: str) -> Optional[Any]:
+    """
+    Read JSON data from a file.
+    
+    Args:
+        path: Path of the file to read.
+    
+    Returns:
+        The parsed data, or None if the file is missing or corrupt.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def entry_paths(directory: str, suffix: Optional[str] = None) -> List[str]:
+    """
+    List the entry files in a directory.
+    
+    Args:
+        directory: Directory holding the entries.
+        suffix: File name suffix of the entries, such as '.json'. Defaults
+            to every file except temporary files of unfinished writes.
+    
+    Returns:
+        Paths of the entry files.
+    """
+    return [
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if (name.endswith(suffix) if suffix else not name.endswith('.tmp'))
+    ]
+
+
+def evict_entries(
+    paths: List[str],
+    max_entries: Optional[int] = None,
+    max_age_seconds: Optional[float] = None
+) -> List[str]:
+    """
+    Remove entry files by age and count.
+    
+    Entries whose modification time is older than max_age_seconds are
+    removed first, then the least recently modified ones beyond max_entries.
+    Callers that want eviction by last access update the modification time
+    with os.utime when an entry is read.
+    
+    Args:
+        paths: Paths of the entry files, as returned by entry_paths.
+        max_entries: Maximum number of entries kept, or None for no limit.
+        max_age_seconds: Maximum age of an entry in seconds, or None for no limit.
+    
+    Returns:
+        Paths of the removed entries.
+    """
+    now = time.time()
+    removed = []
+    entries = []
+    for path in paths:
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            continue
+        if max_age_seconds is not None and now - mtime > max_age_seconds:
+            remove_file(path)
+            removed.append(path)
+        else:
+            entries.append((mtime, path))
+    
+    overflow = len(entries) - max_entries if max_entries is not None else 0
+    if overflow > 0:
+        entries.sort()
+        for _, path in entries[:overflow]:
+            remove_file(path)
+            removed.append(path)
+    return removed
+
+
+def remove_file(path: str) -> None:
+    """
+    Remove a file, ignoring errors if it is already gone.
+    
+    Args:
+        path: Path of the file to remove.
+    """
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -0,0 +1,39 @@
+"""
+Memory-mapped file access for RecruitReach.
+
+This module provides read-only memory maps of files on disk, so their content
+can be hashed, parsed and encoded without reading it into a bytes copy.
+"""
+
+import mmap
+from contextlib import contextmanager
+from typing import Iterator
+
+
+@contextmanager
+def map_file(file_path: str) -> Iterator[memoryview]:
+    """
+    Map a file into memory for reading.
+    
+    The content is paged in from the OS page cache on access and shared by
+    every process mapping the same file. The view is released on exit, so it
+    must not be used outside the with block.
+    
+    Args:
+        file_path: Path to the file.
+    
+    Yields:
+        Read-only view of the file content.
+    """
+    with open(file_path, 'rb') as f:
+        # Empty files cannot be mapped
+        if f.seek(0, 2) == 0:
+            yield memoryview(b"")
+            return
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                yield view
+            finally:
+                view.release()
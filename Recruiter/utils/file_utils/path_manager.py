@@ -74,6 +74,20 @@ class PathManager:
         """
         return os.path.join(self.data_dir, filename)
     
+    def get_cache_dir(self, name: str) -> str:
+        """
+        Get the path to a named cache directory, creating it if needed.
+        
+        Args:
+            name: Name of the cache (e.g., 'llm').
+        
+        Returns:
+            Path to the cache directory under the data directory.
+        """
+        cache_dir = os.path.join(self.data_dir, 'cache', name)
+        os.makedirs(cache_dir, exist_ok=True)
+        return cache_dir
+    
     def get_template_path(self, filename: str) -> Path:
         """
         Get the path to a template file.
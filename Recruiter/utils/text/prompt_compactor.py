@@ -0,0 +1,255 @@
+"""
+Prompt compaction utilities for RecruitReach.
+
+This module shrinks prompt inputs such as resumes and scraped company pages
+to a token budget: whitespace is normalized, repeated boilerplate lines are
+removed, and sections keep their opening lines when the text must be
+truncated.
+"""
+
+import re
+from typing import Dict, List, Optional
+
+from Recruiter.utils.config.config_manager import ConfigManager
+from Recruiter.utils.text.token_counter import count_tokens, truncate_to_tokens
+
+
+# Token budgets per prompt input; 0 disables truncation
+DEFAULT_TOKEN_BUDGETS = {
+    "resume": 1500,
+    "job_description": 1500,
+    "company_info": 800
+}
+
+# Repeated lines shorter than this are kept (dates, single skills, etc.)
+MIN_BOILERPLATE_LENGTH = 20
+
+# Smallest share of the budget worth giving a truncated section
+MIN_SECTION_TOKENS = 40
+
+# Headings are short lines without sentence punctuation
+MAX_HEADING_WORDS = 5
+
+_HORIZONTAL_WHITESPACE = re.compile(r"[ \t\f\v\u00a0\u2000-\u200b\u3000]+")
+_BLANK_LINES = re.compile(r"\n{3,}")
+
+
+def normalize_whitespace(text: str) -> str:
+    """
+    Normalize whitespace in a text.
+    
+    Line endings are unified, runs of spaces and tabs collapse to one space,
+    lines are stripped and runs of blank lines collapse to one.
+    
+    Args:
+        text: Text to normalize.
+    
+    Returns:
+        The normalized text.
+    """
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    lines = [_HORIZONTAL_WHITESPACE.sub(" ", line).strip() for line in text.split("\n")]
+    return _BLANK_LINES.sub("\n\n", "\n".join(lines)).strip()
+
+
+def dedupe_boilerplate(text: str) -> str:
+    """
+    Remove repeated lines such as navigation menus and page footers.
+    
+    Args:
+        text: Normalized text.
+    
+    Returns:
+        The text with only the first occurrence of each repeated line.
+    """
+    seen = set()
+    lines = []
+    previous = None
+    for line in text.split("\n"):
+        key = line.casefold()
+        if key and key == previous:
+            continue
+        previous = key
+        if len(key) >= MIN_BOILERPLATE_LENGTH:
+            if key in seen:
+                continue
+            seen.add(key)
+        lines.append(line)
+    return _BLANK_LINES.sub("\n\n", "\n".join(lines)).strip()
+
+
+def compact_text(text: str, max_tokens: int) -> str:
+    """
+    Compact a text to a token budget.
+    
+    When the cleaned text is still over budget, the budget is shared
+    between its sections so short sections are kept whole and long ones
+    are cut at line boundaries, instead of dropping the end of the text.
+    If the text has too many sections for each to get a useful share,
+    whole sections are kept in order and only the last one is cut.
+    
+    Args:
+        text: Text to compact.
+        max_tokens: Token budget, or 0 to only clean the text.
+    
+    Returns:
+        The compacted text.
+    """
+    if not text:
+        return text
+    
+    text = dedupe_boilerplate(normalize_whitespace(text))
+    if max_tokens <= 0 or count_tokens(text) <= max_tokens:
+        return text
+    
+    sections = _split_sections(text)
+    sizes = [count_tokens(section) for section in sections]
+    allowances = _share_budget(sizes, max_tokens)
+    if allowances is None:
+        allowances = _leading_budget(sizes, max_tokens)
+    
+    kept = [
+        _truncate_section(section, allowance)
+        for section, allowance in zip(sections, allowances)
+        if allowance > 0
+    ]
+    return "\n".join(section for section in kept if section)
+
+
+def get_token_budgets() -> Dict[str, int]:
+    """
+    Get the token budgets for prompt inputs.
+    
+    Defaults can be overridden per input ('resume', 'job_description' and
+    'company_info') in the [prompt_budget] section of config.toml.
+    
+    Returns:
+        Dictionary mapping input names to token budgets.
+    """
+    budgets = dict(DEFAULT_TOKEN_BUDGETS)
+    for name, value in ConfigManager().get_section('prompt_budget').items():
+        try:
+            budgets[name] = int(value)
+        except (TypeError, ValueError):
+            print(f"Error reading prompt budget for {name}: {value!r}")
+    return budgets
+
+
+def _share_budget(sizes: List[int], max_tokens: int) -> Optional[List[int]]:
+    """
+    Share a token budget evenly between sections.
+    
+    What small sections leave over is handed to larger ones.
+    
+    Args:
+        sizes: Token count of each section.
+        max_tokens: Token budget for the whole text.
+    
+    Returns:
+        Token allowance per section, or None if a cut section would get
+        less than MIN_SECTION_TOKENS.
+    """
+    # Each line break between sections costs about one token
+    budget = max_tokens - len(sizes)
+    if budget <= 0:
+        return None
+    
+    allowances = [0] * len(sizes)
+    remaining = len(sizes)
+    for index in sorted(range(len(sizes)), key=lambda i: sizes[i]):
+        allowances[index] = min(sizes[index], budget // remaining)
+        if allowances[index] < min(sizes[index], MIN_SECTION_TOKENS):
+            return None
+        budget -= allowances[index]
+        remaining -= 1
+    return allowances
+
+
+def _leading_budget(sizes: List[int], max_tokens: int) -> List[int]:
+    """
+    Spend a token budget on whole sections in order.
+    
+    Args:
+        sizes: Token count of each section.
+        max_tokens: Token budget for the whole text.
+    
+    Returns:
+        Token allowance per section: leading sections are kept whole, the
+        first one that does not fit gets what is left if that is at least
+        MIN_SECTION_TOKENS (or it is the first section), and the rest get 0.
+    """
+    allowances = [0] * len(sizes)
+    budget = max_tokens
+    for index, size in enumerate(sizes):
+        if size + 1 <= budget:
+            allowances[index] = size
+            budget -= size + 1
+            continue
+        if index == 0 or budget >= MIN_SECTION_TOKENS:
+            allowances[index] = budget
+        break
+    return allowances
+
+
+def _split_sections(text: str) -> List[str]:
+    """
+    Split a text into sections at blank lines and heading lines.
+    
+    Args:
+        text: Normalized text.
+    
+    Returns:
+        List of sections, each starting with its heading if it has one.
+    """
+    sections: List[List[str]] = [[]]
+    for line in text.split("\n"):
+        if not line or _is_heading(line):
+            if sections[-1]:
+                sections.append([])
+            if not line:
+                continue
+        sections[-1].append(line)
+    return ["\n".join(lines) for lines in sections if lines]
+
+
+def _is_heading(line: str) -> bool:
+    """
+    Check whether a line looks like a section heading.
+    
+    Args:
+        line: Stripped line of text.
+    
+    Returns:
+        True for short lines that are upper case or end with a colon.
+    """
+    if len(line.split()) > MAX_HEADING_WORDS or line[-1] in ".,;!?":
+        return False
+    return line.endswith(":") or (line.isupper() and any(c.isalpha() for c in line))
+
+
+def _truncate_section(section: str, max_tokens: int) -> str:
+    """
+    Truncate a section to a token budget at line boundaries.
+    
+    Args:
+        section: Section text.
+        max_tokens: Token budget for the section.
+    
+    Returns:
+        The leading lines of the section that fit, or a truncated first line.
+    """
+    if count_tokens(section) <= max_tokens:
+        return section
+    
+    lines = []
+    used = 0
+    for line in section.split("\n"):
+        # Each line break costs about one token
+        size = count_tokens(line) + 1
+        if used + size > max_tokens:
+            if not lines:
+                return truncate_to_tokens(line, max_tokens)
+            break
+        lines.append(line)
+        used += size
+    return "\n".join(lines)
@@ -0,0 +1,86 @@
+"""
+Token counting utilities for RecruitReach.
+
+This module provides token counting with a local tokenizer, falling back
+to a character-based estimate when no tokenizer is available.
+"""
+
+import threading
+from typing import Any, Optional
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+
+# Encoding used by the gpt-4o model family
+DEFAULT_ENCODING = "o200k_base"
+
+# Average characters per token for English text
+CHARS_PER_TOKEN = 4
+
+_encoding: Optional[Any] = None
+_encoding_loaded = False
+_encoding_lock = threading.Lock()
+
+
+def _get_encoding() -> Optional[Any]:
+    """
+    Get the tiktoken encoding, loading it on first use.
+    
+    Returns:
+        The encoding, or None if tiktoken or its encoding files are unavailable.
+    """
+    global _encoding, _encoding_loaded
+    
+    with _encoding_lock:
+        if not _encoding_loaded:
+            _encoding_loaded = True
+            if tiktoken is not None:
+                try:
+                    _encoding = tiktoken.get_encoding(DEFAULT_ENCODING)
+                except Exception as e:
+                    # Encoding files are downloaded on first use and may be unreachable
+                    print(f"Tokenizer unavailable, estimating tokens: {str(e)}")
+        return _encoding
+
+
+def count_tokens(text: str) -> int:
+    """
+    Count the tokens in a text.
+    
+    Args:
+        text: Text to count.
+    
+    Returns:
+        Number of tokens, or an estimate if no tokenizer is available.
+    """
+    if not text:
+        return 0
+    encoding = _get_encoding()
+    if encoding is None:
+        return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Truncate a text to at most a number of tokens.
+    
+    Args:
+        text: Text to truncate.
+        max_tokens: Maximum number of tokens to keep.
+    
+    Returns:
+        The longest prefix of the text within the budget.
+    """
+    if max_tokens <= 0 or not text:
+        return ""
+    encoding = _get_encoding()
+    if encoding is None:
+        return text[:max_tokens * CHARS_PER_TOKEN]
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
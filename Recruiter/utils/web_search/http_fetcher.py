@@ -0,0 +1,466 @@
+"""
+HTTP Fetcher for RecruitReach.
+
+This module fetches web pages for company research over a shared,
+connection-pooled session. Downloads are streamed with connect and read
+timeouts and a size cap, only HTML and plain text responses are accepted,
+and the main-content text of each page is cached and revalidated with
+conditional GET requests (ETag / Last-Modified).
+"""
+
+import os
+import re
+import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from Recruiter.utils.config.config_manager import ConfigManager
+from Recruiter.utils.file_utils.file_store import entry_paths, evict_entries, read_json, remove_file, write_json
+from Recruiter.utils.file_utils.path_manager import PathManager
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    pass
+
+try:
+    import lxml  # noqa: F401
+    # lxml parses several times faster than the built-in html.parser
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+
+# Connect and read timeouts in seconds
+DEFAULT_TIMEOUT = (5.0, 10.0)
+# Bytes downloaded per page; longer pages are truncated
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024
+# Characters of extracted text kept per page
+DEFAULT_MAX_CHARS = 20000
+
+ALLOWED_CONTENT_TYPES = ("text/html", "application/xhtml+xml", "text/plain")
+USER_AGENT = "Mozilla/5.0 (compatible; RecruitReach/1.0)"
+
+_CHUNK_SIZE = 64 * 1024
+
+# Elements without readable text
+_TEXTLESS_TAGS = ["script", "style", "noscript", "template", "svg", "canvas", "iframe"]
+# Elements that rarely hold page content
+_NOISE_TAGS = ["nav", "header", "footer", "aside", "form", "button", "select"]
+# Words in class or id names of navigation, cookie banners and similar overlays
+_NOISE_NAMES = frozenset({
+    "cookie", "cookies", "consent", "gdpr", "banner", "popup", "modal",
+    "newsletter", "breadcrumb", "breadcrumbs", "sidebar", "navbar", "menu",
+    "share", "social", "related", "advert", "advertisement"
+})
+# Class and id names are split into words at whitespace, dashes and underscores
+_NAME_SEPARATORS = re.compile(r"[\s_-]+")
+_NOISE_ROLES = {"navigation", "banner", "contentinfo", "complementary", "dialog", "alertdialog", "search"}
+_KEPT_TAGS = {"html", "body", "main", "article"}
+
+# Containers of the main content, most specific first
+_MAIN_SELECTORS = ["main", "article", "[role=main]", "#content", "#main", ".content", ".main"]
+# Containers with less text than this are ignored in favour of the body
+_MIN_MAIN_CHARS = 200
+
+_BLOCK_TAGS = ["h1", "h2", "h3", "h4", "h5", "h6", "p", "li", "blockquote", "pre", "td", "th", "dt", "dd"]
+_WHITESPACE = re.compile(r"\s+")
+
+
+def extract_main_text(html: Any, max_chars: Optional[int] = DEFAULT_MAX_CHARS, encoding: Optional[str] = None) -> str:
+    """
+    Extract the main-content text of an HTML page.
+    
+    Scripts, navigation, headers, footers and cookie banners are removed,
+    and the text is taken from the <main> or <article> element when the
+    page has one. Each heading, paragraph, list item or table cell becomes
+    one line. An element that looks like noise is kept if it wraps the main
+    container or most of the page text, as layout wrappers often do.
+    
+    Args:
+        html: HTML page as text or bytes.
+        max_chars: Maximum number of characters returned, or None for no limit.
+        encoding: Encoding of the page when html is bytes, or None to detect it.
+    
+    Returns:
+        Main-content text with one block per line.
+    """
+    soup = BeautifulSoup(html, HTML_PARSER, from_encoding=encoding if isinstance(html, bytes) else None)
+    
+    for element in soup.find_all(_TEXTLESS_TAGS):
+        element.decompose()
+    
+    container = None
+    for selector in _MAIN_SELECTORS:
+        candidate = soup.select_one(selector)
+        if candidate is not None and len(candidate.get_text(" ", strip=True)) >= _MIN_MAIN_CHARS:
+            container = candidate
+            break
+    
+    # Wrappers of the main container or of most of the text are never removed
+    protected = set()
+    if container is not None:
+        protected = {id(container), *(id(parent) for parent in container.parents)}
+    half_text = len((soup.body or soup).get_text(" ", strip=True)) / 2
+    for element in soup.find_all(_is_noise):
+        if element.decomposed or id(element) in protected:
+            continue
+        if len(element.get_text(" ", strip=True)) > half_text:
+            continue
+        element.decompose()
+    
+    if container is None:
+        container = soup.body or soup
+    
+    blocks = [
+        block for block in container.find_all(_BLOCK_TAGS)
+        if block.find(_BLOCK_TAGS) is None
+    ]
+    if blocks:
+        lines = (block.get_text(" ") for block in blocks)
+    else:
+        lines = container.get_text("\n").splitlines()
+    
+    text_lines: List[str] = []
+    length = 0
+    for line in lines:
+        line = _WHITESPACE.sub(" ", line).strip()
+        if not line or (text_lines and line == text_lines[-1]):
+            continue
+        text_lines.append(line)
+        length += len(line) + 1
+        if max_chars is not None and length >= max_chars:
+            break
+    
+    text = "\n".join(text_lines)
+    if max_chars is not None:
+        text = text[:max_chars]
+    return text
+
+
+def _is_noise(element: Any) -> bool:
+    """Check whether an element is navigation, boilerplate or an overlay."""
+    if element.name in _NOISE_TAGS:
+        return True
+    if element.name in _KEPT_TAGS:
+        return False
+    
+    attrs = element.attrs or {}
+    if attrs.get("role") in _NOISE_ROLES or attrs.get("aria-hidden") == "true":
+        return True
+    classes = attrs.get("class") or []
+    names = " ".join(classes if isinstance(classes, list) else [classes])
+    words = _NAME_SEPARATORS.split(f"{names} {attrs.get('id') or ''}".lower())
+    return not _NOISE_NAMES.isdisjoint(words)
+
+
+class PageCache:
+    """
+    On-disk cache of extracted page text with the validators of the response.
+    
+    Entries are keyed by URL and keep the ETag and Last-Modified headers so
+    the page can be revalidated with a conditional GET request.
+    """
+    
+    def __init__(self, cache_dir: Optional[str] = None, max_entries: int = 500):
+        """
+        Initialize the page cache.
+        
+        Args:
+            cache_dir: Directory for cache files. Defaults to 'data/cache/web_pages'.
+            max_entries: Maximum number of pages kept on disk.
+        """
+        self.cache_dir = cache_dir or PathManager().get_cache_dir('web_pages')
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+    
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached page.
+        
+        Args:
+            url: URL of the page.
+        
+        Returns:
+            Entry with 'url', 'text', 'etag', 'last_modified' and 'fetched_at'
+            keys, or None if the page is not cached.
+        """
+        entry = read_json(self._entry_path(url))
+        return entry if isinstance(entry, dict) else None
+    
+    def set(self, url: str, text: str, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """
+        Cache the text of a page.
+        
+        Args:
+            url: URL of the page.
+            text: Extracted page text.
+            etag: ETag header of the response.
+            last_modified: Last-Modified header of the response.
+        """
+        entry = {
+            "url": url,
+            "text": text,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": time.time()
+        }
+        
+        with self._lock:
+            write_json(self._entry_path(url), entry)
+            # Drop the least recently fetched pages beyond max_entries
+            evict_entries(self._entry_paths(), self.max_entries)
+    
+    def touch(self, url: str) -> None:
+        """
+        Mark a cached page as just revalidated.
+        
+        Args:
+            url: URL of the page.
+        """
+        entry = self.get(url)
+        if entry is not None:
+            self.set(url, entry["text"], entry.get("etag"), entry.get("last_modified"))
+    
+    def clear(self) -> None:
+        """Remove every cached page."""
+        with self._lock:
+            for path in self._entry_paths():
+                remove_file(path)
+    
+    def _entry_path(self, url: str) -> str:
+        """Get the file path for a URL."""
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def _entry_paths(self) -> List[str]:
+        """List the file paths of all entries."""
+        return entry_paths(self.cache_dir, '.json')
+
+
+class HttpFetcher:
+    """
+    Fetcher of web page text over a shared, connection-pooled session.
+    
+    The session keeps connections alive across requests and threads, so
+    repeated fetches from the same host skip the TCP and TLS handshakes.
+    """
+    
+    def __init__(
+        self,
+        timeout: Tuple[float, float] = DEFAULT_TIMEOUT,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_chars: Optional[int] = DEFAULT_MAX_CHARS,
+        pool_size: int = 10,
+        retries: int = 1,
+        cache: Optional[PageCache] = None,
+        max_age_seconds: float = 60 * 60
+    ):
+        """
+        Initialize the fetcher.
+        
+        Args:
+            timeout: Connect and read timeouts in seconds.
+            max_bytes: Maximum number of bytes downloaded per page.
+            max_chars: Maximum number of characters of text kept per page.
+            pool_size: Number of connections kept alive per host.
+            retries: Number of retries on connection errors and 502/503/504 responses.
+            cache: Cache of page text, or None to fetch every page again.
+            max_age_seconds: Age in seconds below which a cached page is used
+                without revalidating it.
+        """
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        self.max_chars = max_chars
+        self.cache = cache
+        self.max_age_seconds = max_age_seconds
+        self.pool_size = pool_size
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        
+        retry = Retry(
+            total=retries,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "User-Agent": USER_AGENT,
+            "Accept": "text/html,application/xhtml+xml;q=0.9,text/plain;q=0.8"
+        })
+    
+    def fetch_text(self, url: str) -> Optional[str]:
+        """
+        Fetch the main-content text of a web page.
+        
+        A cached page younger than max_age_seconds is returned as it is. An
+        older one is revalidated with a conditional GET request and reused
+        when the server answers 304 Not Modified.
+        
+        Args:
+            url: URL of the page.
+        
+        Returns:
+            Main-content text of the page, or None if it could not be fetched
+            or is not an HTML or text page.
+        """
+        cached = self.cache.get(url) if self.cache else None
+        if cached and time.time() - cached.get("fetched_at", 0) < self.max_age_seconds:
+            return cached["text"]
+        
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+        
+        try:
+            with self.session.get(url, headers=headers, timeout=self.timeout, stream=True) as response:
+                if response.status_code == 304 and cached:
+                    self.cache.touch(url)
+                    return cached["text"]
+                response.raise_for_status()
+                
+                content_type = response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+                if content_type and content_type not in ALLOWED_CONTENT_TYPES:
+                    print(f"Error fetching {url}: unsupported content type {content_type}")
+                    return None
+                
+                content = self._read_capped(response)
+                # Only trust an explicit charset; otherwise let the parser detect it
+                has_charset = "charset=" in response.headers.get("Content-Type", "").lower()
+                encoding = response.encoding if has_charset else None
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+        except requests.RequestException as e:
+            print(f"Error fetching {url}: {str(e)}")
+            return None
+        
+        if content_type == "text/plain":
+            text = content.decode(encoding or "utf-8", errors="replace")[:self.max_chars]
+        else:
+            text = extract_main_text(content, self.max_chars, encoding)
+        
+        if self.cache and text:
+            try:
+                self.cache.set(url, text, etag, last_modified)
+            except OSError as e:
+                print(f"Error caching {url}: {str(e)}")
+        return text
+    
+    def fetch_many(self, urls: List[str]) -> List[Optional[str]]:
+        """
+        Fetch the main-content text of several web pages concurrently.
+        
+        Args:
+            urls: URLs of the pages.
+        
+        Returns:
+            Text of each page in the order of urls, None for pages that
+            could not be fetched or parsed. A failing page does not affect
+            the others.
+        """
+        if len(urls) <= 1:
+            return [self._fetch_text_or_none(url) for url in urls]
+        return list(self._get_executor().map(self._fetch_text_or_none, urls))
+    
+    def _fetch_text_or_none(self, url: str) -> Optional[str]:
+        """
+        Fetch the text of a web page, reporting any failure instead of raising.
+        
+        Args:
+            url: URL of the page.
+        
+        Returns:
+            Main-content text of the page, or None if fetching or parsing failed.
+        """
+        try:
+            return self.fetch_text(url)
+        except Exception as e:
+            print(f"Error fetching {url}: {str(e)}")
+            return None
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the executor for concurrent fetches, creating it on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.pool_size, thread_name_prefix="web-fetch")
+            return self._executor
+    
+    def _read_capped(self, response: requests.Response) -> bytes:
+        """
+        Read a streamed response body up to max_bytes.
+        
+        Args:
+            response: Response opened with stream=True.
+        
+        Returns:
+            Body of the response, truncated to max_bytes.
+        """
+        buffer = bytearray()
+        for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+            buffer.extend(chunk)
+            if len(buffer) >= self.max_bytes:
+                del buffer[self.max_bytes:]
+                break
+        return bytes(buffer)
+    
+    def close(self) -> None:
+        """Close the pooled connections and stop the fetch threads."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+        self.session.close()
+
+
+_default_fetcher: Optional[HttpFetcher] = None
+_default_fetcher_lock = threading.Lock()
+
+
+def get_http_fetcher() -> HttpFetcher:
+    """
+    Get the shared HTTP fetcher configured in config.toml.
+    
+    The fetcher is configured by the optional [web_fetch] section with the
+    keys 'connect_timeout', 'read_timeout', 'max_bytes', 'max_chars',
+    'pool_size', 'retries', 'cache_enabled', 'cache_max_entries' and
+    'max_age_seconds'.
+    
+    Returns:
+        The shared HttpFetcher instance.
+    """
+    global _default_fetcher
+    
+    with _default_fetcher_lock:
+        if _default_fetcher is None:
+            settings = ConfigManager().get_section('web_fetch')
+            cache = None
+            if settings.get('cache_enabled', True):
+                cache = PageCache(max_entries=settings.get('cache_max_entries', 500))
+            _default_fetcher = HttpFetcher(
+                timeout=(
+                    settings.get('connect_timeout', DEFAULT_TIMEOUT[0]),
+                    settings.get('read_timeout', DEFAULT_TIMEOUT[1])
+                ),
+                max_bytes=settings.get('max_bytes', DEFAULT_MAX_BYTES),
+                max_chars=settings.get('max_chars', DEFAULT_MAX_CHARS) or None,
+                pool_size=settings.get('pool_size', 10),
+                retries=settings.get('retries', 1),
+                cache=cache,
+                max_age_seconds=settings.get('max_age_seconds', 60 * 60)
+            )
+        return _default_fetcher
@@ -0,0 +1,147 @@
+"""
+Research Agent for RecruitReach.
+
+This module keeps one long-lived web search agent per OpenAI API key.
+Each agent owns an AsyncOpenAI client for its key instead of reading the
+key from os.environ, so sessions with different keys can research
+concurrently. All agent runs execute on one background event loop, which
+keeps the clients' connection pools usable across calls from sync code
+and from other event loops.
+"""
+
+import asyncio
+import hashlib
+import threading
+from concurrent.futures import Future
+from typing import Dict, Optional
+
+from Recruiter.prompts.company_research_prompts import OPENAI_WEB_SERACH_PROMPT
+from Recruiter.services.llm.model_router import TASK_WEB_RESEARCH, get_model_profile
+
+try:
+    from openai import AsyncOpenAI
+    from agents import Agent, ModelSettings, OpenAIResponsesModel, RunConfig, Runner, WebSearchTool
+except ImportError:
+    pass
+
+
+class ResearchAgent:
+    """Web search agent bound to one OpenAI API key."""
+    
+    def __init__(self, api_key: str):
+        """
+        Initialize the agent with its own OpenAI client.
+        
+        The model and its settings come from the web_research model profile.
+        
+        Args:
+            api_key: OpenAI API key used for every run of this agent.
+        """
+        profile = get_model_profile(TASK_WEB_RESEARCH)
+        client_options = {"timeout": profile.timeout} if profile.timeout else {}
+        self.client = AsyncOpenAI(api_key=api_key, **client_options)
+        self.agent = Agent(
+            name="Assistant",
+            instructions=OPENAI_WEB_SERACH_PROMPT,
+            tools=[WebSearchTool()],
+            model=OpenAIResponsesModel(model=profile.model, openai_client=self.client),
+            model_settings=ModelSettings(temperature=profile.temperature, max_tokens=profile.max_tokens)
+        )
+        # Tracing would export with the key in os.environ rather than this one
+        self.run_config = RunConfig(tracing_disabled=True)
+    
+    async def run(self, company_name: str) -> str:
+        """
+        Research a company with web search.
+        
+        Args:
+            company_name: Name of the company to research.
+        
+        Returns:
+            Final output of the agent.
+        """
+        result = await Runner.run(self.agent, company_name, run_config=self.run_config)
+        return result.final_output
+
+
+_agents: Dict[str, ResearchAgent] = {}
+_agents_lock = threading.Lock()
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_research_agent(api_key: str) -> ResearchAgent:
+    """
+    Get the shared research agent for an API key.
+    
+    Args:
+        api_key: OpenAI API key.
+    
+    Returns:
+        ResearchAgent for the key, created on first use.
+    """
+    key = hashlib.sha256(api_key.encode('utf-8')).hexdigest()
+    with _agents_lock:
+        agent = _agents.get(key)
+        if agent is None:
+            agent = ResearchAgent(api_key)
+            _agents[key] = agent
+        return agent
+
+
+def run_research_agent(company_name: str, api_key: str) -> str:
+    """
+    Research a company with the agent for an API key, blocking until done.
+    
+    Args:
+        company_name: Name of the company to research.
+        api_key: OpenAI API key.
+    
+    Returns:
+        Final output of the agent.
+    """
+    return submit_research_agent(company_name, api_key).result()
+
+
+async def arun_research_agent(company_name: str, api_key: str) -> str:
+    """
+    Research a company with the agent for an API key asynchronously.
+    
+    Cancelling the caller cancels the agent run.
+    
+    Args:
+        company_name: Name of the company to research.
+        api_key: OpenAI API key.
+    
+    Returns:
+        Final output of the agent.
+    """
+    return await asyncio.wrap_future(submit_research_agent(company_name, api_key))
+
+
+def submit_research_agent(company_name: str, api_key: str) -> Future:
+    """
+    Start researching a company with the agent for an API key.
+    
+    The run is scheduled on the background event loop without waiting for
+    it. Cancelling the returned future cancels the run on the loop.
+    
+    Args:
+        company_name: Name of the company to research.
+        api_key: OpenAI API key.
+    
+    Returns:
+        Future of the agent's final output.
+    """
+    agent = get_research_agent(api_key)
+    return asyncio.run_coroutine_threadsafe(agent.run(company_name), _get_loop())
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Get the background event loop for agent runs, starting it on first use."""
+    global _loop
+    
+    with _agents_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="research-agent-loop", daemon=True).start()
+        return _loop
@@ -5,25 +5,77 @@ This module provides utilities for web search operations.
 """
 
 import os
-import requests
+import re
+from concurrent.futures import Future
 from typing import Optional, Dict, Any, List
-from Recruiter.prompts.company_research_prompts import OPENAI_WEB_SERACH_PROMPT
+from Recruiter.utils.config.config_manager import ConfigManager
+from Recruiter.utils.web_search.http_fetcher import get_http_fetcher
+from Recruiter.utils.web_search.research_agent import arun_research_agent, run_research_agent, submit_research_agent
 try:
-    from bs4 import BeautifulSoup
     from googlesearch import search
 except ImportError:
     pass
 
-try:
-    from agents import Agent, Runner, WebSearchTool
-except ImportError:
-    pass
+
+# Search results fetched per company and characters kept in the profile
+DEFAULT_SEARCH_RESULTS = 3
+DEFAULT_PROFILE_MAX_CHARS = 12000
+
+_NON_WORD = re.compile(r"\W+")
+
+
+def build_company_profile(pages: List[Dict[str, str]], max_chars: int = DEFAULT_PROFILE_MAX_CHARS) -> str:
+    """
+    Combine the text of several web pages into one company profile.
+    
+    Lines already taken from an earlier page are skipped, so boilerplate
+    and content repeated across sites appear only once. Pages keep their
+    search order and each gets an equal share of the remaining budget, so
+    space a short page does not use goes to the pages after it.
+    
+    Args:
+        pages: Pages with 'url' and 'text' keys, best search result first.
+        max_chars: Maximum number of characters of the profile.
+    
+    Returns:
+        Profile text with one section per page.
+    """
+    seen = set()
+    sections = []
+    remaining = max_chars
+    
+    for index, page in enumerate(pages):
+        header = f"Source: {page['url']}"
+        budget = remaining // (len(pages) - index) - len(header) - 2
+        
+        lines = []
+        used = 0
+        for line in page["text"].splitlines():
+            key = _NON_WORD.sub(" ", line).strip().casefold()
+            if not key or key in seen:
+                continue
+            if used + len(line) + 1 > budget:
+                break
+            seen.add(key)
+            lines.append(line)
+            used += len(line) + 1
+        
+        if lines:
+            section = header + "\n" + "\n".join(lines)
+            sections.append(section)
+            remaining -= len(section) + 2
+    
+    return "\n\n".join(sections)
 
 
 def get_company_info_bs4(company_name: str) -> Optional[str]:
     """
     Get company information using BeautifulSoup and googlesearch.
     
+    The top search results are fetched concurrently through the shared HTTP
+    fetcher, reduced to their main-content text and combined into one
+    bounded company profile.
+    
     Args:
         company_name: Name of the company to research.
         
@@ -31,22 +83,16 @@ def get_company_info_bs4(company_name: str) -> Optional[str]:
         Company information as text, or None if an error occurred.
     """
     try:
+        settings = ConfigManager().get_section('web_fetch')
+        num_results = settings.get('search_results', DEFAULT_SEARCH_RESULTS)
+        max_chars = settings.get('profile_max_chars', DEFAULT_PROFILE_MAX_CHARS)
+        
         # Search for company information using Google
-        search_results = search(f"{company_name} company overview", num_results=2)
-    
-        # Extract relevant information from the search results
-        company_info = {}
-        for result in search_results:
-            # Fetch the webpage content
-            response = requests.get(result)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract relevant text from the webpage
-            company_info['description'] = soup.get_text()
-            company_info['name'] = company_name
-            break  # For now, just use the first result
+        urls = list(dict.fromkeys(search(f"{company_name} company overview", num_results=num_results)))
         
-        return company_info['description']
+        texts = get_http_fetcher().fetch_many(urls)
+        pages = [{"url": url, "text": text} for url, text in zip(urls, texts) if text]
+        return build_company_profile(pages, max_chars) or None
     except Exception as e:
         print(f"Error during research: {e}")
         return None
@@ -56,27 +102,79 @@ def get_company_info_agent(company_name: str, api_key: Optional[str] = None) ->
     """
     Get company information using Agent with WebSearchTool.
     
+    The agent for the API key is created once and reused; it is given the
+    key through its own client, so os.environ is never modified.
+    
     Args:
         company_name: Name of the company to research.
-        api_key: OpenAI API key. If provided, will be used for the search.
+        api_key: OpenAI API key. If not provided, will try to get from config.
         
     Returns:
         Company information as text, or None if an error occurred.
     """
     try:
-        if api_key:
-            os.environ['OPENAI_API_KEY'] = api_key
-            
-        agent = Agent(
-            name="Assistant",
-            instructions=OPENAI_WEB_SERACH_PROMPT,
-            tools=[
-                WebSearchTool(),
-            ],
-        )
+        return run_research_agent(company_name, _resolve_api_key(api_key))
+    except Exception as e:
+        print(f"Error during research: {e}")
+        return None
+
+
+def submit_company_info_agent(company_name: str, api_key: Optional[str] = None) -> Future:
+    """
+    Start getting company information using Agent with WebSearchTool.
+    
+    The agent runs on its background event loop without blocking the caller,
+    and cancelling the returned future cancels the run.
+    
+    Args:
+        company_name: Name of the company to research.
+        api_key: OpenAI API key. If not provided, will try to get from config.
+        
+    Returns:
+        Future of the company information as text. The future already holds
+        None if the run could not be started.
+    """
+    try:
+        return submit_research_agent(company_name, _resolve_api_key(api_key))
+    except Exception as e:
+        print(f"Error during research: {e}")
+        future = Future()
+        future.set_result(None)
+        return future
+
+
+async def aget_company_info_agent(company_name: str, api_key: Optional[str] = None) -> Optional[str]:
+    """
+    Get company information using Agent with WebSearchTool asynchronously.
+    
+    Args:
+        company_name: Name of the company to research.
+        api_key: OpenAI API key. If not provided, will try to get from config.
         
-        messages = Runner.run_sync(agent, company_name)
-        return messages.final_output
+    Returns:
+        Company information as text, or None if an error occurred.
+    """
+    try:
+        return await arun_research_agent(company_name, _resolve_api_key(api_key))
     except Exception as e:
         print(f"Error during research: {e}")
         return None
+
+
+def _resolve_api_key(api_key: Optional[str]) -> str:
+    """
+    Get the API key for the research agent.
+    
+    Args:
+        api_key: OpenAI API key, or None to read it from config or the environment.
+    
+    Returns:
+        The API key.
+    
+    Raises:
+        ValueError: If no API key is available.
+    """
+    api_key = api_key or ConfigManager().get_value("openai", "OPENAI_API_KEY") or os.environ.get("OPENAI_API_KEY")
+    if not api_key:
+        raise ValueError("OpenAI API key not provided and not found in config")
+    return api_key
@@ -13,10 +13,13 @@ from typing import Optional, Dict, Any, Tuple
 from PyPDF2 import PdfReader
 from docx import Document
 
+from Recruiter.core.resume.resume_extractor import ResumeExtractor
 from Recruiter.core.resume.resume_parser import ResumeParser
+from Recruiter.core.resume.resume_store import get_resume_store
 from Recruiter.core.company_research.company_researcher import CompanyResearcher
 from Recruiter.core.email.email_generator import EmailGenerator
 from Recruiter.core.cover_letter.cover_letter_generator import CoverLetterGenerator
+from Recruiter.models.schemas import EmailContent, CoverLetterContent
 from Recruiter.services.email_service.email_sender import EmailSenderService
 from Recruiter.utils.config.config_manager import ConfigManager
 from Recruiter.utils.file_utils.path_manager import PathManager
@@ -102,8 +105,11 @@ def initialize_session_state() -> None:
         st.session_state.company_info = None
     if 'resume' not in st.session_state:
         st.session_state.resume = None
-    if 'uploaded_resume' not in st.session_state:
-        st.session_state.uploaded_resume = None
+    # Uploaded resumes are kept on disk; the session only references them
+    if 'resume_hash' not in st.session_state:
+        st.session_state.resume_hash = None
+    if 'resume_path' not in st.session_state:
+        st.session_state.resume_path = None
     if 'resume_choice' not in st.session_state:
         st.session_state.resume_choice = "default"
     if 'company_name' not in st.session_state:
@@ -124,6 +130,31 @@ def initialize_session_state() -> None:
         st.session_state.theme = "dark"  # Default theme
 
 
+def render_streaming_preview(
+    placeholder: Any,
+    partial: Dict[str, str],
+    text_key: str,
+    html_key: str,
+    subject_key: Optional[str] = None
+) -> None:
+    """
+    Render a partially generated email or cover letter.
+    
+    Args:
+        placeholder: Streamlit placeholder to render into.
+        partial: Partial output generated so far.
+        text_key: Key of the plain text field.
+        html_key: Key of the HTML field.
+        subject_key: Optional key of the subject line field.
+    """
+    with placeholder.container():
+        if subject_key and partial.get(subject_key):
+            st.markdown(f"**Subject:** {partial[subject_key]}")
+        st.text(partial.get(text_key, ""))
+        if partial.get(html_key):
+            st.caption("Formatting HTML version...")
+
+
 def load_css() -> str:
     """
     Load CSS styles for the application.
@@ -386,10 +417,11 @@ def main() -> None:
             resume_uploader = st.file_uploader("Upload your resume", type=['pdf', 'docx'], key="resume_upload")
             if resume_uploader is not None:
                 try:
-                    file_content = resume_uploader.read()
-                    # Store the uploaded file content and name
-                    st.session_state.uploaded_resume = file_content
-                    st.session_state.resume_filename = resume_uploader.name
+                    # Store the upload on disk and keep only its hash, path and name
+                    stored_resume = get_resume_store().save(resume_uploader, resume_uploader.name)
+                    st.session_state.resume_hash = stored_resume.content_hash
+                    st.session_state.resume_path = stored_resume.path
+                    st.session_state.resume_filename = stored_resume.filename
                     st.markdown('<div class="success">', unsafe_allow_html=True)
                     st.success(f"Resume '{resume_uploader.name}' uploaded successfully!")
                     st.markdown('</div>', unsafe_allow_html=True)
@@ -512,11 +544,15 @@ def main() -> None:
                                 st.error("Default resume not found. Please upload a resume.")
                                 st.stop()
                         else:
-                            if st.session_state.uploaded_resume:
+                            if st.session_state.resume_path:
+                                # Uploads not used for a while are evicted from the shared store
+                                if get_resume_store().get(st.session_state.resume_path) is None:
+                                    st.warning("Your uploaded resume is no longer available. Please upload it again.")
+                                    st.session_state.resume_path = None
+                                    st.stop()
                                 try:
-                                    resume = resume_parser.load_resume_from_bytes(
-                                        st.session_state.uploaded_resume,
-                                        st.session_state.resume_filename
+                                    resume = resume_parser.load_resume_from_file(
+                                        st.session_state.resume_path
                                     )
                                 except Exception as e:
                                     st.error(f"Error parsing resume: {str(e)}")
@@ -525,6 +561,19 @@ def main() -> None:
                                 st.error("Please upload a resume first.")
                                 st.stop()
                     
+                    # Structured resume, extracted once per resume and reused by every generation
+                    resume_input = resume
+                    if st.session_state.openai_api_key and ConfigManager().get_section('resume').get('structured', True):
+                        with st.spinner("Reading resume..."):
+                            try:
+                                resume_input = ResumeExtractor(api_key=st.session_state.openai_api_key).extract(
+                                    resume,
+                                    content_hash=st.session_state.resume_hash if st.session_state.resume_choice == "Upload Resume" else None
+                                )
+                            except Exception as e:
+                                # Fall back to the resume text
+                                print(f"Error extracting structured resume: {str(e)}")
+                    
                     # Research company
                     with st.spinner("Researching company..."):
                         if not st.session_state.openai_api_key:
@@ -532,7 +581,7 @@ def main() -> None:
                             st.stop()
                         
                         company_researcher = CompanyResearcher(api_key=st.session_state.openai_api_key)
-                        company_info = company_researcher.research_company(company_name)
+                        company_info = company_researcher.research_company(company_name, recruiter_email)
                     
                     # Store common variables in session state
                     st.session_state.job_desc = job_desc
@@ -549,15 +598,21 @@ def main() -> None:
                                 st.stop()
                             
                             email_generator = EmailGenerator(api_key=st.session_state.openai_api_key)
-                            email_content = email_generator.generate_email(
+                            
+                            # Render the email progressively as it streams in
+                            preview = st.empty()
+                            partial_email = {}
+                            for partial_email in email_generator.stream_email(
                                 job_desc,
                                 company_info,
-                                resume,
+                                resume_input,
                                 recruiter_email,
                                 job_position,
                                 job_source,
                                 company_name
-                            )
+                            ):
+                                render_streaming_preview(preview, partial_email, "body_text", "body_html", "subject")
+                            email_content = EmailContent.model_validate(partial_email)
                             
                             # Store email-specific variables
                             st.session_state.recruiter_email = recruiter_email
@@ -578,13 +633,19 @@ def main() -> None:
                                 st.stop()
                             
                             cover_letter_generator = CoverLetterGenerator(api_key=st.session_state.openai_api_key)
-                            cover_letter_content = cover_letter_generator.generate_cover_letter(
+                            
+                            # Render the cover letter progressively as it streams in
+                            preview = st.empty()
+                            partial_cover_letter = {}
+                            for partial_cover_letter in cover_letter_generator.stream_cover_letter(
                                 job_desc,
                                 company_info,
-                                resume,
+                                resume_input,
                                 job_position,
                                 company_name
-                            )
+                            ):
+                                render_streaming_preview(preview, partial_cover_letter, "content_text", "content_html")
+                            cover_letter_content = CoverLetterContent.model_validate(partial_cover_letter)
                             
                             # Store cover letter in session state
                             st.session_state.generated_cover_letter = {
@@ -732,8 +793,12 @@ def main() -> None:
                     if st.session_state.resume_choice == "Use Default Resume":
                         path_manager = PathManager()
                         attachment = str(path_manager.get_resume_path())
-                    elif st.session_state.uploaded_resume:
-                        attachment = st.session_state.uploaded_resume
+                    elif st.session_state.resume_path:
+                        attachment = get_resume_store().get(st.session_state.resume_path)
+                        if attachment is None:
+                            st.warning("Your uploaded resume is no longer available. Please upload it again.")
+                            st.session_state.resume_path = None
+                            st.stop()
                     
                     # Send email
                     success = email_sender.send_email(
@@ -765,16 +830,15 @@ def main() -> None:
                             st.error("OpenAI API key is required to regenerate emails.")
                             st.stop()
                         
+                        # Revise the current draft instead of regenerating from scratch
                         email_generator = EmailGenerator(api_key=st.session_state.openai_api_key)
-                        email_content = email_generator.generate_email(
-                            st.session_state.job_desc,
-                            st.session_state.company_info,
-                            st.session_state.resume,
-                            st.session_state.recruiter_email,
-                            st.session_state.job_position,
-                            st.session_state.job_source,
-                            st.session_state.company_name,
-                            feedback=feedback
+                        email_content = email_generator.revise_email(
+                            EmailContent(
+                                subject=st.session_state.email_subject,
+                                body_text=st.session_state.generated_email.get("text"),
+                                body_html=st.session_state.generated_email.get("html")
+                            ),
+                            feedback
                         )
                         
                         st.session_state.email_subject = email_content.subject
@@ -928,14 +992,14 @@ def main() -> None:
                             st.error("OpenAI API key is required to regenerate cover letters.")
                             st.stop()
                         
+                        # Revise the current draft instead of regenerating from scratch
                         cover_letter_generator = CoverLetterGenerator(api_key=st.session_state.openai_api_key)
-                        cover_letter_content = cover_letter_generator.generate_cover_letter(
-                            st.session_state.job_desc,
-                            st.session_state.company_info,
-                            st.session_state.resume,
-                            st.session_state.job_position,
-                            st.session_state.company_name,
-                            feedback=feedback
+                        cover_letter_content = cover_letter_generator.revise_cover_letter(
+                            CoverLetterContent(
+                                content_text=st.session_state.generated_cover_letter.get("text"),
+                                content_html=st.session_state.generated_cover_letter.get("html")
+                            ),
+                            feedback
                         )
                         
                         st.session_state.generated_cover_letter = {
@@ -0,0 +1,56 @@
+"""
+Benchmark for the compiled-chain cache.
+
+This script measures the per-call overhead of preparing the prompt chain in
+LLMService.generate_with_template with and without the chain cache. No
+requests are sent to OpenAI; only chain construction is timed.
+
+Usage:
+    python benchmarks/bench_chain_cache.py [iterations]
+"""
+
+import os
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from Recruiter.models.schemas import CoverLetterContent, EmailContent, JobDetails
+from Recruiter.prompts.company_research_prompts import JOB_DETAILS_EXTRACTION_PROMPT
+from Recruiter.prompts.cover_letter_prompts import COVER_LETTER_GENERATION_PROMPT
+from Recruiter.prompts.email_prompts import EMAIL_GENERATION_PROMPT
+from Recruiter.services.llm.chain_cache import chain_cache
+from Recruiter.services.llm.llm_service import LLMService
+
+
+CASES = [
+    ("email", EMAIL_GENERATION_PROMPT, EmailContent),
+    ("cover_letter", COVER_LETTER_GENERATION_PROMPT, CoverLetterContent),
+    ("extraction", JOB_DETAILS_EXTRACTION_PROMPT, JobDetails),
+]
+
+
+def main() -> None:
+    """Run the benchmark and print per-call timings in microseconds."""
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    llm_service = LLMService(api_key=os.environ.get("OPENAI_API_KEY", "sk-benchmark"))
+    
+    print(f"{'case':<14}{'uncached (us)':>16}{'cached (us)':>14}{'speedup':>10}")
+    for name, template, schema in CASES:
+        def uncached():
+            chat_prompt = llm_service._build_prompt(template)
+            llm_service._build_chain(chat_prompt, schema)
+        
+        def cached():
+            llm_service._compile(template, schema)
+        
+        chain_cache.clear()
+        cached()  # Warm the cache
+        uncached_us = timeit.timeit(uncached, number=iterations) / iterations * 1e6
+        cached_us = timeit.timeit(cached, number=iterations) / iterations * 1e6
+        print(f"{name:<14}{uncached_us:>16.1f}{cached_us:>14.1f}{uncached_us / cached_us:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
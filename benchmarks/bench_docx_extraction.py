@@ -0,0 +1,76 @@
+"""
+Benchmark for DOCX resume text extraction.
+
+This script builds DOCX documents of increasing size with paragraphs and a
+skills table and measures the time and peak Python memory of the previous
+python-docx paragraph walk against the streaming extractor.
+
+Usage:
+    python benchmarks/bench_docx_extraction.py [repeats]
+"""
+
+import io
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from docx import Document
+
+from Recruiter.core.resume.docx_extractor import extract_docx_text
+
+
+PARAGRAPH_COUNTS = [50, 500, 5000]
+
+
+def build_docx(paragraph_count: int) -> bytes:
+    """Build a DOCX with paragraph_count paragraphs and a table row per ten paragraphs."""
+    document = Document()
+    for index in range(paragraph_count):
+        document.add_paragraph(f"Delivered project {index} with Python, SQL and Kubernetes, improving latency by 20%.")
+    table = document.add_table(rows=paragraph_count // 10, cols=2)
+    for index, row in enumerate(table.rows):
+        row.cells[0].text = f"Skill group {index}"
+        row.cells[1].text = "Python, Go, AWS"
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def legacy_extract(file_content: bytes) -> str:
+    """Previous DOCX path of ResumeParser."""
+    doc = Document(io.BytesIO(file_content))
+    return '\n'.join([paragraph.text for paragraph in doc.paragraphs])
+
+
+def measure(extract, file_content: bytes, repeats: int):
+    """Return the mean seconds and the peak traced memory of an extractor."""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        extract(file_content)
+    elapsed = (time.perf_counter() - start) / repeats
+    
+    tracemalloc.start()
+    extract(file_content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    """Run the benchmark and print time and peak memory for each extractor."""
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    extractors = [("python-docx (previous)", legacy_extract), ("streaming", extract_docx_text)]
+    
+    print(f"{'paragraphs':<12}{'extractor':<24}{'ms':>10}{'peak MB':>10}")
+    for paragraph_count in PARAGRAPH_COUNTS:
+        file_content = build_docx(paragraph_count)
+        for name, extract in extractors:
+            elapsed, peak = measure(extract, file_content, repeats)
+            print(f"{paragraph_count:<12}{name:<24}{elapsed * 1000:>10.1f}{peak / 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark for PDF resume text extraction.
+
+This script builds a corpus of multi-page resumes by repeating the pages of
+data/resume.pdf and measures per-page extraction throughput of the previous
+bytes path (PyPDF2 with string concatenation) against the unified extractor
+with each installed backend, then compares serial and parallel extraction
+of a long document.
+
+Usage:
+    python benchmarks/bench_pdf_extraction.py [repeats]
+"""
+
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pypdf import PdfReader, PdfWriter
+
+from Recruiter.core.resume.pdf_extractor import (
+    BACKEND_PYMUPDF,
+    BACKEND_PYPDF,
+    extract_pdf_text,
+    pymupdf
+)
+from Recruiter.utils.file_utils.path_manager import PathManager
+
+
+PAGE_COUNTS = [1, 2, 5, 10, 20]
+LONG_DOCUMENT_PAGES = 200
+
+
+def build_pdf(page_count: int) -> bytes:
+    """Build a PDF with page_count pages from the default resume."""
+    source = PdfReader(str(PathManager().get_resume_path()))
+    writer = PdfWriter()
+    for index in range(page_count):
+        writer.add_page(source.pages[index % len(source.pages)])
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def build_corpus() -> list:
+    """Build resumes with PAGE_COUNTS pages from the default resume."""
+    return [build_pdf(page_count) for page_count in PAGE_COUNTS]
+
+
+def legacy_extract(file_content: bytes) -> str:
+    """Previous bytes path of ResumeParser."""
+    from PyPDF2 import PdfReader as LegacyPdfReader
+    
+    pdf_reader = LegacyPdfReader(io.BytesIO(file_content))
+    text = ""
+    for page in pdf_reader.pages:
+        text += page.extract_text()
+    return text
+
+
+def main() -> None:
+    """Run the benchmark and print pages per second for each extractor."""
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    corpus = build_corpus()
+    total_pages = sum(PAGE_COUNTS) * repeats
+    
+    extractors = [
+        ("PyPDF2 (previous)", legacy_extract),
+        ("pypdf", lambda content: extract_pdf_text(content, BACKEND_PYPDF)),
+    ]
+    if pymupdf is not None:
+        extractors.append(("pymupdf", lambda content: extract_pdf_text(content, BACKEND_PYMUPDF)))
+    
+    print(f"{len(corpus)} resumes ({', '.join(map(str, PAGE_COUNTS))} pages) x {repeats} repeats")
+    print(f"{'extractor':<20}{'pages/s':>10}{'ms/page':>10}")
+    for name, extract in extractors:
+        start = time.perf_counter()
+        for _ in range(repeats):
+            for file_content in corpus:
+                extract(file_content)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<20}{total_pages / elapsed:>10.1f}{elapsed / total_pages * 1000:>10.2f}")
+    
+    document = build_pdf(LONG_DOCUMENT_PAGES)
+    # Start the worker processes before timing
+    extract_pdf_text(document, parallel_threshold=1)
+    
+    print(f"\n{LONG_DOCUMENT_PAGES}-page document")
+    print(f"{'mode':<20}{'pages/s':>10}{'ms/page':>10}")
+    for name, threshold in [("serial", None), ("parallel", 1)]:
+        start = time.perf_counter()
+        for _ in range(repeats):
+            extract_pdf_text(document, parallel_threshold=threshold)
+        elapsed = time.perf_counter() - start
+        pages = LONG_DOCUMENT_PAGES * repeats
+        print(f"{name:<20}{pages / elapsed:>10.1f}{elapsed / pages * 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
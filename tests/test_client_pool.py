@@ -0,0 +1,116 @@
+"""
+Tests for the LLM client pool.
+
+This module contains tests for the shared language model client registry.
+"""
+
+import os
+import json
+import asyncio
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+from Recruiter.services.llm import client_pool
+from Recruiter.services.llm.llm_service import LLMService
+
+
+class FakeCompletionHandler(BaseHTTPRequestHandler):
+    """Keep-alive HTTP handler answering every request with a chat completion."""
+    
+    protocol_version = "HTTP/1.1"
+    
+    def do_POST(self):
+        """Reply with a fixed chat completion."""
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = json.dumps({
+            "id": "chatcmpl-test",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "gpt-4o-mini",
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": "hello"},
+                "finish_reason": "stop"
+            }],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2}
+        }).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        """Silence request logging."""
+
+
+class TestClientPool(unittest.TestCase):
+    """Tests for the client pool functions."""
+    
+    def tearDown(self):
+        """Reset the process-wide pool."""
+        client_pool.clear_pool()
+    
+    def test_clients_are_reused_per_key(self):
+        """Test that identical parameters return the same client."""
+        first = client_pool.get_chat_model("gpt-4o-mini", 0.2, "test_api_key")
+        second = client_pool.get_chat_model("gpt-4o-mini", 0.2, "test_api_key")
+        
+        self.assertIs(first, second)
+    
+    def test_clients_share_http_pool(self):
+        """Test that different keys get separate clients over one HTTP pool."""
+        first = client_pool.get_chat_model("gpt-4o-mini", 0.2, "key_a")
+        second = client_pool.get_chat_model("gpt-4o-mini", 0.7, "key_b")
+        
+        self.assertIsNot(first, second)
+        self.assertIs(first.http_client, second.http_client)
+    
+    def test_async_calls_in_separate_event_loops(self):
+        """Test that pooled async connections are not reused across event loops."""
+        # Arrange
+        server = ThreadingHTTPServer(("127.0.0.1", 0), FakeCompletionHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+        
+        with patch.dict(os.environ, {"OPENAI_API_BASE": base_url}):
+            service = LLMService(api_key="loop_test_key", metrics_sink=MagicMock())
+            
+            # Act
+            first = asyncio.run(service.agenerate_text("hi"))
+            second = asyncio.run(service.agenerate_text("hi"))
+        
+        # Assert
+        self.assertEqual(first, "hello")
+        self.assertEqual(second, "hello")
+    
+    def test_clear_pool_closes_both_clients(self):
+        """Test that clearing the pool closes the sync and async HTTP clients."""
+        # Arrange
+        http_client, _ = client_pool._get_http_clients()
+        transport = client_pool._async_transport
+        
+        async def open_pool():
+            return transport._get_transport()
+        
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        loop_transport = loop.run_until_complete(open_pool())
+        
+        # Act
+        with patch.object(loop_transport, 'aclose', wraps=loop_transport.aclose) as mock_aclose:
+            client_pool.clear_pool()
+        
+        # Assert
+        self.assertTrue(http_client.is_closed)
+        mock_aclose.assert_called_once()
+        self.assertIsNone(client_pool._async_transport)
+
+
+if __name__ == '__main__':
+    unittest.main()
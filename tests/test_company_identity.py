@@ -0,0 +1,127 @@
+"""
+Tests for company identity resolution.
+
+This module contains tests for company name normalization, email domains
+and the company alias index.
+"""
+
+import os
+import tempfile
+import unittest
+
+from Recruiter.core.company_research.company_identity import (
+    CompanyAliasIndex,
+    email_domain,
+    normalize_company_name
+)
+
+
+class TestNormalizeCompanyName(unittest.TestCase):
+    """Tests for the normalize_company_name function."""
+    
+    def test_variants_normalize_equal(self):
+        """Test that case, punctuation and legal forms are ignored."""
+        # Arrange
+        variants = {
+            "google": ["Google", "Google LLC", "google inc.", "  GOOGLE, Inc "],
+            "walt disney": ["The Walt Disney Company", "Walt Disney Co."],
+            "goldman sachs": ["Goldman Sachs & Co. LLC", "Goldman Sachs"],
+            "nestle": ["Nestlé S.A.", "NESTLE"]
+        }
+        
+        # Act & Assert
+        for expected, names in variants.items():
+            for name in names:
+                self.assertEqual(normalize_company_name(name), expected, name)
+    
+    def test_name_is_never_emptied(self):
+        """Test that a name consisting only of a legal form is kept."""
+        # Act & Assert
+        self.assertEqual(normalize_company_name("Inc."), "inc")
+        self.assertEqual(normalize_company_name("株式会社トヨタ"), "株式会社トヨタ")
+
+
+class TestEmailDomain(unittest.TestCase):
+    """Tests for the email_domain function."""
+    
+    def test_registrable_domain(self):
+        """Test that subdomains are removed and country domains are kept whole."""
+        # Act & Assert
+        self.assertEqual(email_domain("jane@careers.google.com"), "google.com")
+        self.assertEqual(email_domain("sam@jobs.bbc.co.uk"), "bbc.co.uk")
+    
+    def test_mail_providers_are_ignored(self):
+        """Test that free mail domains do not identify a company."""
+        # Act & Assert
+        self.assertIsNone(email_domain("recruiter@gmail.com"))
+        self.assertIsNone(email_domain("recruiter@yahoo.co.uk"))
+        self.assertIsNone(email_domain(None))
+
+
+class TestCompanyAliasIndex(unittest.TestCase):
+    """Tests for the CompanyAliasIndex class."""
+    
+    def setUp(self):
+        """Create an index in a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.index_path = os.path.join(self.temp_dir.name, "aliases", "index.json")
+        self.index = CompanyAliasIndex(self.index_path)
+    
+    def tearDown(self):
+        """Remove the temporary files."""
+        self.temp_dir.cleanup()
+    
+    def test_name_variants_resolve_to_one_id(self):
+        """Test that names differing in case and legal form share an ID."""
+        # Act
+        ids = {self.index.resolve(name) for name in ["Google", "Google LLC", "google inc."]}
+        
+        # Assert
+        self.assertEqual(ids, {"google"})
+    
+    def test_matching_domain_identifies_company(self):
+        """Test that a recruiter domain links names that agree with it."""
+        # Arrange
+        self.index.resolve("Google", "jane@google.com")
+        
+        # Act
+        cloud_id = self.index.resolve("Google Cloud", "sam@cloud.google.com")
+        unnamed_id = self.index.resolve("", "alex@google.com")
+        
+        # Assert
+        self.assertEqual(cloud_id, "google")
+        self.assertEqual(unnamed_id, "google")
+    
+    def test_agency_domain_does_not_merge_clients(self):
+        """Test that a domain not matching the name does not decide the ID."""
+        # Arrange
+        self.index.resolve("Hays", "jane@hays.com")
+        
+        # Act
+        client_id = self.index.resolve("Acme Rockets", "jane@hays.com")
+        
+        # Assert
+        self.assertEqual(client_id, "acme rockets")
+    
+    def test_empty_identity_is_not_resolved(self):
+        """Test that an empty name without a company domain has no ID."""
+        # Act & Assert
+        self.assertIsNone(self.index.resolve(""))
+        self.assertIsNone(self.index.resolve(" -. ", "jane@gmail.com"))
+        self.assertFalse(os.path.exists(self.index_path))
+    
+    def test_index_persists(self):
+        """Test that aliases are read back by a new index."""
+        # Arrange
+        self.index.resolve("Google", "jane@google.com")
+        self.index.resolve("Google Cloud", "sam@google.com")
+        
+        # Act
+        reloaded = CompanyAliasIndex(self.index_path)
+        
+        # Assert
+        self.assertEqual(reloaded.resolve("Google Cloud Inc."), "google")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+"""
+Tests for the company researcher.
+
+This module contains tests for the race and ensemble research modes.
+"""
+
+import asyncio
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+
+from Recruiter.core.company_research.company_researcher import CompanyResearcher
+from Recruiter.core.company_research.research_store import CompanyResearchStore
+
+
+GOOD_RESULT = "Acme designs and builds reusable rockets for commercial launches. " * 5
+
+
+class TestCompanyResearcherModes(unittest.TestCase):
+    """Tests for the race and ensemble search methods."""
+    
+    def setUp(self):
+        """Create a temporary research store."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = CompanyResearchStore(cache_dir=self.temp_dir.name)
+    
+    def tearDown(self):
+        """Remove the temporary files."""
+        self.temp_dir.cleanup()
+    
+    def make_researcher(self, mock_llm_service_class, search_method, llm_result):
+        """Create a researcher whose LLM source returns llm_result."""
+        research_service = MagicMock()
+        research_service.generate_text.return_value = llm_result
+        
+        async def agenerate_text(prompt):
+            return llm_result
+        
+        research_service.agenerate_text.side_effect = agenerate_text
+        mock_llm_service_class.for_task.side_effect = [MagicMock(), research_service]
+        researcher = CompanyResearcher(
+            api_key="test_api_key",
+            search_method=search_method,
+            research_store=self.store
+        )
+        researcher.race_deadline_seconds = 2
+        researcher.ensemble_budget_seconds = 0.5
+        return researcher
+    
+    @patch('Recruiter.core.company_research.company_researcher.get_company_info_bs4')
+    @patch('Recruiter.utils.web_search.research_agent.get_research_agent')
+    @patch('Recruiter.core.company_research.company_researcher.LLMService')
+    def test_race_returns_first_good_result(self, mock_llm_service_class, mock_get_agent, mock_bs4):
+        """Test that a fast good result wins without waiting for slow sources."""
+        # Arrange
+        researcher = self.make_researcher(mock_llm_service_class, "race", "Too short")
+        
+        async def slow_run(company_name):
+            await asyncio.sleep(1.5)
+            return "Slow agent result"
+        
+        mock_get_agent.return_value.run = slow_run
+        mock_bs4.return_value = GOOD_RESULT
+        
+        # Act
+        start = time.perf_counter()
+        result = researcher.research_company("Acme")
+        elapsed = time.perf_counter() - start
+        
+        # Assert
+        self.assertEqual(result, GOOD_RESULT)
+        self.assertLess(elapsed, 1.0)
+    
+    @patch('Recruiter.core.company_research.company_researcher.get_company_info_bs4')
+    @patch('Recruiter.utils.web_search.research_agent.get_research_agent')
+    @patch('Recruiter.core.company_research.company_researcher.LLMService')
+    def test_race_cancels_the_losing_agent_run(self, mock_llm_service_class, mock_get_agent, mock_bs4):
+        """Test that the agent run still going when another source wins is cancelled on its loop."""
+        # Arrange
+        researcher = self.make_researcher(mock_llm_service_class, "race", "Too short")
+        cancelled = threading.Event()
+        
+        async def slow_run(company_name):
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return "Slow agent result"
+        
+        mock_get_agent.return_value.run = slow_run
+        mock_bs4.return_value = GOOD_RESULT
+        
+        # Act
+        result = researcher.research_company("Acme")
+        
+        # Assert
+        self.assertEqual(result, GOOD_RESULT)
+        self.assertTrue(cancelled.wait(timeout=1))
+    
+    @patch('Recruiter.core.company_research.company_researcher.get_company_info_bs4')
+    @patch('Recruiter.core.company_research.company_researcher.aget_company_info_agent')
+    @patch('Recruiter.core.company_research.company_researcher.LLMService')
+    def test_async_race_falls_back_to_longest_result(self, mock_llm_service_class, mock_agent, mock_bs4):
+        """Test that the longest result is used when none passes the quality check."""
+        # Arrange
+        researcher = self.make_researcher(mock_llm_service_class, "race", "Short but longer")
+        mock_agent.return_value = None
+        mock_bs4.return_value = "Short"
+        
+        # Act
+        result = asyncio.run(researcher.aresearch_company("Acme"))
+        
+        # Assert
+        self.assertEqual(result, "Short but longer")
+    
+    @patch('Recruiter.core.company_research.company_researcher.get_company_info_bs4')
+    @patch('Recruiter.utils.web_search.research_agent.get_research_agent')
+    @patch('Recruiter.core.company_research.company_researcher.LLMService')
+    def test_ensemble_merges_results_within_budget(self, mock_llm_service_class, mock_get_agent, mock_bs4):
+        """Test that finished results are merged in source order without repeated paragraphs."""
+        # Arrange
+        llm_result = GOOD_RESULT + "\n\nAcme was founded in 2002."
+        researcher = self.make_researcher(mock_llm_service_class, "ensemble", llm_result)
+        
+        async def slow_run(company_name):
+            await asyncio.sleep(2)
+            return GOOD_RESULT
+        
+        mock_get_agent.return_value.run = slow_run
+        mock_bs4.return_value = GOOD_RESULT
+        
+        # Act
+        result = researcher.research_company("Acme")
+        
+        # Assert
+        self.assertNotIn("## Web search", result)
+        self.assertLess(result.index("## Web pages"), result.index("## General knowledge"))
+        self.assertEqual(result.count(GOOD_RESULT.strip()), 1)
+        self.assertIn("Acme was founded in 2002.", result)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Tests for the DOCX extractor.
+
+This module contains tests for streaming text extraction from DOCX files.
+"""
+
+import io
+import unittest
+import zipfile
+
+from docx import Document
+
+from Recruiter.core.resume.docx_extractor import extract_docx_text
+
+
+TEXT_BOX_DOCUMENT = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+    xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"
+    xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape">
+  <w:body>
+    <w:p><w:r><w:t>Before</w:t></w:r></w:p>
+    <w:p><w:r><mc:AlternateContent>
+      <mc:Choice Requires="wps"><wps:txbx><w:txbxContent>
+        <w:p><w:r><w:t>Skills in a box</w:t></w:r></w:p>
+      </w:txbxContent></wps:txbx></mc:Choice>
+      <mc:Fallback><w:txbxContent>
+        <w:p><w:r><w:t>Skills in a box</w:t></w:r></w:p>
+      </w:txbxContent></mc:Fallback>
+    </mc:AlternateContent></w:r></w:p>
+    <w:p><w:r><w:t xml:space="preserve">After </w:t></w:r><w:r><w:delText>deleted</w:delText><w:t>text</w:t></w:r></w:p>
+  </w:body>
+</w:document>
+"""
+
+
+def save_document(document):
+    """Save a python-docx document to bytes."""
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+class TestDocxExtractor(unittest.TestCase):
+    """Tests for the extract_docx_text function."""
+    
+    def test_tables_and_headers_keep_document_order(self):
+        """Test that table rows, headers and footers are extracted in order."""
+        # Arrange
+        document = Document()
+        document.sections[0].header.paragraphs[0].text = "Jane Doe | jane@example.com"
+        document.sections[0].footer.paragraphs[0].text = "References on request"
+        document.add_paragraph("Summary")
+        table = document.add_table(rows=2, cols=2)
+        table.cell(0, 0).text = "Languages"
+        table.cell(0, 1).text = "Python"
+        table.cell(0, 1).add_paragraph("Go")
+        table.cell(1, 0).text = "Cloud"
+        table.cell(1, 1).text = "AWS"
+        document.add_paragraph("Experience")
+        
+        # Act
+        result = extract_docx_text(save_document(document))
+        
+        # Assert
+        self.assertEqual(
+            result.split("\n"),
+            [
+                "Jane Doe | jane@example.com",
+                "Summary",
+                "Languages | Python; Go",
+                "Cloud | AWS",
+                "Experience",
+                "References on request"
+            ]
+        )
+    
+    def test_text_box_is_extracted_once(self):
+        """Test that text boxes are included without their fallback copy or deleted text."""
+        # Arrange
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as archive:
+            archive.writestr("word/document.xml", TEXT_BOX_DOCUMENT)
+        
+        # Act
+        result = extract_docx_text(buffer.getvalue())
+        
+        # Assert
+        self.assertEqual(result.split("\n"), ["Before", "Skills in a box", "", "After text"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+"""
+Tests for the email generator.
+
+This module contains tests for revising generated emails.
+"""
+
+import os
+import unittest
+from unittest.mock import patch, MagicMock
+
+from langchain_core.prompts import ChatPromptTemplate
+
+from Recruiter.core.email.email_generator import EmailGenerator
+from Recruiter.models.schemas import (
+    EmailContent,
+    EmailRevision,
+    ParsedResume,
+    ResumeContact,
+    ResumeExperience
+)
+from Recruiter.prompts.email_prompts import EMAIL_REVISION_LAYOUT
+
+
+class TestEmailGenerator(unittest.TestCase):
+    """Tests for the EmailGenerator class."""
+    
+    @patch('Recruiter.core.email.email_generator.get_response_cache')
+    @patch('Recruiter.core.email.email_generator.LLMService')
+    def test_revise_email_merges_changed_fields(self, mock_llm_service_class, mock_get_response_cache):
+        """Test that a revision only sends the draft and keeps unchanged fields."""
+        # Arrange
+        mock_get_response_cache.return_value = None
+        regeneration_service = MagicMock()
+        regeneration_service.generate_with_template.return_value = EmailRevision(subject="New subject")
+        mock_llm_service_class.for_task.side_effect = [MagicMock(), regeneration_service]
+        previous = EmailContent(subject="Old subject", body_text="Hello", body_html="<p>Hello</p>")
+        
+        # Act
+        email_generator = EmailGenerator(api_key="test_api_key")
+        result = email_generator.revise_email(previous, "Make the subject shorter")
+        
+        # Assert
+        call_kwargs = regeneration_service.generate_with_template.call_args.kwargs
+        self.assertEqual(call_kwargs["template"], EMAIL_REVISION_LAYOUT.system_template)
+        self.assertEqual(call_kwargs["human_template"], EMAIL_REVISION_LAYOUT.human_template())
+        self.assertEqual(call_kwargs["input_variables"]["feedback"], "Make the subject shorter")
+        self.assertIn("<p>Hello</p>", call_kwargs["input_variables"]["draft"])
+        self.assertEqual(
+            result,
+            EmailContent(subject="New subject", body_text="Hello", body_html="<p>Hello</p>")
+        )
+    
+    @patch('Recruiter.core.email.email_generator.get_response_cache')
+    @patch('Recruiter.core.email.email_generator.LLMService')
+    def test_different_jobs_share_prompt_prefix(self, mock_llm_service_class, mock_get_response_cache):
+        """Test that two jobs render the same prefix up to the end of the resume."""
+        # Arrange
+        mock_get_response_cache.return_value = None
+        email_service = MagicMock()
+        email_service.generate_with_template.return_value = EmailContent(subject="s", body_text="t", body_html="h")
+        mock_llm_service_class.for_task.side_effect = [email_service, MagicMock()]
+        resume = ParsedResume(
+            contact=ResumeContact(name="Jane Doe", email="jane@example.com"),
+            skills=["Python", "Kubernetes", "Java"],
+            experience=[ResumeExperience(
+                title="Engineer",
+                company="Acme",
+                highlights=["Built Python services on Kubernetes", "Maintained Java apps"]
+            )]
+        )
+        jobs = [
+            ("Python engineer to run services on Kubernetes", "Rocket Corp", "Backend Engineer"),
+            ("Java developer for payment systems", "Bank Ltd", "Java Developer")
+        ]
+        
+        # Act
+        email_generator = EmailGenerator(api_key="test_api_key")
+        prompts = []
+        for job_description, company_name, position in jobs:
+            email_generator.generate_email(
+                job_description=job_description,
+                company_info=f"{company_name} builds things.",
+                resume=resume,
+                recruiter_email="hr@example.com",
+                job_position=position,
+                job_source="LinkedIn",
+                company_name=company_name
+            )
+            call_kwargs = email_service.generate_with_template.call_args.kwargs
+            chat_prompt = ChatPromptTemplate([
+                ("system", call_kwargs["template"]),
+                ("human", call_kwargs["human_template"])
+            ])
+            messages = chat_prompt.format_messages(**call_kwargs["input_variables"])
+            prompts.append((messages, call_kwargs["input_variables"]))
+        
+        # Assert
+        (first_messages, first_inputs), (second_messages, second_inputs) = prompts
+        self.assertEqual(first_messages[0].content, second_messages[0].content)
+        resume_section = f"RESUME DETAILS:\n{first_inputs['resume_details']}\n\n"
+        self.assertEqual(first_inputs["resume_details"], second_inputs["resume_details"])
+        self.assertTrue(first_messages[1].content.startswith(resume_section))
+        self.assertGreaterEqual(
+            len(os.path.commonprefix([first_messages[1].content, second_messages[1].content])),
+            len(resume_section)
+        )
+        self.assertNotEqual(first_inputs["resume_highlights"], second_inputs["resume_highlights"])
+
+
+if __name__ == '__main__':
+    unittest.main()
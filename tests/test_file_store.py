@@ -0,0 +1,89 @@
+"""
+Tests for the file store helpers.
+
+This module contains tests for the atomic writes and eviction shared by the
+on-disk caches.
+"""
+
+import os
+import time
+import tempfile
+import unittest
+
+from Recruiter.utils.file_utils.file_store import entry_paths, evict_entries, read_json, write_atomic, write_json
+
+
+class TestFileStore(unittest.TestCase):
+    """Tests for the file store helpers."""
+    
+    def setUp(self):
+        """Create a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.directory = self.temp_dir.name
+    
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.temp_dir.cleanup()
+    
+    def _write_entry(self, name, age):
+        """Write an entry file last modified the given number of seconds ago."""
+        path = os.path.join(self.directory, name)
+        write_atomic(path, name)
+        mtime = time.time() - age
+        os.utime(path, (mtime, mtime))
+        return path
+    
+    def test_json_round_trip_leaves_no_temporary_files(self):
+        """Test that JSON written atomically is read back and no temporary file remains."""
+        # Arrange
+        path = os.path.join(self.directory, "entry.json")
+        
+        # Act
+        write_json(path, {"value": 1})
+        
+        # Assert
+        self.assertEqual(read_json(path), {"value": 1})
+        self.assertEqual(os.listdir(self.directory), ["entry.json"])
+    
+    def test_read_json_of_missing_or_corrupt_file(self):
+        """Test that missing and corrupt files read as None."""
+        # Arrange
+        path = os.path.join(self.directory, "corrupt.json")
+        write_atomic(path, b"{not json")
+        
+        # Act / Assert
+        self.assertIsNone(read_json(path))
+        self.assertIsNone(read_json(os.path.join(self.directory, "missing.json")))
+    
+    def test_entry_paths_skip_temporary_files(self):
+        """Test that entries are listed by suffix and unfinished writes are skipped."""
+        # Arrange
+        for name in ["a.json", "b.txt", "c.tmp"]:
+            self._write_entry(name, 0)
+        
+        # Act
+        json_names = [os.path.basename(path) for path in entry_paths(self.directory, '.json')]
+        all_names = sorted(os.path.basename(path) for path in entry_paths(self.directory))
+        
+        # Assert
+        self.assertEqual(json_names, ["a.json"])
+        self.assertEqual(all_names, ["a.json", "b.txt"])
+    
+    def test_evict_by_age_then_count(self):
+        """Test that expired entries go first, then the least recently modified beyond the limit."""
+        # Arrange
+        expired = self._write_entry("expired.json", 100)
+        oldest = self._write_entry("oldest.json", 30)
+        middle = self._write_entry("middle.json", 20)
+        newest = self._write_entry("newest.json", 10)
+        
+        # Act
+        removed = evict_entries(entry_paths(self.directory, '.json'), max_entries=2, max_age_seconds=60)
+        
+        # Assert
+        self.assertEqual(sorted(removed), sorted([expired, oldest]))
+        self.assertEqual(sorted(entry_paths(self.directory, '.json')), sorted([middle, newest]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,248 @@
+"""
+Tests for the HTTP fetcher.
+
+This module contains tests for main-content extraction, bounded
+downloads and conditional GET revalidation of cached pages.
+"""
+
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from Recruiter.utils.web_search.http_fetcher import HttpFetcher, PageCache, extract_main_text
+
+
+PAGE = b"""
+<html>
+<head><title>Acme</title><script>var tracking = 1;</script></head>
+<body>
+<nav><a href="/">Home</a><a href="/about">About</a></nav>
+<div id="cookie-banner"><p>We use cookies to improve your experience.</p></div>
+<main>
+<h1>About Acme</h1>
+<p>Acme builds reusable rockets and launches satellites for commercial customers around the world.</p>
+<p>Founded in 2002, the company employs over 10,000 people across three continents and five launch sites.</p>
+<ul><li>Falcon rockets</li><li>Starlink satellites</li></ul>
+</main>
+<footer><p>Copyright Acme</p></footer>
+</body>
+</html>
+"""
+
+
+def make_response(status_code=200, content=b"", headers=None):
+    """Create a mock streamed response usable as a context manager."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers if headers is not None else {"Content-Type": "text/html"}
+    response.encoding = None
+    response.iter_content.return_value = [content[i:i + 10] for i in range(0, len(content), 10)]
+    response.__enter__.return_value = response
+    return response
+
+
+class TestExtractMainText(unittest.TestCase):
+    """Tests for the extract_main_text function."""
+    
+    def test_keeps_main_content_only(self):
+        """Test that navigation, scripts, cookie banners and footers are removed."""
+        # Act
+        text = extract_main_text(PAGE)
+        
+        # Assert
+        self.assertEqual(text.splitlines()[0], "About Acme")
+        self.assertIn("Acme builds reusable rockets", text)
+        self.assertIn("Starlink satellites", text)
+        for noise in ["tracking", "Home", "cookies", "Copyright"]:
+            self.assertNotIn(noise, text)
+    
+    def test_keeps_wrapper_of_main_container(self):
+        """Test that a layout wrapper with a noise-like class keeps the main content."""
+        # Arrange
+        html = PAGE.replace(b"<main>", b'<div class="layout with-sidebar"><main>').replace(
+            b"</main>", b"</main></div>"
+        )
+        
+        # Act
+        text = extract_main_text(html)
+        
+        # Assert
+        self.assertIn("Acme builds reusable rockets", text)
+        self.assertNotIn("cookies", text)
+    
+    def test_keeps_wrapper_of_most_text(self):
+        """Test that a wrapper holding most of the page text is not removed."""
+        # Arrange
+        html = b"""
+        <html><body>
+        <div class="page social-share-enabled">
+        <p>Acme builds reusable rockets and launches satellites for commercial customers.</p>
+        <p>Founded in 2002, the company employs over 10,000 people.</p>
+        </div>
+        <div class="share-buttons"><p>Share on social media</p></div>
+        </body></html>
+        """
+        
+        # Act
+        text = extract_main_text(html)
+        
+        # Assert
+        self.assertIn("Acme builds reusable rockets", text)
+        self.assertNotIn("Share on social media", text)
+    
+    def test_matches_whole_name_words(self):
+        """Test that noise names only match whole words of a class or id."""
+        # Arrange
+        html = b"""
+        <html><body>
+        <div class="menuitem-list"><p>Our kitchen menuitem list stays.</p></div>
+        <div id="main_menu"><p>Home</p></div>
+        <p>Acme builds reusable rockets.</p>
+        </body></html>
+        """
+        
+        # Act
+        text = extract_main_text(html)
+        
+        # Assert
+        self.assertIn("Our kitchen menuitem list stays.", text)
+        self.assertNotIn("Home", text)
+    
+    def test_limits_characters(self):
+        """Test that the text is truncated to max_chars."""
+        # Act
+        text = extract_main_text(PAGE, max_chars=50)
+        
+        # Assert
+        self.assertEqual(len(text), 50)
+
+
+class TestHttpFetcher(unittest.TestCase):
+    """Tests for the HttpFetcher class."""
+    
+    def setUp(self):
+        """Create a fetcher with a mock session and a temporary cache."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = PageCache(cache_dir=self.temp_dir.name)
+        self.fetcher = HttpFetcher(cache=self.cache, max_age_seconds=0)
+        self.fetcher.session = MagicMock()
+    
+    def tearDown(self):
+        """Remove the temporary files."""
+        self.temp_dir.cleanup()
+    
+    def test_fetches_with_timeout_and_streaming(self):
+        """Test that pages are streamed with the configured timeouts."""
+        # Arrange
+        self.fetcher.session.get.return_value = make_response(content=PAGE)
+        
+        # Act
+        text = self.fetcher.fetch_text("https://acme.example/about")
+        
+        # Assert
+        self.assertIn("Acme builds reusable rockets", text)
+        _, kwargs = self.fetcher.session.get.call_args
+        self.assertEqual(kwargs["timeout"], self.fetcher.timeout)
+        self.assertTrue(kwargs["stream"])
+    
+    def test_rejects_unsupported_content_type(self):
+        """Test that non-HTML responses are not downloaded."""
+        # Arrange
+        response = make_response(content=b"%PDF-1.7", headers={"Content-Type": "application/pdf"})
+        self.fetcher.session.get.return_value = response
+        
+        # Act
+        text = self.fetcher.fetch_text("https://acme.example/report.pdf")
+        
+        # Assert
+        self.assertIsNone(text)
+        response.iter_content.assert_not_called()
+    
+    def test_download_is_capped(self):
+        """Test that the body is read only up to max_bytes."""
+        # Arrange
+        self.fetcher.max_bytes = 25
+        response = make_response(content=b"a" * 1000, headers={"Content-Type": "text/plain"})
+        self.fetcher.session.get.return_value = response
+        
+        # Act
+        text = self.fetcher.fetch_text("https://acme.example/large.txt")
+        
+        # Assert
+        self.assertEqual(text, "a" * 25)
+    
+    def test_revalidates_cached_page_with_conditional_get(self):
+        """Test that a cached page is reused when the server answers 304."""
+        # Arrange
+        headers = {"Content-Type": "text/html", "ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+        self.fetcher.session.get.return_value = make_response(content=PAGE, headers=headers)
+        first = self.fetcher.fetch_text("https://acme.example/about")
+        not_modified = make_response(status_code=304, headers={})
+        self.fetcher.session.get.return_value = not_modified
+        
+        # Act
+        second = self.fetcher.fetch_text("https://acme.example/about")
+        
+        # Assert
+        self.assertEqual(second, first)
+        _, kwargs = self.fetcher.session.get.call_args
+        self.assertEqual(kwargs["headers"]["If-None-Match"], '"v1"')
+        self.assertEqual(kwargs["headers"]["If-Modified-Since"], "Mon, 01 Jan 2024 00:00:00 GMT")
+        not_modified.iter_content.assert_not_called()
+    
+    def test_fresh_cached_page_skips_request(self):
+        """Test that a page younger than max_age_seconds is served from the cache."""
+        # Arrange
+        self.fetcher.max_age_seconds = 3600
+        self.cache.set("https://acme.example/about", "Acme builds rockets")
+        
+        # Act
+        text = self.fetcher.fetch_text("https://acme.example/about")
+        
+        # Assert
+        self.assertEqual(text, "Acme builds rockets")
+        self.fetcher.session.get.assert_not_called()
+    
+    
+    def test_fetch_many_keeps_url_order(self):
+        """Test that concurrently fetched pages are returned in request order."""
+        # Arrange
+        responses = {
+            "https://a.example": make_response(content=b"page a", headers={"Content-Type": "text/plain"}),
+            "https://b.example": make_response(status_code=200, content=b"%PDF", headers={"Content-Type": "application/pdf"}),
+            "https://c.example": make_response(content=b"page c", headers={"Content-Type": "text/plain"})
+        }
+        self.fetcher.session.get.side_effect = lambda url, **kwargs: responses[url]
+        
+        # Act
+        texts = self.fetcher.fetch_many(list(responses))
+        
+        # Assert
+        self.assertEqual(texts, ["page a", None, "page c"])
+    
+    def test_fetch_many_isolates_parse_failures(self):
+        """Test that a page whose parsing raises does not discard the other pages."""
+        # Arrange
+        responses = {
+            "https://a.example": make_response(content=b"<p>page a</p>"),
+            "https://b.example": make_response(content=b"<p>broken</p>"),
+            "https://c.example": make_response(content=b"<p>page c</p>")
+        }
+        self.fetcher.session.get.side_effect = lambda url, **kwargs: responses[url]
+        
+        def extract(content, max_chars, encoding):
+            if b"broken" in content:
+                raise ValueError("unparsable page")
+            return content.decode()[3:-4]
+        
+        # Act
+        with patch('Recruiter.utils.web_search.http_fetcher.extract_main_text', side_effect=extract), \
+                patch('builtins.print'):
+            texts = self.fetcher.fetch_many(list(responses))
+        
+        # Assert
+        self.assertEqual(texts, ["page a", None, "page c"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+"""
+Tests for the resume ingestion script.
+
+This module contains tests for parsing resume directories into the parse cache.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from docx import Document
+
+from Recruiter.core.resume.parse_cache import ResumeParseCache
+from Recruiter.core.resume.resume_parser import ResumeParser
+from Recruiter.scripts.ingest_resumes import find_resumes, ingest_resume, main
+
+
+class TestIngestResumes(unittest.TestCase):
+    """Tests for the resume ingestion functions."""
+    
+    def setUp(self):
+        """Create a directory of resumes and a temporary parse cache."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.resume_dir = os.path.join(self.temp_dir.name, "resumes")
+        os.makedirs(os.path.join(self.resume_dir, "archive"))
+        
+        self.docx_path = os.path.join(self.resume_dir, "backend.docx")
+        document = Document()
+        document.add_paragraph("Backend   engineer")
+        document.save(self.docx_path)
+        
+        self.broken_path = os.path.join(self.resume_dir, "broken.pdf")
+        with open(self.broken_path, "w") as f:
+            f.write("not a pdf")
+        with open(os.path.join(self.resume_dir, "notes.txt"), "w") as f:
+            f.write("ignored")
+        Document().save(os.path.join(self.resume_dir, "archive", "old.docx"))
+        
+        self.cache = ResumeParseCache(cache_dir=os.path.join(self.temp_dir.name, "cache"))
+    
+    def tearDown(self):
+        """Remove the temporary files."""
+        self.temp_dir.cleanup()
+    
+    def test_find_resumes(self):
+        """Test that only PDF and DOCX files are found, recursively on request."""
+        # Act
+        flat = find_resumes(self.resume_dir)
+        recursive = find_resumes(self.resume_dir, recursive=True)
+        
+        # Assert
+        self.assertEqual([os.path.basename(path) for path in flat], ["backend.docx", "broken.pdf"])
+        self.assertEqual(len(recursive), 3)
+    
+    @patch('Recruiter.core.resume.resume_parser.get_resume_parse_cache')
+    def test_ingest_resume_stores_text_and_metadata(self, mock_get_resume_parse_cache):
+        """Test that ingestion stores normalized text and metadata, then reports a cache hit."""
+        # Arrange
+        mock_get_resume_parse_cache.return_value = self.cache
+        
+        # Act
+        first = ingest_resume(self.docx_path)
+        second = ingest_resume(self.docx_path)
+        
+        # Assert
+        self.assertEqual(first["status"], "parsed")
+        self.assertEqual(second["status"], "cached")
+        self.assertEqual(first["characters"], len("Backend engineer"))
+        key = self.cache.make_key(
+            self.cache.hash_file(self.docx_path),
+            ResumeParser(cache=self.cache)._parser_id(".docx")
+        )
+        self.assertEqual(self.cache.get(key), "Backend engineer")
+        metadata = self.cache.get_metadata(key)
+        self.assertEqual(metadata["file_name"], "backend.docx")
+        self.assertEqual(metadata["characters"], len("Backend engineer"))
+    
+    @patch('Recruiter.core.resume.resume_parser.get_resume_parse_cache')
+    def test_ingest_resume_reports_failure(self, mock_get_resume_parse_cache):
+        """Test that a file that cannot be parsed is reported instead of raising."""
+        # Arrange
+        mock_get_resume_parse_cache.return_value = self.cache
+        
+        # Act
+        result = ingest_resume(self.broken_path)
+        
+        # Assert
+        self.assertEqual(result["status"], "failed")
+        self.assertTrue(result["error"])
+    
+    @patch('Recruiter.core.resume.resume_parser.get_resume_parse_cache')
+    def test_ingest_resume_without_cache(self, mock_get_resume_parse_cache):
+        """Test that resumes are reported as not cached when the cache is disabled."""
+        # Arrange
+        mock_get_resume_parse_cache.return_value = None
+        
+        # Act
+        result = ingest_resume(self.docx_path)
+        
+        # Assert
+        self.assertEqual(result["status"], "not cached")
+        self.assertEqual(result["characters"], len("Backend engineer"))
+    
+    @patch('Recruiter.scripts.ingest_resumes.ingest_resumes')
+    @patch('Recruiter.scripts.ingest_resumes.get_resume_parse_cache')
+    def test_main_fails_when_resumes_exceed_capacity(self, mock_get_resume_parse_cache, mock_ingest_resumes):
+        """Test that ingestion stops when the cache cannot hold every resume."""
+        # Arrange
+        mock_get_resume_parse_cache.return_value = ResumeParseCache(
+            cache_dir=self.cache.cache_dir,
+            max_disk_entries=1
+        )
+        
+        # Act
+        with patch('sys.argv', ["ingest_resumes", self.resume_dir]), patch('builtins.print'):
+            exit_code = main()
+        
+        # Assert
+        self.assertEqual(exit_code, 1)
+        mock_ingest_resumes.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,18 +4,23 @@ Tests for the LLM service.
 This module contains tests for the LLM service.
 """
 
+import asyncio
+import threading
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 
+from langchain_core.messages import AIMessage
+
+from Recruiter.models.schemas import EmailContent
 from Recruiter.services.llm.llm_service import LLMService
 
 
 class TestLLMService(unittest.TestCase):
     """Tests for the LLMService class."""
     
-    @patch('RecruitReach2.services.llm.llm_service.ChatOpenAI')
-    @patch('RecruitReach2.services.llm.llm_service.ConfigManager')
-    def test_init_with_api_key(self, mock_config_manager, mock_chat_openai):
+    @patch('Recruiter.services.llm.llm_service.get_chat_model')
+    @patch('Recruiter.services.llm.llm_service.ConfigManager')
+    def test_init_with_api_key(self, mock_config_manager, mock_get_chat_model):
         """Test initializing LLMService with an API key."""
         # Arrange
         api_key = "test_api_key"
@@ -24,7 +29,7 @@ class TestLLMService(unittest.TestCase):
         
         # Mock the ChatOpenAI instance
         mock_llm = MagicMock()
-        mock_chat_openai.return_value = mock_llm
+        mock_get_chat_model.return_value = mock_llm
         
         # Act
         llm_service = LLMService(
@@ -34,10 +39,13 @@ class TestLLMService(unittest.TestCase):
         )
         
         # Assert
-        mock_chat_openai.assert_called_once_with(
-            model=model_name,
+        mock_get_chat_model.assert_called_once_with(
+            model_name=model_name,
             temperature=temperature,
-            api_key=api_key
+            api_key=api_key,
+            max_tokens=None,
+            timeout=None,
+            fallback_model=None
         )
         self.assertEqual(llm_service.llm, mock_llm)
         self.assertEqual(llm_service.model_name, model_name)
@@ -46,9 +54,9 @@ class TestLLMService(unittest.TestCase):
         # Verify that ConfigManager was not called
         mock_config_manager.assert_not_called()
     
-    @patch('RecruitReach2.services.llm.llm_service.ChatOpenAI')
-    @patch('RecruitReach2.services.llm.llm_service.ConfigManager')
-    def test_init_without_api_key(self, mock_config_manager, mock_chat_openai):
+    @patch('Recruiter.services.llm.llm_service.get_chat_model')
+    @patch('Recruiter.services.llm.llm_service.ConfigManager')
+    def test_init_without_api_key(self, mock_config_manager, mock_get_chat_model):
         """Test initializing LLMService without an API key."""
         # Arrange
         config_api_key = "config_api_key"
@@ -62,7 +70,7 @@ class TestLLMService(unittest.TestCase):
         
         # Mock the ChatOpenAI instance
         mock_llm = MagicMock()
-        mock_chat_openai.return_value = mock_llm
+        mock_get_chat_model.return_value = mock_llm
         
         # Act
         llm_service = LLMService(
@@ -73,16 +81,19 @@ class TestLLMService(unittest.TestCase):
         # Assert
         mock_config_manager.assert_called_once()
         mock_config.get_value.assert_called_once_with("openai", "OPENAI_API_KEY")
-        mock_chat_openai.assert_called_once_with(
-            model=model_name,
+        mock_get_chat_model.assert_called_once_with(
+            model_name=model_name,
             temperature=temperature,
-            api_key=config_api_key
+            api_key=config_api_key,
+            max_tokens=None,
+            timeout=None,
+            fallback_model=None
         )
         self.assertEqual(llm_service.llm, mock_llm)
     
-    @patch('RecruitReach2.services.llm.llm_service.ChatOpenAI')
-    @patch('RecruitReach2.services.llm.llm_service.ConfigManager')
-    def test_generate_text(self, mock_config_manager, mock_chat_openai):
+    @patch('Recruiter.services.llm.llm_service.get_chat_model')
+    @patch('Recruiter.services.llm.llm_service.ConfigManager')
+    def test_generate_text(self, mock_config_manager, mock_get_chat_model):
         """Test generating text with LLMService."""
         # Arrange
         api_key = "test_api_key"
@@ -91,7 +102,7 @@ class TestLLMService(unittest.TestCase):
         
         # Mock the ChatOpenAI instance
         mock_llm = MagicMock()
-        mock_chat_openai.return_value = mock_llm
+        mock_get_chat_model.return_value = mock_llm
         
         # Mock the response from the LLM
         mock_response = MagicMock()
@@ -103,13 +114,14 @@ class TestLLMService(unittest.TestCase):
         result = llm_service.generate_text(prompt)
         
         # Assert
-        mock_llm.invoke.assert_called_once_with(prompt)
+        mock_llm.invoke.assert_called_once()
+        self.assertEqual(mock_llm.invoke.call_args.args, (prompt,))
         self.assertEqual(result, expected_response)
     
-    @patch('RecruitReach2.services.llm.llm_service.ChatOpenAI')
-    @patch('RecruitReach2.services.llm.llm_service.ConfigManager')
-    @patch('RecruitReach2.services.llm.llm_service.ChatPromptTemplate')
-    def test_generate_with_template(self, mock_chat_prompt_template, mock_config_manager, mock_chat_openai):
+    @patch('Recruiter.services.llm.llm_service.get_chat_model')
+    @patch('Recruiter.services.llm.llm_service.ConfigManager')
+    @patch('Recruiter.services.llm.llm_service.ChatPromptTemplate')
+    def test_generate_with_template(self, mock_chat_prompt_template, mock_config_manager, mock_get_chat_model):
         """Test generating text with a template using LLMService."""
         # Arrange
         api_key = "test_api_key"
@@ -119,7 +131,7 @@ class TestLLMService(unittest.TestCase):
         
         # Mock the ChatOpenAI instance
         mock_llm = MagicMock()
-        mock_chat_openai.return_value = mock_llm
+        mock_get_chat_model.return_value = mock_llm
         
         # Mock the ChatPromptTemplate instance
         mock_prompt = MagicMock()
@@ -140,8 +152,251 @@ class TestLLMService(unittest.TestCase):
         # Assert
         mock_chat_prompt_template.assert_called_once_with([("system", template), ("human", "generate")])
         mock_prompt.__or__.assert_called_once_with(mock_llm)
-        mock_chain.invoke.assert_called_once_with(input_variables)
+        mock_chain.invoke.assert_called_once()
+        self.assertEqual(mock_chain.invoke.call_args.args, (input_variables,))
+        self.assertEqual(result, expected_response)
+    
+    @patch('Recruiter.services.llm.llm_service.get_chat_model')
+    @patch('Recruiter.services.llm.llm_service.ConfigManager')
+    def test_generate_with_template_uses_cache(self, mock_config_manager, mock_get_chat_model):
+        """Test that a cached response is returned without invoking the model."""
+        # Arrange
+        mock_llm = MagicMock()
+        mock_get_chat_model.return_value = mock_llm
+        mock_cache = MagicMock()
+        mock_cache.make_key.return_value = "key"
+        mock_cache.get.return_value = "Cached text"
+        
+        # Act
+        llm_service = LLMService(api_key="test_api_key", cache=mock_cache)
+        result = llm_service.generate_with_template(
+            template="Template {variable}",
+            input_variables={"variable": "value"}
+        )
+        
+        # Assert
+        mock_cache.make_key.assert_called_once_with(
+            "system: Template value\nhuman: generate", "gpt-4o-mini", 0.2, None,
+            max_tokens=None, fallback_model=None
+        )
+        self.assertEqual(result.content, "Cached text")
+        mock_llm.invoke.assert_not_called()
+        mock_cache.set.assert_not_called()
+    
+    @patch('Recruiter.services.llm.llm_service.get_chat_model')
+    @patch('Recruiter.services.llm.llm_service.ConfigManager')
+    @patch('Recruiter.services.llm.llm_service.ChatPromptTemplate')
+    def test_agenerate_with_template(self, mock_chat_prompt_template, mock_config_manager, mock_get_chat_model):
+        """Test generating text with a template asynchronously."""
+        # Arrange
+        input_variables = {"variable": "value"}
+        expected_response = "Generated text"
+        
+        mock_llm = MagicMock()
+        mock_get_chat_model.return_value = mock_llm
+        mock_prompt = MagicMock()
+        mock_chat_prompt_template.return_value = mock_prompt
+        mock_chain = MagicMock()
+        mock_prompt.__or__.return_value = mock_chain
+        mock_chain.ainvoke = AsyncMock(return_value=expected_response)
+        
+        # Act
+        llm_service = LLMService(api_key="test_api_key")
+        result = asyncio.run(llm_service.agenerate_with_template(
+            template="Template {variable}",
+            input_variables=input_variables
+        ))
+        
+        # Assert
+        mock_chain.ainvoke.assert_awaited_once()
+        self.assertEqual(mock_chain.ainvoke.await_args.args, (input_variables,))
+        mock_chain.invoke.assert_not_called()
         self.assertEqual(result, expected_response)
+    
+    @patch('Recruiter.services.llm.llm_service.get_chat_model')
+    @patch('Recruiter.services.llm.llm_service.ConfigManager')
+    @patch('Recruiter.services.llm.llm_service.ChatPromptTemplate')
+    def test_agenerate_with_template_keeps_cache_io_off_event_loop(
+        self, mock_chat_prompt_template, mock_config_manager, mock_get_chat_model
+    ):
+        """Test that the async path reads and writes the cache in worker threads."""
+        # Arrange
+        mock_get_chat_model.return_value = MagicMock()
+        mock_prompt = MagicMock()
+        mock_chat_prompt_template.return_value = mock_prompt
+        mock_chain = MagicMock()
+        mock_prompt.__or__.return_value = mock_chain
+        mock_chain.ainvoke = AsyncMock(return_value=AIMessage(content="Generated text"))
+        mock_cache = MagicMock()
+        mock_cache.make_key.return_value = "key"
+        cache_threads = []
+        mock_cache.get.side_effect = lambda *args: cache_threads.append(threading.current_thread()) or None
+        mock_cache.set.side_effect = lambda *args: cache_threads.append(threading.current_thread())
+        
+        # Act
+        llm_service = LLMService(api_key="test_api_key", cache=mock_cache)
+        result = asyncio.run(llm_service.agenerate_with_template(
+            template="Template {variable}",
+            input_variables={"variable": "value"}
+        ))
+        
+        # Assert
+        self.assertEqual(result.content, "Generated text")
+        self.assertEqual(len(cache_threads), 2)
+        self.assertTrue(all(thread is not threading.main_thread() for thread in cache_threads))
+    
+    @patch('Recruiter.services.llm.llm_service.get_chat_model')
+    @patch('Recruiter.services.llm.llm_service.ConfigManager')
+    @patch('Recruiter.services.llm.llm_service.ChatPromptTemplate')
+    def test_batch_with_template(self, mock_chat_prompt_template, mock_config_manager, mock_get_chat_model):
+        """Test that batch results keep input order and per-item errors."""
+        # Arrange
+        inputs = [{"variable": "a"}, {"variable": "b"}]
+        error = ValueError("invalid input")
+        
+        mock_get_chat_model.return_value = MagicMock()
+        mock_prompt = MagicMock()
+        mock_chat_prompt_template.return_value = mock_prompt
+        mock_chain = MagicMock()
+        mock_prompt.__or__.return_value = mock_chain
+        
+        def invoke(item, config=None):
+            if item["variable"] == "b":
+                raise error
+            return "Generated a"
+        mock_chain.invoke.side_effect = invoke
+        
+        # Act
+        llm_service = LLMService(api_key="test_api_key")
+        results = llm_service.batch_with_template(
+            template="Template {variable}",
+            inputs=inputs,
+            max_concurrency=3
+        )
+        
+        # Assert
+        self.assertEqual(mock_chain.invoke.call_count, 2)
+        self.assertEqual(results, ["Generated a", error])
+    
+    @patch('Recruiter.services.llm.llm_service.get_chat_model')
+    @patch('Recruiter.services.llm.llm_service.ConfigManager')
+    @patch('Recruiter.services.llm.llm_service.ChatPromptTemplate')
+    def test_compiled_chain_is_reused(self, mock_chat_prompt_template, mock_config_manager, mock_get_chat_model):
+        """Test that repeated calls with one template reuse the compiled chain."""
+        # Arrange
+        mock_llm = MagicMock()
+        mock_get_chat_model.return_value = mock_llm
+        mock_prompt = MagicMock()
+        mock_chat_prompt_template.return_value = mock_prompt
+        mock_chain = MagicMock()
+        mock_prompt.__or__.return_value = mock_chain
+        
+        # Act
+        llm_service = LLMService(api_key="test_api_key")
+        for value in ["a", "b"]:
+            llm_service.generate_with_template(
+                template="Reused {variable}",
+                input_variables={"variable": value}
+            )
+        
+        # Assert
+        mock_chat_prompt_template.assert_called_once()
+        mock_prompt.__or__.assert_called_once_with(mock_llm)
+        self.assertEqual(mock_chain.invoke.call_count, 2)
+    
+    
+    @patch('Recruiter.services.llm.llm_service.get_chat_model')
+    @patch('Recruiter.services.llm.llm_service.ConfigManager')
+    @patch('Recruiter.services.llm.llm_service.ChatPromptTemplate')
+    def test_stream_with_template(self, mock_chat_prompt_template, mock_config_manager, mock_get_chat_model):
+        """Test that partial structured output is streamed and then cached."""
+        # Arrange
+        snapshots = [
+            {"subject": "Hello"},
+            {"subject": "Hello", "body_text": "Hi there"},
+            {"subject": "Hello", "body_text": "Hi there", "body_html": "<p>Hi there</p>"}
+        ]
+        
+        mock_get_chat_model.return_value = MagicMock()
+        mock_prompt = MagicMock()
+        mock_chat_prompt_template.return_value = mock_prompt
+        mock_chain = MagicMock()
+        mock_prompt.__or__.return_value = mock_chain
+        mock_chain.stream.return_value = iter(snapshots)
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = None
+        
+        # Act
+        llm_service = LLMService(api_key="test_api_key", cache=mock_cache)
+        with patch.object(llm_service, '_cache_key', return_value="key"):
+            results = list(llm_service.stream_with_template(
+                template="Stream {variable}",
+                input_variables={"variable": "value"},
+                output_schema=EmailContent
+            ))
+        
+        # Assert
+        self.assertEqual(results, snapshots)
+        mock_cache.set.assert_called_once_with("key", EmailContent(**snapshots[-1]))
+    
+    @patch('Recruiter.services.llm.llm_service.get_chat_model')
+    @patch('Recruiter.services.llm.llm_service.ConfigManager')
+    @patch('Recruiter.services.llm.llm_service.ChatPromptTemplate')
+    def test_stream_with_template_reuses_chain(self, mock_chat_prompt_template, mock_config_manager, mock_get_chat_model):
+        """Test that the streaming chain is compiled once per template."""
+        # Arrange
+        mock_llm = MagicMock()
+        mock_get_chat_model.return_value = mock_llm
+        mock_prompt = MagicMock()
+        mock_chat_prompt_template.return_value = mock_prompt
+        mock_chain = MagicMock()
+        mock_prompt.__or__.return_value = mock_chain
+        complete = {"subject": "Hello", "body_text": "Hi there", "body_html": "<p>Hi there</p>"}
+        mock_chain.stream.side_effect = lambda *args, **kwargs: iter([complete])
+        
+        # Act
+        llm_service = LLMService(api_key="test_api_key", metrics_sink=MagicMock())
+        for value in ["a", "b"]:
+            list(llm_service.stream_with_template(
+                template="Stream reused {variable}",
+                input_variables={"variable": value},
+                output_schema=EmailContent
+            ))
+        
+        # Assert
+        mock_chat_prompt_template.assert_called_once()
+        mock_llm.with_structured_output.assert_called_once()
+        self.assertEqual(mock_chain.stream.call_count, 2)
+    
+    @patch('Recruiter.services.llm.llm_service.get_chat_model')
+    @patch('Recruiter.services.llm.llm_service.ConfigManager')
+    @patch('Recruiter.services.llm.llm_service.ChatPromptTemplate')
+    def test_stream_with_template_records_abandoned_stream(self, mock_chat_prompt_template, mock_config_manager, mock_get_chat_model):
+        """Test that telemetry is recorded when the caller stops reading early."""
+        # Arrange
+        mock_get_chat_model.return_value = MagicMock()
+        mock_prompt = MagicMock()
+        mock_chat_prompt_template.return_value = mock_prompt
+        mock_chain = MagicMock()
+        mock_prompt.__or__.return_value = mock_chain
+        mock_chain.stream.return_value = iter([{"subject": "Hello"}, {"subject": "Hello there"}])
+        mock_sink = MagicMock()
+        
+        # Act
+        llm_service = LLMService(api_key="test_api_key", metrics_sink=mock_sink)
+        stream = llm_service.stream_with_template(
+            template="Stream abandoned {variable}",
+            input_variables={"variable": "value"},
+            output_schema=EmailContent
+        )
+        next(stream)
+        stream.close()
+        
+        # Assert
+        mock_sink.record.assert_called_once()
+        record = mock_sink.record.call_args[0][0]
+        self.assertFalse(record.success)
+        self.assertEqual(record.error, "Stream closed before completion")
 
 
 if __name__ == '__main__':
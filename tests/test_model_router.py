@@ -0,0 +1,51 @@
+"""
+Tests for the model router.
+
+This module contains tests for per-task model profiles.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from Recruiter.services.llm.model_router import get_model_profile, TASK_EMAIL, TASK_EXTRACTION
+
+
+class TestModelRouter(unittest.TestCase):
+    """Tests for the get_model_profile function."""
+    
+    @patch('Recruiter.services.llm.model_router.ConfigManager')
+    def test_defaults_without_config(self, mock_config_manager):
+        """Test that tasks fall back to their default profiles."""
+        # Arrange
+        mock_config_manager.return_value.get_section.return_value = {}
+        
+        # Act
+        profile = get_model_profile(TASK_EXTRACTION)
+        
+        # Assert
+        self.assertEqual(profile.model, "gpt-4o-mini")
+        self.assertEqual(profile.temperature, 0.0)
+        self.assertEqual(profile.max_tokens, 512)
+        self.assertIsNone(profile.fallback_model)
+    
+    @patch('Recruiter.services.llm.model_router.ConfigManager')
+    def test_config_overrides_fields(self, mock_config_manager):
+        """Test that configured fields override the task defaults."""
+        # Arrange
+        mock_config_manager.return_value.get_section.return_value = {
+            "email": {"model": "gpt-4o", "timeout": 30, "fallback_model": "gpt-4o-mini"}
+        }
+        
+        # Act
+        profile = get_model_profile(TASK_EMAIL)
+        
+        # Assert
+        mock_config_manager.return_value.get_section.assert_called_once_with("models")
+        self.assertEqual(profile.model, "gpt-4o")
+        self.assertEqual(profile.temperature, 0.2)
+        self.assertEqual(profile.timeout, 30)
+        self.assertEqual(profile.fallback_model, "gpt-4o-mini")
+
+
+if __name__ == '__main__':
+    unittest.main()
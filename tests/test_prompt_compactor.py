@@ -0,0 +1,105 @@
+"""
+Tests for prompt compaction.
+
+This module contains tests for trimming prompt inputs to a token budget.
+"""
+
+import unittest
+
+from Recruiter.utils.text.prompt_compactor import (
+    compact_text,
+    dedupe_boilerplate,
+    normalize_whitespace
+)
+from Recruiter.utils.text.token_counter import count_tokens
+
+
+class TestPromptCompactor(unittest.TestCase):
+    """Tests for the prompt compaction functions."""
+    
+    def test_normalize_whitespace(self):
+        """Test that spaces and blank lines are collapsed."""
+        # Arrange
+        text = "  Acme  Corp\t builds rockets.\r\n\r\n\r\n\r\nWe ship.  "
+        
+        # Act
+        result = normalize_whitespace(text)
+        
+        # Assert
+        self.assertEqual(result, "Acme Corp builds rockets.\n\nWe ship.")
+    
+    def test_dedupe_boilerplate_keeps_first_occurrence(self):
+        """Test that repeated long lines are removed and short ones kept."""
+        # Arrange
+        footer = "Copyright 2024 Acme Corporation. All rights reserved."
+        text = "\n".join([footer, "Python", "About Acme", "Python", footer])
+        
+        # Act
+        result = dedupe_boilerplate(text)
+        
+        # Assert
+        self.assertEqual(result.split("\n"), [footer, "Python", "About Acme", "Python"])
+    
+    def test_compact_text_keeps_every_section(self):
+        """Test that truncation keeps the start of each section within budget."""
+        # Arrange
+        experience = "\n".join(
+            f"- Led project {i} delivering Python services to production" for i in range(200)
+        )
+        text = f"EXPERIENCE\n{experience}\nSKILLS\nPython, Go, Rust\nEDUCATION\nBSc Computer Science"
+        
+        # Act
+        result = compact_text(text, 200)
+        
+        # Assert
+        self.assertLessEqual(count_tokens(result), 200)
+        self.assertIn("- Led project 0 delivering", result)
+        self.assertIn("SKILLS\nPython, Go, Rust", result)
+        self.assertIn("EDUCATION\nBSc Computer Science", result)
+    
+    def test_compact_text_with_many_sections(self):
+        """Test that many sections are kept whole in order rather than as fragments."""
+        # Arrange
+        paragraphs = [
+            f"Paragraph {i} describes how the team shipped a reliable Python service to customers."
+            for i in range(1000)
+        ]
+        
+        for count in (100, 1000):
+            with self.subTest(sections=count):
+                text = "\n\n".join(paragraphs[:count])
+                
+                # Act
+                result = compact_text(text, 800)
+                
+                # Assert
+                kept = result.split("\n")
+                self.assertLessEqual(count_tokens(result), 800)
+                self.assertGreater(len(kept), 10)
+                self.assertEqual(kept[0], paragraphs[0])
+                self.assertEqual(kept[:-1], paragraphs[:len(kept) - 1])
+    
+    def test_compact_text_with_tiny_budget(self):
+        """Test that a budget smaller than one section keeps the start of the text."""
+        # Arrange
+        text = "\n\n".join(f"Section {i} covers a long list of achievements." for i in range(50))
+        
+        # Act
+        result = compact_text(text, 5)
+        
+        # Assert
+        self.assertTrue(result)
+        self.assertLessEqual(count_tokens(result), 5)
+        self.assertTrue(text.startswith(result))
+    
+    def test_compact_text_within_budget_is_unchanged(self):
+        """Test that short texts are only cleaned."""
+        # Act
+        result = compact_text("Acme  builds rockets.", 100)
+        
+        # Assert
+        self.assertEqual(result, "Acme builds rockets.")
+
+
+if __name__ == '__main__':
+    unittest.main()
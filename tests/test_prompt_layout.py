@@ -0,0 +1,85 @@
+"""
+Tests for the prompt layout.
+
+This module contains tests for assembling prompts with a static prefix.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from langchain_core.prompts import ChatPromptTemplate
+
+from Recruiter.prompts.email_prompts import EMAIL_GENERATION_LAYOUT
+from Recruiter.prompts.prompt_layout import MIN_CACHEABLE_PREFIX_TOKENS, PromptLayout
+
+
+class TestPromptLayout(unittest.TestCase):
+    """Tests for the PromptLayout class."""
+    
+    def test_static_prefix_is_identical_across_requests(self):
+        """Test that the system message does not depend on the inputs."""
+        # Arrange
+        first = dict.fromkeys(EMAIL_GENERATION_LAYOUT.variables, "first")
+        second = dict.fromkeys(EMAIL_GENERATION_LAYOUT.variables, "second")
+        
+        # Act
+        messages = []
+        for input_variables in (first, second):
+            chat_prompt = ChatPromptTemplate([
+                ("system", EMAIL_GENERATION_LAYOUT.system_template),
+                ("human", EMAIL_GENERATION_LAYOUT.human_template(input_variables))
+            ])
+            messages.append(chat_prompt.format_messages(**input_variables))
+        
+        # Assert
+        self.assertEqual(messages[0][0].content, EMAIL_GENERATION_LAYOUT.instructions)
+        self.assertEqual(messages[0][0].content, messages[1][0].content)
+        self.assertTrue(messages[0][1].content.startswith("RESUME DETAILS:\nfirst"))
+    
+    def test_optional_sections_and_braces(self):
+        """Test that empty optional sections are left out and braces are escaped."""
+        # Arrange
+        layout = PromptLayout(
+            instructions="Return JSON like {\"a\": 1}.",
+            sections=[("RESUME", "resume"), ("FEEDBACK", "feedback")],
+            optional=["feedback"]
+        )
+        
+        # Act
+        without_feedback = layout.human_template({"resume": "text", "feedback": ""})
+        with_feedback = layout.human_template({"resume": "text", "feedback": "shorter"})
+        chat_prompt = ChatPromptTemplate([("system", layout.system_template), ("human", without_feedback)])
+        
+        # Assert
+        self.assertEqual(without_feedback, "RESUME:\n{resume}")
+        self.assertEqual(with_feedback, "RESUME:\n{resume}\n\nFEEDBACK:\n{feedback}")
+        self.assertEqual(chat_prompt.input_variables, ["resume"])
+        self.assertGreater(layout.prefix_tokens, 0)
+    
+    def test_stable_sections_count_towards_shared_prefix(self):
+        """Test that only leading stable sections extend the shared prefix."""
+        # Arrange
+        layout = PromptLayout(
+            instructions="Write an email.",
+            sections=[("RESUME", "resume"), ("JOB", "job")],
+            stable=["resume"],
+            name="test"
+        )
+        short_inputs = {"resume": "Python developer", "job": "word " * 2000}
+        long_inputs = {"resume": "Python developer " * 600, "job": "short"}
+        
+        # Act
+        with patch('builtins.print') as mock_print:
+            short_cacheable = layout.check_cacheable(short_inputs)
+            layout.check_cacheable(short_inputs)
+            long_cacheable = layout.check_cacheable(long_inputs)
+        
+        # Assert
+        self.assertLess(layout.shared_prefix_tokens(short_inputs), MIN_CACHEABLE_PREFIX_TOKENS)
+        self.assertFalse(short_cacheable)
+        self.assertTrue(long_cacheable)
+        mock_print.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+Tests for the rate limit scheduler.
+
+This module contains tests for request budgeting and retry behaviour.
+"""
+
+import unittest
+from unittest.mock import patch, MagicMock
+
+import httpx
+import openai
+
+from Recruiter.services.llm.rate_limiter import RateLimitScheduler
+
+
+def make_status_error(error_class, status_code, headers=None):
+    """Create an OpenAI status error with the given response headers."""
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(status_code, headers=headers or {}, request=request)
+    return error_class("error", response=response, body=None)
+
+
+class TestRateLimitScheduler(unittest.TestCase):
+    """Tests for the RateLimitScheduler class."""
+    
+    @patch('Recruiter.services.llm.rate_limiter.time.sleep')
+    def test_retries_rate_limit_with_retry_after(self, mock_sleep):
+        """Test that a 429 is retried after at least the Retry-After delay."""
+        # Arrange
+        scheduler = RateLimitScheduler(max_retries=3, base_delay=0.01)
+        error = make_status_error(openai.RateLimitError, 429, {"retry-after-ms": "50"})
+        func = MagicMock(side_effect=[error, "ok"])
+        
+        # Act
+        result = scheduler.run(func)
+        
+        # Assert
+        self.assertEqual(result, "ok")
+        self.assertEqual(func.call_count, 2)
+        self.assertGreaterEqual(mock_sleep.call_args_list[0].args[0], 0.05)
+    
+    @patch('Recruiter.services.llm.rate_limiter.time.sleep')
+    def test_does_not_retry_client_errors(self, mock_sleep):
+        """Test that non-transient errors are raised immediately."""
+        # Arrange
+        scheduler = RateLimitScheduler(max_retries=3)
+        error = make_status_error(openai.BadRequestError, 400)
+        func = MagicMock(side_effect=error)
+        
+        # Act / Assert
+        with self.assertRaises(openai.BadRequestError):
+            scheduler.run(func)
+        func.assert_called_once()
+        mock_sleep.assert_not_called()
+    
+    @patch('Recruiter.services.llm.rate_limiter.time.sleep')
+    def test_gives_up_after_max_retries(self, mock_sleep):
+        """Test that retries stop after max_retries attempts."""
+        # Arrange
+        scheduler = RateLimitScheduler(max_retries=2, base_delay=0.01)
+        error = make_status_error(openai.InternalServerError, 503)
+        func = MagicMock(side_effect=error)
+        
+        # Act / Assert
+        with self.assertRaises(openai.InternalServerError):
+            scheduler.run(func)
+        self.assertEqual(func.call_count, 3)
+    
+    def test_token_budget_delays_requests(self):
+        """Test that requests wait once the token budget is spent."""
+        # Arrange
+        scheduler = RateLimitScheduler(tokens_per_minute=600)
+        
+        # Act
+        first_wait = scheduler._reserve(600)
+        second_wait = scheduler._reserve(60)
+        
+        # Assert
+        self.assertEqual(first_wait, 0.0)
+        self.assertAlmostEqual(second_wait, 6.0, delta=0.1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Tests for the research agent registry.
+
+This module contains tests for reusing web search agents per API key
+and running them from sync and async code.
+"""
+
+import os
+import asyncio
+import unittest
+from unittest.mock import patch, AsyncMock, MagicMock
+
+from Recruiter.utils.web_search import research_agent
+
+
+AGENT_CLASSES = ["AsyncOpenAI", "Agent", "ModelSettings", "OpenAIResponsesModel", "RunConfig", "WebSearchTool"]
+
+
+class TestResearchAgent(unittest.TestCase):
+    """Tests for the research agent functions."""
+    
+    def setUp(self):
+        """Replace the Agents SDK classes with mocks and clear the registry."""
+        research_agent._agents.clear()
+        self.patchers = [
+            patch(f'Recruiter.utils.web_search.research_agent.{name}', create=True)
+            for name in AGENT_CLASSES
+        ]
+        self.mocks = {name: patcher.start() for name, patcher in zip(AGENT_CLASSES, self.patchers)}
+        self.runner_patcher = patch('Recruiter.utils.web_search.research_agent.Runner', create=True)
+        self.mock_runner = self.runner_patcher.start()
+        self.mock_runner.run = AsyncMock(side_effect=lambda agent, company_name, run_config: MagicMock(
+            final_output=f"{company_name} builds rockets"
+        ))
+    
+    def tearDown(self):
+        """Stop the patches and clear the registry."""
+        for patcher in self.patchers:
+            patcher.stop()
+        self.runner_patcher.stop()
+        research_agent._agents.clear()
+    
+    def test_agent_is_reused_per_api_key(self):
+        """Test that one agent and client are created per API key."""
+        # Act
+        first = research_agent.get_research_agent("key-a")
+        second = research_agent.get_research_agent("key-a")
+        other = research_agent.get_research_agent("key-b")
+        
+        # Assert
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertEqual(self.mocks["AsyncOpenAI"].call_count, 2)
+        self.assertEqual(self.mocks["AsyncOpenAI"].call_args_list[0].kwargs["api_key"], "key-a")
+    
+    @patch.dict(os.environ, {}, clear=True)
+    def test_run_does_not_modify_environment(self):
+        """Test that a sync run uses the agent's client instead of os.environ."""
+        # Act
+        result = research_agent.run_research_agent("Acme", "key-a")
+        
+        # Assert
+        self.assertEqual(result, "Acme builds rockets")
+        self.assertNotIn("OPENAI_API_KEY", os.environ)
+    
+    def test_async_runs_overlap(self):
+        """Test that concurrent async runs with different keys all complete."""
+        # Arrange
+        async def slow_run(agent, company_name, run_config):
+            await asyncio.sleep(0.2)
+            return MagicMock(final_output=company_name)
+        self.mock_runner.run = AsyncMock(side_effect=slow_run)
+        
+        async def research_all():
+            return await asyncio.gather(*(
+                research_agent.arun_research_agent(f"Company {i}", f"key-{i % 2}")
+                for i in range(5)
+            ))
+        
+        # Act
+        loop = asyncio.new_event_loop()
+        try:
+            start_time = loop.time()
+            results = loop.run_until_complete(research_all())
+            elapsed = loop.time() - start_time
+        finally:
+            loop.close()
+        
+        # Assert
+        self.assertEqual(results, [f"Company {i}" for i in range(5)])
+        self.assertLess(elapsed, 0.6)
+
+
+if __name__ == '__main__':
+    unittest.main()
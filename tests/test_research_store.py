@@ -0,0 +1,203 @@
+"""
+Tests for the company research store.
+
+This module contains tests for storing, refreshing and invalidating
+company research results.
+"""
+
+import asyncio
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch, MagicMock
+
+from Recruiter.core.company_research.company_researcher import CompanyResearcher
+from Recruiter.core.company_research.research_store import CompanyResearchStore
+from Recruiter.utils.file_utils.file_store import read_json, write_json
+
+
+class TestCompanyResearchStore(unittest.TestCase):
+    """Tests for the CompanyResearchStore class."""
+    
+    def setUp(self):
+        """Create a store in a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = CompanyResearchStore(
+            cache_dir=self.temp_dir.name,
+            ttl_seconds=60,
+            max_stale_seconds=3600
+        )
+    
+    def tearDown(self):
+        """Remove the temporary files."""
+        self.temp_dir.cleanup()
+    
+    def age_entry(self, company_name, seconds):
+        """Move the creation time of an entry into the past."""
+        path = self.store._entry_path(company_name)
+        entry = read_json(path)
+        entry["created_at"] -= seconds
+        write_json(path, entry)
+    
+    def test_fresh_entry_is_served_by_normalized_name(self):
+        """Test that research is reused for the same company written differently."""
+        # Arrange
+        research = MagicMock(return_value="Acme builds rockets")
+        self.store.get_or_research("Acme", research)
+        
+        # Act
+        result = self.store.get_or_research("  ACME ", research)
+        
+        # Assert
+        self.assertEqual(result, "Acme builds rockets")
+        self.assertEqual(research.call_count, 1)
+    
+    def test_stale_entry_is_served_and_refreshed(self):
+        """Test that a stale entry is returned at once and refreshed in the background."""
+        # Arrange
+        self.store.set("Acme", "old info")
+        self.age_entry("Acme", 120)
+        refreshed = threading.Event()
+        
+        def research():
+            refreshed.set()
+            return "new info"
+        
+        # Act
+        result = self.store.get_or_research("Acme", research)
+        refreshed.wait(5)
+        self.store._get_executor().shutdown(wait=True)
+        
+        # Assert
+        self.assertEqual(result, "old info")
+        entry = self.store.get("Acme")
+        self.assertEqual(entry["info"], "new info")
+        self.assertFalse(entry["stale"])
+    
+    def test_expired_entry_is_researched_again(self):
+        """Test that an entry older than max_stale_seconds is not served."""
+        # Arrange
+        self.store.set("Acme", "old info")
+        self.age_entry("Acme", 7200)
+        
+        # Act
+        result = self.store.get_or_research("Acme", lambda: "new info")
+        
+        # Assert
+        self.assertEqual(result, "new info")
+    
+    def test_failed_research_is_not_stored(self):
+        """Test that an empty research result is not stored."""
+        # Act
+        self.store.get_or_research("Acme", lambda: None)
+        
+        # Assert
+        self.assertIsNone(self.store.get("Acme"))
+    
+    def test_invalidate(self):
+        """Test that an invalidated company is researched again."""
+        # Arrange
+        self.store.set("Acme", "old info")
+        
+        # Act
+        removed = self.store.invalidate("acme")
+        result = self.store.get_or_research("Acme", lambda: "new info")
+        
+        # Assert
+        self.assertTrue(removed)
+        self.assertEqual(result, "new info")
+        self.assertFalse(self.store.invalidate("Unknown"))
+    
+    def test_async_stale_entry_is_refreshed_in_task(self):
+        """Test that the async path serves stale entries and refreshes them in a task."""
+        # Arrange
+        self.store.set("Acme", "old info")
+        self.age_entry("Acme", 120)
+        
+        async def research():
+            return "new info"
+        
+        async def run():
+            result = await self.store.aget_or_research("Acme", research)
+            await asyncio.gather(*self.store._tasks)
+            return result
+        
+        # Act
+        result = asyncio.run(run())
+        
+        # Assert
+        self.assertEqual(result, "old info")
+        self.assertEqual(self.store.get("Acme")["info"], "new info")
+
+
+class TestCompanyResearcherStore(unittest.TestCase):
+    """Tests for company research through the store."""
+    
+    def setUp(self):
+        """Create a store in a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = CompanyResearchStore(cache_dir=self.temp_dir.name)
+    
+    def tearDown(self):
+        """Remove the temporary files."""
+        self.temp_dir.cleanup()
+    
+    @patch('Recruiter.core.company_research.company_researcher.get_company_info_agent')
+    @patch('Recruiter.core.company_research.company_researcher.LLMService')
+    def test_repeat_company_skips_search(self, mock_llm_service_class, mock_get_company_info_agent):
+        """Test that a repeat company is served from the store until invalidated."""
+        # Arrange
+        mock_get_company_info_agent.return_value = "Acme builds rockets"
+        researcher = CompanyResearcher(api_key="test_api_key", research_store=self.store)
+        
+        # Act
+        first = researcher.research_company("Acme")
+        second = researcher.research_company("acme")
+        researcher.invalidate_company("Acme")
+        researcher.research_company("Acme")
+        
+        # Assert
+        self.assertEqual(first, "Acme builds rockets")
+        self.assertEqual(second, first)
+        self.assertEqual(mock_get_company_info_agent.call_count, 2)
+    
+    @patch('Recruiter.core.company_research.company_researcher.get_company_info_agent')
+    @patch('Recruiter.core.company_research.company_researcher.LLMService')
+    def test_name_variants_share_research(self, mock_llm_service_class, mock_get_company_info_agent):
+        """Test that a company written differently is researched once."""
+        # Arrange
+        mock_get_company_info_agent.return_value = "Google organizes information"
+        researcher = CompanyResearcher(api_key="test_api_key", research_store=self.store)
+        
+        # Act
+        results = [
+            researcher.research_company("Google"),
+            researcher.research_company("Google LLC"),
+            researcher.research_company("google inc."),
+            researcher.research_company("Google Cloud", "jane@careers.google.com")
+        ]
+        
+        # Assert
+        self.assertEqual(set(results), {"Google organizes information"})
+        self.assertEqual(mock_get_company_info_agent.call_count, 2)
+    
+    @patch('Recruiter.core.company_research.company_researcher.get_company_info_agent')
+    @patch('Recruiter.core.company_research.company_researcher.LLMService')
+    def test_unidentified_companies_are_not_stored(self, mock_llm_service_class, mock_get_company_info_agent):
+        """Test that companies without a name or domain do not share one entry."""
+        # Arrange
+        mock_get_company_info_agent.side_effect = ["First company", "Second company"]
+        researcher = CompanyResearcher(api_key="test_api_key", research_store=self.store)
+        
+        # Act
+        first = researcher.research_company("", "jane@gmail.com")
+        second = researcher.research_company("...")
+        
+        # Assert
+        self.assertEqual(first, "First company")
+        self.assertEqual(second, "Second company")
+        self.assertEqual(self.store._entry_paths(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
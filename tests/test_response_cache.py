@@ -0,0 +1,98 @@
+"""
+Tests for the response cache.
+
+This module contains tests for the on-disk LLM response cache.
+"""
+
+import os
+import time
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from Recruiter.models.schemas import EmailContent, JobDetails
+from Recruiter.services.llm.response_cache import ResponseCache
+
+
+class TestResponseCache(unittest.TestCase):
+    """Tests for the ResponseCache class."""
+    
+    def setUp(self):
+        """Create a cache in a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = ResponseCache(cache_dir=self.temp_dir.name, max_entries=2, ttl_seconds=60)
+    
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.temp_dir.cleanup()
+    
+    def test_structured_round_trip(self):
+        """Test that structured output is re-validated on a hit."""
+        key = self.cache.make_key("prompt", "gpt-4o-mini", 0.2, JobDetails)
+        details = JobDetails(company_name="Acme", recruiter_email="hr@acme.com", job_position="Engineer")
+        
+        self.assertIsNone(self.cache.get(key, JobDetails))
+        self.cache.set(key, details)
+        
+        self.assertEqual(self.cache.get(key, JobDetails), details)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+        self.assertEqual(self.cache.stats()["misses"], 1)
+    
+    def test_key_depends_on_model_parameters(self):
+        """Test that different model parameters produce different keys."""
+        key_a = self.cache.make_key("prompt", "gpt-4o-mini", 0.2)
+        key_b = self.cache.make_key("prompt", "gpt-4o-mini", 0.7)
+        key_c = self.cache.make_key("prompt", "gpt-4o-mini", 0.2, JobDetails)
+        
+        self.assertEqual(len({key_a, key_b, key_c}), 3)
+    
+    def test_key_depends_on_completion_limit_and_fallback(self):
+        """Test that a response cut short by max_tokens is not served for a larger limit."""
+        key_small = self.cache.make_key("prompt", "gpt-4o", 0.2, max_tokens=256)
+        key_large = self.cache.make_key("prompt", "gpt-4o", 0.2, max_tokens=4096)
+        key_fallback = self.cache.make_key("prompt", "gpt-4o", 0.2, max_tokens=256, fallback_model="gpt-4o-mini")
+        
+        self.assertEqual(len({key_small, key_large, key_fallback}), 3)
+    
+    def test_schema_is_serialized_once_per_class(self):
+        """Test that the output schema's JSON schema is not rebuilt on every lookup."""
+        with patch.object(EmailContent, 'model_json_schema', wraps=EmailContent.model_json_schema) as mock_schema:
+            keys = {self.cache.make_key(f"prompt {i}", "gpt-4o-mini", 0.2, EmailContent) for i in range(3)}
+        
+        self.assertEqual(len(keys), 3)
+        self.assertLessEqual(mock_schema.call_count, 1)
+    
+    def test_ttl_expiry(self):
+        """Test that expired entries are treated as misses."""
+        self.cache.ttl_seconds = 0
+        self.cache.set("key", "value")
+        time.sleep(0.01)
+        
+        self.assertIsNone(self.cache.get("key"))
+    
+    def test_size_eviction(self):
+        """Test that the oldest entries are evicted beyond max_entries."""
+        self.cache.evict_interval = 1
+        for index, key in enumerate(["a", "b", "c"]):
+            self.cache.set(key, key)
+            path = os.path.join(self.temp_dir.name, f"{key}.json")
+            os.utime(path, (index, time.time() - 10 + index))
+        
+        self.assertEqual(self.cache.stats()["entries"], 2)
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(self.cache.get("c"), "c")
+    
+    def test_eviction_runs_every_interval(self):
+        """Test that the directory is only scanned once every evict_interval writes."""
+        self.cache.evict_interval = 3
+        for key in ["a", "b", "c", "d"]:
+            self.cache.set(key, key)
+            time.sleep(0.01)
+        
+        # The third write evicted down to max_entries, the fourth did not evict
+        self.assertEqual(self.cache.stats()["entries"], 3)
+        self.assertIsNone(self.cache.get("a"))
+
+
+if __name__ == '__main__':
+    unittest.main()
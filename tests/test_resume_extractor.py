@@ -0,0 +1,141 @@
+"""
+Tests for the resume extractor and formatter.
+
+This module contains tests for extracting structured resumes once and
+rendering them for generation prompts.
+"""
+
+import tempfile
+import unittest
+from unittest.mock import patch, MagicMock
+
+from Recruiter.core.resume.parse_cache import ResumeParseCache
+from Recruiter.core.resume.resume_extractor import ResumeExtractor
+from Recruiter.core.resume.resume_formatter import (
+    format_relevant_highlights,
+    format_resume,
+    format_resume_input
+)
+from Recruiter.models.schemas import (
+    ParsedResume,
+    ResumeContact,
+    ResumeExperience,
+    ResumeProject
+)
+
+
+def make_parsed_resume():
+    """Build a structured resume with entries of varying relevance."""
+    return ParsedResume(
+        contact=ResumeContact(name="Jane Doe", email="jane@example.com"),
+        skills=["Photoshop", "Python", "Kubernetes", "Excel"],
+        experience=[
+            ResumeExperience(
+                title="Backend Engineer",
+                company="Acme",
+                start_date="2021",
+                end_date="Present",
+                highlights=[
+                    "Organised the office party",
+                    "Built Python services on Kubernetes",
+                    "Mentored interns",
+                    "Wrote onboarding docs"
+                ]
+            ),
+            ResumeExperience(title="Developer", company="Beta", highlights=["Maintained Java apps"]),
+            ResumeExperience(title="Intern", company="Gamma", highlights=["Tested Java apps"]),
+            ResumeExperience(title="Cashier", company="Shop", highlights=["Handled payments"])
+        ],
+        projects=[
+            ResumeProject(name="Sketches", description="A drawing portfolio"),
+            ResumeProject(name="Deployer", description="Kubernetes deployment tool", technologies=["Python"]),
+            ResumeProject(name="Recipes", description="A cooking blog")
+        ]
+    )
+
+
+class TestResumeFormatter(unittest.TestCase):
+    """Tests for the resume formatting functions."""
+    
+    def test_resume_block_keeps_resume_order(self):
+        """Test that the resume block keeps its entries in resume order."""
+        # Act
+        result = format_resume(make_parsed_resume())
+        
+        # Assert
+        self.assertIn("SKILLS:\nPhotoshop, Python, Kubernetes, Excel", result)
+        self.assertLess(result.index("Organised the office party"), result.index("Built Python services"))
+        self.assertNotIn("Wrote onboarding docs", result)
+        self.assertIn("Cashier, Shop", result)
+        self.assertIn("- Sketches:", result)
+    
+    def test_resume_block_is_job_independent(self):
+        """Test that different jobs get the same resume block and different highlights."""
+        # Arrange
+        parsed = make_parsed_resume()
+        
+        # Act
+        python_resume, python_highlights = format_resume_input(
+            parsed, "Python engineer to run services on Kubernetes", 1500
+        )
+        java_resume, java_highlights = format_resume_input(parsed, "Java developer", 1500)
+        
+        # Assert
+        self.assertEqual(python_resume, java_resume)
+        self.assertNotEqual(python_highlights, java_highlights)
+    
+    def test_relevant_highlights_come_first(self):
+        """Test that only entries matching the job are listed, most matches first."""
+        # Act
+        result = format_relevant_highlights(
+            make_parsed_resume(),
+            "Python engineer to run services on Kubernetes"
+        )
+        
+        # Assert
+        self.assertIn("MATCHING SKILLS:\nPython, Kubernetes", result)
+        self.assertIn("- Built Python services on Kubernetes (Backend Engineer, Acme)", result)
+        self.assertNotIn("Organised the office party", result)
+        self.assertIn("- Deployer:", result)
+        self.assertNotIn("Recipes", result)
+        self.assertEqual(format_relevant_highlights(make_parsed_resume(), ""), "")
+
+
+class TestResumeExtractor(unittest.TestCase):
+    """Tests for the ResumeExtractor class."""
+    
+    def setUp(self):
+        """Create a temporary store for extractions."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = ResumeParseCache(cache_dir=self.temp_dir.name)
+    
+    def tearDown(self):
+        """Remove the temporary files."""
+        self.temp_dir.cleanup()
+    
+    @patch('Recruiter.core.resume.resume_extractor.LLMService')
+    def test_resume_is_extracted_once(self, mock_llm_service_class):
+        """Test that a stored extraction is reused by a new extractor."""
+        # Arrange
+        llm_service = MagicMock()
+        llm_service.model_name = "gpt-4o-mini"
+        llm_service.generate_with_template.return_value = make_parsed_resume()
+        mock_llm_service_class.for_task.return_value = llm_service
+        
+        # Act
+        first = ResumeExtractor(api_key="test_api_key", cache=self.cache).extract("resume text", "abc123")
+        second = ResumeExtractor(
+            api_key="test_api_key",
+            cache=ResumeParseCache(cache_dir=self.temp_dir.name)
+        ).extract("resume text", "abc123")
+        
+        # Assert
+        self.assertEqual(llm_service.generate_with_template.call_count, 1)
+        self.assertEqual(second, first)
+        call_kwargs = llm_service.generate_with_template.call_args.kwargs
+        self.assertEqual(call_kwargs["input_variables"], {"resume": "resume text"})
+        self.assertIs(call_kwargs["output_schema"], ParsedResume)
+
+
+if __name__ == '__main__':
+    unittest.main()
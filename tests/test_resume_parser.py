@@ -0,0 +1,190 @@
+"""
+Tests for the resume parser.
+
+This module contains tests for cached resume parsing.
+"""
+
+import io
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from docx import Document
+from pypdf import PdfReader, PdfWriter
+
+from Recruiter.core.resume.parse_cache import ResumeParseCache
+from Recruiter.core.resume.pdf_extractor import extract_pdf_text
+from Recruiter.core.resume.resume_parser import ResumeParser
+from Recruiter.utils.file_utils.mapped_file import map_file
+from Recruiter.utils.file_utils.path_manager import PathManager
+
+
+def write_docx(file_path, text):
+    """Write a DOCX file with one paragraph."""
+    document = Document()
+    document.add_paragraph(text)
+    document.save(file_path)
+
+
+class TestResumeParser(unittest.TestCase):
+    """Tests for the ResumeParser class with a parse cache."""
+    
+    def setUp(self):
+        """Create a parser with a temporary cache."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = ResumeParseCache(cache_dir=os.path.join(self.temp_dir.name, "cache"))
+        self.parser = ResumeParser(cache=self.cache)
+        self.calls = 0
+        parse_docx = self.parser._parse_docx
+        
+        def counting_parse_docx(file_path):
+            self.calls += 1
+            return parse_docx(file_path)
+        
+        self.parser._parse_docx = counting_parse_docx
+    
+    def tearDown(self):
+        """Remove the temporary files."""
+        self.temp_dir.cleanup()
+    
+    def test_unchanged_file_is_parsed_once(self):
+        """Test that loading an unchanged file again is served from the cache."""
+        # Arrange
+        file_path = os.path.join(self.temp_dir.name, "resume.docx")
+        write_docx(file_path, "Python developer")
+        
+        # Act
+        first = self.parser.load_resume_from_file(file_path)
+        second = self.parser.load_resume_from_file(file_path)
+        
+        # Assert
+        self.assertEqual(first, "Python developer")
+        self.assertEqual(second, first)
+        self.assertEqual(self.calls, 1)
+    
+    def test_changed_file_is_parsed_again(self):
+        """Test that a modified file invalidates the cached text."""
+        # Arrange
+        file_path = os.path.join(self.temp_dir.name, "resume.docx")
+        write_docx(file_path, "Python developer")
+        self.parser.load_resume_from_file(file_path)
+        
+        # Act
+        write_docx(file_path, "Senior Python developer")
+        os.utime(file_path, ns=(0, os.stat(file_path).st_mtime_ns + 1_000_000))
+        result = self.parser.load_resume_from_file(file_path)
+        
+        # Assert
+        self.assertEqual(result, "Senior Python developer")
+        self.assertEqual(self.calls, 2)
+    
+    def test_disk_cache_survives_new_parser(self):
+        """Test that parsed text is reused from disk by a new cache instance."""
+        # Arrange
+        file_path = os.path.join(self.temp_dir.name, "upload.docx")
+        write_docx(file_path, "Data engineer")
+        with open(file_path, "rb") as f:
+            content = f.read()
+        self.parser.load_resume_from_bytes(content, "upload.docx")
+        
+        # Act
+        cache = ResumeParseCache(cache_dir=self.cache.cache_dir)
+        key = cache.make_key(cache.hash_content(content), self.parser._parser_id(".docx"))
+        
+        # Assert
+        self.assertEqual(cache.get(key), "Data engineer")
+    
+    
+    def test_pdf_path_and_bytes_match(self):
+        """Test that a PDF gives the same text from its path and its bytes."""
+        # Arrange
+        parser = ResumeParser(cache=self.cache)
+        file_path = str(PathManager().get_resume_path())
+        with open(file_path, "rb") as f:
+            content = f.read()
+        
+        # Act
+        from_path = parser._parse_pdf(file_path)
+        from_bytes = parser._parse_pdf_bytes(content)
+        
+        # Assert
+        self.assertTrue(from_path)
+        self.assertEqual(from_path, from_bytes)
+    
+    def test_pdf_memory_map_matches_path(self):
+        """Test that a memory-mapped PDF gives the same text as its path."""
+        # Arrange
+        parser = ResumeParser(cache=self.cache)
+        parser.cache = None  # Parse both inputs instead of serving one from the cache
+        file_path = str(PathManager().get_resume_path())
+        
+        # Act
+        from_path = parser.load_resume_from_file(file_path)
+        with map_file(file_path) as content:
+            from_view = parser.load_resume_from_bytes(content, "resume.pdf")
+        
+        # Assert
+        self.assertEqual(from_view, from_path)
+    
+    def test_parallel_pdf_extraction_keeps_page_order(self):
+        """Test that pages extracted in worker processes are reassembled in order."""
+        # Arrange
+        source = PdfReader(str(PathManager().get_resume_path()))
+        writer = PdfWriter()
+        for _ in range(6):
+            writer.add_page(source.pages[0])
+        buffer = io.BytesIO()
+        writer.write(buffer)
+        content = buffer.getvalue()
+        serial_parser = ResumeParser(cache=self.cache)
+        serial_parser.parallel_page_threshold = None
+        parallel_parser = ResumeParser(cache=self.cache)
+        parallel_parser.parallel_page_threshold = 2
+        parallel_parser.max_workers = 4
+        
+        # Act
+        serial = serial_parser._parse_pdf_bytes(content)
+        parallel = parallel_parser._parse_pdf_bytes(content)
+        
+        # Assert
+        self.assertTrue(serial)
+        self.assertEqual(parallel, serial)
+    
+    @patch('Recruiter.core.resume.pdf_extractor._get_process_pool')
+    def test_parallel_pdf_workers_get_one_file(self, mock_get_process_pool):
+        """Test that in-memory PDFs reach the workers as one temporary file path."""
+        # Arrange
+        source = PdfReader(str(PathManager().get_resume_path()))
+        writer = PdfWriter()
+        for _ in range(6):
+            writer.add_page(source.pages[0])
+        buffer = io.BytesIO()
+        writer.write(buffer)
+        content = buffer.getvalue()
+        serial = extract_pdf_text(content, parallel_threshold=None)
+        paths = []
+        
+        def run_in_process(function, path_list, *args):
+            paths.extend(path_list)
+            return map(function, path_list, *args)
+        
+        mock_get_process_pool.return_value = MagicMock(map=run_in_process)
+        
+        for pdf_input in (memoryview(content), io.BytesIO(content)):
+            with self.subTest(input=type(pdf_input).__name__):
+                paths.clear()
+                
+                # Act
+                result = extract_pdf_text(pdf_input, parallel_threshold=2, max_workers=3)
+                
+                # Assert
+                self.assertEqual(result, serial)
+                self.assertEqual(len(paths), 3)
+                self.assertEqual(len(set(paths)), 1)
+                self.assertIsInstance(paths[0], str)
+                self.assertFalse(os.path.exists(paths[0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
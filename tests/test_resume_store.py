@@ -0,0 +1,95 @@
+"""
+Tests for the resume store.
+
+This module contains tests for storing uploaded resumes on disk.
+"""
+
+import hashlib
+import io
+import os
+import tempfile
+import unittest
+
+from Recruiter.core.resume.resume_store import ResumeStore
+
+
+class TestResumeStore(unittest.TestCase):
+    """Tests for the ResumeStore class."""
+    
+    def setUp(self):
+        """Create a store in a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = ResumeStore(store_dir=self.temp_dir.name, max_entries=2)
+    
+    def tearDown(self):
+        """Remove the temporary files."""
+        self.temp_dir.cleanup()
+    
+    def test_save_file_object(self):
+        """Test that an upload is stored under its content hash."""
+        # Arrange
+        content = b"%PDF-1.4 resume"
+        
+        # Act
+        stored = self.store.save(io.BytesIO(content), "Resume.PDF")
+        
+        # Assert
+        self.assertEqual(stored.content_hash, hashlib.sha256(content).hexdigest())
+        self.assertEqual(os.path.basename(stored.path), f"{stored.content_hash}.pdf")
+        self.assertEqual(stored.filename, "Resume.PDF")
+        with open(stored.path, "rb") as f:
+            self.assertEqual(f.read(), content)
+    
+    def test_identical_uploads_share_a_file(self):
+        """Test that the same content from several sessions is stored once."""
+        # Act
+        first = self.store.save(b"same resume", "a.pdf")
+        second = self.store.save(memoryview(b"same resume"), "b.pdf")
+        
+        # Assert
+        self.assertEqual(first.path, second.path)
+        self.assertEqual(len(os.listdir(self.temp_dir.name)), 1)
+    
+    def test_oldest_uploads_are_evicted(self):
+        """Test that the store keeps at most max_entries files."""
+        # Arrange
+        oldest = self.store.save(b"first", "first.pdf")
+        os.utime(oldest.path, (0, 0))
+        
+        # Act
+        self.store.save(b"second", "second.pdf")
+        self.store.save(b"third", "third.pdf")
+        
+        # Assert
+        self.assertEqual(len(os.listdir(self.temp_dir.name)), 2)
+        self.assertFalse(os.path.exists(oldest.path))
+    
+    def test_lookup_protects_a_used_upload_from_eviction(self):
+        """Test that looking up an upload refreshes it, so eviction goes by last use."""
+        # Arrange
+        used = self.store.save(b"first", "first.pdf")
+        unused = self.store.save(b"second", "second.pdf")
+        os.utime(used.path, (0, 0))
+        os.utime(unused.path, (1, 1))
+        
+        # Act
+        found = self.store.get(used.path)
+        self.store.save(b"third", "third.pdf")
+        
+        # Assert
+        self.assertEqual(found, used.path)
+        self.assertTrue(os.path.exists(used.path))
+        self.assertFalse(os.path.exists(unused.path))
+    
+    def test_lookup_of_evicted_upload(self):
+        """Test that a removed upload is reported as missing."""
+        # Arrange
+        stored = self.store.save(b"resume", "resume.pdf")
+        os.remove(stored.path)
+        
+        # Act / Assert
+        self.assertIsNone(self.store.get(stored.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
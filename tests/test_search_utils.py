@@ -0,0 +1,118 @@
+"""
+Tests for the web search utilities.
+
+This module contains tests for combining several fetched pages into a
+company profile.
+"""
+
+import unittest
+from unittest.mock import patch, MagicMock
+
+from Recruiter.utils.web_search.http_fetcher import HttpFetcher, extract_main_text
+from Recruiter.utils.web_search.search_utils import build_company_profile, get_company_info_bs4
+
+
+class TestBuildCompanyProfile(unittest.TestCase):
+    """Tests for the build_company_profile function."""
+    
+    def test_skips_lines_repeated_across_pages(self):
+        """Test that paragraphs found on an earlier page are left out."""
+        # Arrange
+        pages = [
+            {"url": "https://a.example", "text": "Acme builds rockets.\nFounded in 2002."},
+            {"url": "https://b.example", "text": "ACME builds rockets!\nHeadquartered in Texas."}
+        ]
+        
+        # Act
+        profile = build_company_profile(pages)
+        
+        # Assert
+        self.assertEqual(profile, (
+            "Source: https://a.example\nAcme builds rockets.\nFounded in 2002.\n\n"
+            "Source: https://b.example\nHeadquartered in Texas."
+        ))
+    
+    def test_profile_is_bounded_and_shared_between_pages(self):
+        """Test that the profile fits max_chars and every page gets a share."""
+        # Arrange
+        pages = [
+            {"url": f"https://{name}.example", "text": "\n".join(f"{name} fact {i}" for i in range(100))}
+            for name in ("first", "second", "third")
+        ]
+        
+        # Act
+        profile = build_company_profile(pages, max_chars=600)
+        
+        # Assert
+        self.assertLessEqual(len(profile), 600)
+        for name in ("first", "second", "third"):
+            self.assertIn(f"{name} fact 0", profile)
+
+
+class TestGetCompanyInfoBs4(unittest.TestCase):
+    """Tests for the get_company_info_bs4 function."""
+    
+    @patch('Recruiter.utils.web_search.search_utils.get_http_fetcher')
+    @patch('Recruiter.utils.web_search.search_utils.search', create=True)
+    def test_fetches_all_search_results(self, mock_search, mock_get_fetcher):
+        """Test that every search result is fetched and failed pages are skipped."""
+        # Arrange
+        mock_search.return_value = iter(["https://a.example", "https://b.example", "https://c.example"])
+        fetcher = MagicMock()
+        fetcher.fetch_many.return_value = ["Acme builds rockets.", None, "Headquartered in Texas."]
+        mock_get_fetcher.return_value = fetcher
+        
+        # Act
+        result = get_company_info_bs4("Acme")
+        
+        # Assert
+        fetcher.fetch_many.assert_called_once_with(["https://a.example", "https://b.example", "https://c.example"])
+        self.assertIn("Acme builds rockets.", result)
+        self.assertIn("Headquartered in Texas.", result)
+        self.assertNotIn("b.example", result)
+    
+    @patch('Recruiter.utils.web_search.search_utils.get_http_fetcher')
+    @patch('Recruiter.utils.web_search.search_utils.search', create=True)
+    def test_profile_from_wrapped_pages_survives_a_failing_page(self, mock_search, mock_get_fetcher):
+        """Test that sidebar-wrapped pages give a profile even if another page fails to parse."""
+        # Arrange
+        pages = {
+            "https://a.example": (
+                b'<html><body><div class="layout with-sidebar"><main><p>Acme builds reusable rockets '
+                b'and launches satellites for commercial customers around the world every month, '
+                b'from three launch sites, with a team of over ten thousand engineers and staff '
+                b'working across three continents.</p></main></div></body></html>'
+            ),
+            "https://b.example": b"<p>unparsable</p>"
+        }
+        mock_search.return_value = iter(pages)
+        fetcher = HttpFetcher()
+        fetcher.session = MagicMock()
+        
+        def get(url, **kwargs):
+            response = MagicMock()
+            response.status_code = 200
+            response.headers = {"Content-Type": "text/html"}
+            response.iter_content.return_value = [pages[url]]
+            response.__enter__.return_value = response
+            return response
+        
+        fetcher.session.get.side_effect = get
+        mock_get_fetcher.return_value = fetcher
+        def extract(content, max_chars, encoding):
+            if b"unparsable" in content:
+                raise ValueError("parser error")
+            return extract_main_text(content, max_chars, encoding)
+        
+        # Act
+        with patch('Recruiter.utils.web_search.http_fetcher.extract_main_text', side_effect=extract), \
+                patch('builtins.print'):
+            result = get_company_info_bs4("Acme")
+        
+        # Assert
+        self.assertIn("Acme builds reusable rockets", result)
+        self.assertNotIn("b.example", result)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+"""
+Tests for LLM telemetry.
+
+This module contains tests for call tracking and the metrics sinks.
+"""
+
+import os
+import json
+import tempfile
+import unittest
+from unittest.mock import patch, MagicMock
+
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+
+from Recruiter.models.schemas import LLMCallRecord
+from Recruiter.services.llm.llm_service import LLMService
+from Recruiter.services.llm.telemetry import (
+    CallTracker,
+    InMemoryMetricsAggregator,
+    JsonlMetricsExporter
+)
+
+
+def make_record(component, wall_time, success=True, prompt_tokens=10):
+    """Create a call record for the aggregator."""
+    return LLMCallRecord(
+        component=component,
+        model="gpt-4o-mini",
+        prompt_tokens=prompt_tokens,
+        completion_tokens=5,
+        wall_time=wall_time,
+        success=success,
+        timestamp=0.0
+    )
+
+
+class TestTelemetry(unittest.TestCase):
+    """Tests for call tracking and metrics sinks."""
+    
+    def test_tracker_reads_usage_metadata(self):
+        """Test that token usage is read from the model response."""
+        # Arrange
+        tracker = CallTracker("email", "gpt-4o-mini")
+        message = AIMessage(
+            content="hello",
+            usage_metadata={
+                "input_tokens": 1200,
+                "output_tokens": 30,
+                "total_tokens": 1230,
+                "input_token_details": {"cache_read": 1024}
+            }
+        )
+        response = LLMResult(generations=[[ChatGeneration(message=message)]])
+        
+        # Act
+        tracker.on_llm_end(response)
+        record = tracker.to_record()
+        
+        # Assert
+        self.assertEqual(record.component, "email")
+        self.assertEqual(record.prompt_tokens, 1200)
+        self.assertEqual(record.completion_tokens, 30)
+        self.assertEqual(record.cached_prompt_tokens, 1024)
+        self.assertTrue(record.success)
+    
+    def test_tracker_records_answering_model(self):
+        """Test that the model reported in the response replaces the requested one."""
+        # Arrange
+        tracker = CallTracker("email", "gpt-4o")
+        message = AIMessage(content="hello", response_metadata={"model_name": "gpt-4o-mini-2024-07-18"})
+        response = LLMResult(generations=[[ChatGeneration(message=message)]])
+        
+        # Act
+        tracker.on_llm_end(response)
+        record = tracker.to_record()
+        
+        # Assert
+        self.assertEqual(record.model, "gpt-4o-mini-2024-07-18")
+    
+    def test_aggregator_summary(self):
+        """Test that records are aggregated by component and model."""
+        # Arrange
+        aggregator = InMemoryMetricsAggregator()
+        aggregator.record(make_record("email", 1.0))
+        aggregator.record(make_record("email", 3.0, success=False, prompt_tokens=None))
+        aggregator.record(make_record("extraction", 0.5))
+        
+        # Act
+        summary = aggregator.summary()
+        
+        # Assert
+        email = summary["email/gpt-4o-mini"]
+        self.assertEqual(email["calls"], 2)
+        self.assertEqual(email["errors"], 1)
+        self.assertEqual(email["prompt_tokens"], 10)
+        self.assertEqual(email["avg_wall_time"], 2.0)
+        self.assertEqual(email["max_wall_time"], 3.0)
+        self.assertEqual(summary["extraction/gpt-4o-mini"]["calls"], 1)
+    
+    def test_jsonl_exporter_appends_records(self):
+        """Test that the exporter writes one JSON line per record."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Arrange
+            file_path = os.path.join(temp_dir, "telemetry", "calls.jsonl")
+            exporter = JsonlMetricsExporter(file_path)
+            
+            # Act
+            exporter.record(make_record("email", 1.0))
+            exporter.record(make_record("cover_letter", 2.0))
+            
+            # Assert
+            with open(file_path, 'r', encoding='utf-8') as f:
+                lines = [json.loads(line) for line in f]
+            self.assertEqual([line["component"] for line in lines], ["email", "cover_letter"])
+    
+    @patch('Recruiter.services.llm.llm_service.get_chat_model')
+    def test_llm_service_records_failed_calls(self, mock_get_chat_model):
+        """Test that LLMService records telemetry for failed calls."""
+        # Arrange
+        mock_llm = MagicMock()
+        mock_llm.invoke.side_effect = ValueError("bad request")
+        mock_get_chat_model.return_value = mock_llm
+        aggregator = InMemoryMetricsAggregator()
+        llm_service = LLMService(api_key="test_api_key", component="research", metrics_sink=aggregator)
+        
+        # Act
+        with self.assertRaises(ValueError):
+            llm_service.generate_text("Research Acme")
+        
+        # Assert
+        records = aggregator.records()
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].component, "research")
+        self.assertFalse(records[0].success)
+        self.assertEqual(records[0].error, "bad request")
+
+
+if __name__ == '__main__':
+    unittest.main()